@@ -3,21 +3,34 @@
 """
 中文 PDF 生成脚本 - 使用 ReportLab Platypus API
 支持自定义字体、布局、表格和多种样式
+
+字体通过 font_manager.FontManager 注册：解析结果按字体文件哈希缓存，
+批量生成时所有文档共用一次注册，嵌入PDF的只是用到的字形子集。
+
+用法:
+    python create_chinese_pdf.py                 # 生成 chinese_document.pdf
+    python create_chinese_pdf.py --count 20      # 批量生成 20 份，共用字体注册
 """
 
+import argparse
 import os
+import sys
+import time
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
     PageBreak, KeepTogether
 )
 from reportlab.lib import colors
 
+from font_manager import FontManager
+
+# 默认字体管理器，同一进程内多次注册会直接跳过
+_font_manager = None
+
 
 # 字体路径配置
 def get_font_path():
@@ -32,8 +45,17 @@ def get_font_path():
     return '.'
 
 
-def register_fonts():
-    """注册中文字体"""
+def get_font_manager():
+    """获取进程内共用的字体管理器"""
+    global _font_manager
+    if _font_manager is None:
+        _font_manager = FontManager()
+    return _font_manager
+
+
+def register_fonts(fonts=None):
+    """注册中文字体（已注册的字体直接跳过，解析结果从缓存加载）"""
+    fonts = fonts or get_font_manager()
     fonts_path = get_font_path()
     
     # Windows 字体注册
@@ -56,8 +78,7 @@ def register_fonts():
         font_path = os.path.join(fonts_path, font_file)
         if os.path.exists(font_path):
             try:
-                pdfmetrics.registerFont(TTFont(font_name, font_path))
-                print(f"✓ 已注册字体: {font_name}")
+                fonts.register(font_name, font_path)
             except Exception as e:
                 print(f"✗ 注册字体失败 {font_name}: {e}")
         else:
@@ -137,16 +158,19 @@ def create_custom_styles():
     return styles
 
 
-def create_chinese_pdf(output_path='chinese_document.pdf'):
+def create_chinese_pdf(output_path='chinese_document.pdf', fonts=None, register=True):
     """
     创建中文 PDF 文档
     
     Args:
         output_path: 输出 PDF 文件路径
+        fonts: 字体管理器，批量生成时传入同一个以共用注册
+        register: 是否注册字体（批量生成时已统一注册，传 False）
     """
     # 注册中文字体
-    print("正在注册中文字体...")
-    register_fonts()
+    if register:
+        print("正在注册中文字体...")
+        register_fonts(fonts)
     
     # 创建 PDF 文档
     doc = SimpleDocTemplate(
@@ -329,10 +353,31 @@ def create_chinese_pdf(output_path='chinese_document.pdf'):
     print(f"✓ PDF 生成成功: {output_path}")
 
 
+def create_chinese_pdfs(output_paths, fonts=None):
+    """批量创建中文 PDF 文档，所有文档共用一次字体注册"""
+    fonts = fonts or get_font_manager()
+    start = time.perf_counter()
+    register_fonts(fonts)
+    print(f"字体注册耗时 {time.perf_counter() - start:.2f}s "
+          f"（缓存命中 {fonts.stats['cache_hits']}，解析 {fonts.stats['parsed']}）")
+    for output_path in output_paths:
+        create_chinese_pdf(output_path, fonts, register=False)
+    print(f"✓ 共生成 {len(output_paths)} 份 PDF，总耗时 {time.perf_counter() - start:.2f}s")
+
+
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description='生成中文 PDF 文档')
+    parser.add_argument('--count', type=int, default=1, help='批量生成的份数（默认: 1）')
+    parser.add_argument('--output-dir', default=os.path.dirname(os.path.abspath(__file__)), help='输出目录')
+    args = parser.parse_args()
+
     try:
-        output_file = os.path.join(os.path.dirname(__file__), 'chinese_document.pdf')
+        if args.count > 1:
+            outputs = [os.path.join(args.output_dir, f'chinese_document_{i + 1}.pdf') for i in range(args.count)]
+            create_chinese_pdfs(outputs)
+            return
+        output_file = os.path.join(args.output_dir, 'chinese_document.pdf')
         create_chinese_pdf(output_file)
         print(f"\n文档已保存到: {output_file}")
     except Exception as e:
@@ -4,8 +4,17 @@
 - 项目概览: 显示关键指标和统计信息
 - 任务列表: 详细的项目任务跟踪
 - 团队信息: 团队成员和工作分配
+
+大数据量（如十万行任务）时使用 --streaming，通过 workbook_builder 以只写模式
+流式生成项目概览和任务列表:
+    python create_project_tracker.py --rows 100000 --streaming
+    python create_project_tracker.py --benchmark 1000 100000
 """
 
+import argparse
+import os
+import tempfile
+import time
 from datetime import datetime, timedelta
 import openpyxl
 from openpyxl.styles import (
@@ -15,6 +24,47 @@ from openpyxl.styles import (
 from openpyxl.utils import get_column_letter
 from openpyxl.formatting.rule import ColorScaleRule, DataBarRule, IconSetRule
 
+from workbook_builder import StreamingWorkbook, StyleRegistry, style_report
+
+# 状态 -> (填充色, 字体色)
+STATUS_COLORS = {
+    '已完成': ('C6EFCE', '006100'),
+    '进行中': ('FFEB9C', '9C5700'),
+    '未开始': ('E2EFDA', '1B5E20'),
+    '已延期': ('FFC7CE', '9C0006'),
+}
+# 优先级 -> 字体色
+PRIORITY_COLORS = {'高': 'C00000', '中': 'ED7D31', '低': '00B050'}
+TASK_HEADERS = ['ID', '任务名称', '负责人', '开始日期', '结束日期', '进度(%)', '优先级', '状态', '备注']
+
+# 跟踪表样式（声明式描述，由 StyleRegistry 注册为命名样式，每种只创建一次）
+BODY_FONT = {'name': '微软雅黑', 'size': 10}
+CENTER = {'horizontal': 'center', 'vertical': 'center'}
+TRACKER_STYLES = {
+    'tracker_title': {'font': {'name': '微软雅黑', 'size': 16, 'bold': True, 'color': '1F4E78'}, 'alignment': CENTER},
+    'tracker_header': {'font': {'name': '微软雅黑', 'size': 12, 'bold': True, 'color': 'FFFFFF'}, 'fill': '4472C4',
+                       'alignment': dict(CENTER, wrap_text=True), 'border': 'thin'},
+    'tracker_subheader': {'font': {'name': '微软雅黑', 'size': 11, 'bold': True, 'color': 'FFFFFF'}, 'fill': '5B9BD5',
+                          'alignment': dict(CENTER, wrap_text=True), 'border': 'thin'},
+    'tracker_cell': {'font': BODY_FONT, 'alignment': CENTER, 'border': 'thin'},
+    'tracker_cell_bold': {'font': dict(BODY_FONT, bold=True), 'border': 'thin'},
+    'tracker_cell_left': {'font': BODY_FONT, 'alignment': {'horizontal': 'left', 'vertical': 'center', 'wrap_text': True},
+                          'border': 'thin'},
+    'tracker_date': {'font': BODY_FONT, 'alignment': CENTER, 'border': 'thin', 'number_format': 'YYYY-MM-DD'},
+    'tracker_percent': {'font': BODY_FONT, 'alignment': CENTER, 'border': 'thin', 'number_format': '0%'},
+}
+for _status, (_fill, _color) in STATUS_COLORS.items():
+    TRACKER_STYLES[f'tracker_status_{_status}'] = {
+        'font': dict(BODY_FONT, bold=True, color=_color), 'fill': _fill, 'alignment': CENTER, 'border': 'thin'}
+for _priority, _color in PRIORITY_COLORS.items():
+    TRACKER_STYLES[f'tracker_priority_{_priority}'] = {
+        'font': dict(BODY_FONT, bold=True, color=_color), 'alignment': CENTER, 'border': 'thin'}
+# 任务列表各列的默认样式
+TASK_COLUMN_STYLES = [
+    'tracker_cell', 'tracker_cell_left', 'tracker_cell', 'tracker_date', 'tracker_date',
+    'tracker_percent', 'tracker_cell', 'tracker_cell', 'tracker_cell_left'
+]
+
 
 def create_header_style():
     """创建标题样式"""
@@ -169,9 +219,12 @@ def create_project_overview_sheet(wb):
     ws.freeze_panes = 'A12'
 
 
-def create_tasks_sheet(wb):
-    """创建任务列表工作表"""
+def create_tasks_sheet(wb, tasks=None, styles=None):
+    """创建任务列表工作表（tasks 为空时使用示例数据）"""
     ws = wb.create_sheet('任务列表')
+    if styles is None:
+        styles = StyleRegistry(wb)
+    styles.register_all(TRACKER_STYLES)
 
     # 设置列宽
     ws.column_dimensions['A'].width = 8
@@ -184,28 +237,19 @@ def create_tasks_sheet(wb):
     ws.column_dimensions['H'].width = 12
     ws.column_dimensions['I'].width = 30
 
-    # 获取样式
-    header_font, header_fill, header_alignment = create_header_style()
-    border = create_thin_border()
-
     # 标题
     ws['A1'] = '📋 任务跟踪表'
     ws.merge_cells('A1:I1')
-    ws['A1'].font = Font(name='微软雅黑', size=16, bold=True, color='1F4E78')
-    ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
+    styles.apply_cell(ws['A1'], 'tracker_title')
 
     # 表头
-    headers = ['ID', '任务名称', '负责人', '开始日期', '结束日期', '进度(%)', '优先级', '状态', '备注']
-    for idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=2, column=idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = border
+    for idx, header in enumerate(TASK_HEADERS, 1):
+        ws.cell(row=2, column=idx, value=header)
+    styles.apply(ws, 'A2:I2', 'tracker_header')
 
     # 示例数据
     base_date = datetime(2026, 1, 1)
-    tasks = [
+    sample_tasks = [
         ['T01', '需求分析与规划', '张三', base_date.strftime('%Y-%m-%d'), (base_date + timedelta(days=14)).strftime('%Y-%m-%d'), 100, '高', '已完成', '需求文档已确认'],
         ['T02', '系统架构设计', '李四', (base_date + timedelta(days=15)).strftime('%Y-%m-%d'), (base_date + timedelta(days=30)).strftime('%Y-%m-%d'), 100, '高', '已完成', '架构评审通过'],
         ['T03', '数据库设计', '王五', (base_date + timedelta(days=16)).strftime('%Y-%m-%d'), (base_date + timedelta(days=35)).strftime('%Y-%m-%d'), 100, '高', '已完成', '数据库建模完成'],
@@ -231,59 +275,19 @@ def create_tasks_sheet(wb):
         ['T23', '短信通知', '周二十五', (base_date + timedelta(days=65)).strftime('%Y-%m-%d'), (base_date + timedelta(days=80)).strftime('%Y-%m-%d'), 0, '低', '未开始', '等待审批'],
         ['T24', '项目验收', '张三', (base_date + timedelta(days=85)).strftime('%Y-%m-%d'), (base_date + timedelta(days=90)).strftime('%Y-%m-%d'), 0, '高', '未开始', '准备验收材料'],
     ]
+    if tasks is None:
+        tasks = sample_tasks
 
-    # 填充数据
+    # 填充数据（样式按名称引用，状态和优先级按值选用对应样式）
     for row_idx, task in enumerate(tasks, 3):
         for col_idx, value in enumerate(task, 1):
             cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.border = border
-            cell.font = Font(name='微软雅黑', size=10)
-
-            # 根据状态设置颜色
-            if col_idx == 8:  # 状态列
-                status = str(value)
-                if status == '已完成':
-                    cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                    cell.font = Font(name='微软雅黑', size=10, bold=True, color='006100')
-                elif status == '进行中':
-                    cell.fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-                    cell.font = Font(name='微软雅黑', size=10, bold=True, color='9C5700')
-                elif status == '未开始':
-                    cell.fill = PatternFill(start_color='E2EFDA', end_color='E2EFDA', fill_type='solid')
-                    cell.font = Font(name='微软雅黑', size=10, bold=True, color='1B5E20')
-                elif status == '已延期':
-                    cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-                    cell.font = Font(name='微软雅黑', size=10, bold=True, color='9C0006')
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # 优先级颜色
-            elif col_idx == 7:  # 优先级列
-                priority = str(value)
-                if priority == '高':
-                    cell.font = Font(name='微软雅黑', size=10, bold=True, color='C00000')
-                elif priority == '中':
-                    cell.font = Font(name='微软雅黑', size=10, bold=True, color='ED7D31')
-                elif priority == '低':
-                    cell.font = Font(name='微软雅黑', size=10, bold=True, color='00B050')
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # 进度列格式
-            elif col_idx == 6:  # 进度列
-                if isinstance(value, (int, float)):
-                    cell.number_format = '0%'
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # 日期格式
-            elif col_idx in [4, 5]:  # 开始日期和结束日期
-                cell.number_format = 'YYYY-MM-DD'
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # 其他列
-            else:
-                if col_idx not in [2, 9]:  # 不是任务名称和备注列
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                else:
-                    cell.alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
+            style = TASK_COLUMN_STYLES[col_idx - 1]
+            if col_idx == 8 and value in STATUS_COLORS:
+                style = f'tracker_status_{value}'
+            elif col_idx == 7 and value in PRIORITY_COLORS:
+                style = f'tracker_priority_{value}'
+            styles.apply_cell(cell, style)
 
     # 设置行高
     ws.row_dimensions[1].height = 30
@@ -537,8 +541,125 @@ def create_progress_summary_sheet(wb):
     ws.freeze_panes = 'A5'
 
 
+def generate_tasks(count):
+    """逐行生成指定数量的示例任务（用于大数据量生成和性能测试）"""
+    base_date = datetime(2026, 1, 1)
+    owners = ['张三', '李四', '王五', '赵六', '钱七', '孙八', '周九', '吴十']
+    statuses = list(STATUS_COLORS)
+    priorities = list(PRIORITY_COLORS)
+    for i in range(count):
+        start = base_date + timedelta(days=i % 180)
+        status = statuses[i % len(statuses)]
+        progress = 100 if status == '已完成' else (i * 7) % 100 if status == '进行中' else 0
+        yield [
+            f'T{i + 1:06d}', f'任务{i + 1}', owners[i % len(owners)],
+            start.strftime('%Y-%m-%d'), (start + timedelta(days=14)).strftime('%Y-%m-%d'),
+            progress, priorities[i % len(priorities)], status, ''
+        ]
+
+
+def register_tracker_styles(book):
+    """在流式工作簿中注册跟踪表用到的命名样式（每种样式只创建一次）"""
+    book.styles.register_all(TRACKER_STYLES)
+
+
+def write_overview_sheet_streaming(book, task_count):
+    """流式写出项目概览：关键指标公式覆盖全部任务行"""
+    ws = book.add_sheet('项目概览', widths={'A': 25, 'B': 20}, merges=['A1:B1'], heights={1: 30})
+    last_row = task_count + 2
+    book.append_row(ws, ['📊 项目进度跟踪系统'], style='tracker_title')
+    book.append_row(ws, [])
+    book.append_row(ws, ['指标', '数值'], style='tracker_subheader')
+
+    status_range = f'任务列表!H3:H{last_row}'
+    metrics = [['总任务数', f'=COUNTA(任务列表!A3:A{last_row})']]
+    metrics += [[status, f'=COUNTIF({status_range},"{status}")'] for status in STATUS_COLORS]
+    metrics.append(['总体进度', f'=AVERAGE(任务列表!F3:F{last_row})'])
+    metrics += [[f'{p}优先级', f'=COUNTIF(任务列表!G3:G{last_row},"{p}")'] for p in PRIORITY_COLORS]
+    book.append_rows(ws, metrics, column_styles=['tracker_cell_bold', 'tracker_cell'])
+
+
+def write_tasks_sheet_streaming(book, tasks, task_count):
+    """流式写出任务列表；状态和优先级颜色用整列条件格式代替逐单元格着色"""
+    ws = book.add_sheet(
+        '任务列表',
+        widths={'A': 10, 'B': 25, 'C': 12, 'D': 12, 'E': 12, 'F': 10, 'G': 10, 'H': 12, 'I': 30},
+        freeze_panes='A3', merges=['A1:I1'], heights={1: 30, 2: 25}
+    )
+    last_row = task_count + 2
+    book.highlight_values(ws, f'G3:G{last_row}', {p: (None, color) for p, color in PRIORITY_COLORS.items()})
+    book.highlight_values(ws, f'H3:H{last_row}', STATUS_COLORS)
+
+    book.append_row(ws, ['📋 任务跟踪表'], style='tracker_title')
+    book.append_row(ws, TASK_HEADERS, style='tracker_header')
+    book.append_rows(ws, tasks, column_styles=TASK_COLUMN_STYLES)
+
+
+def create_tracker_streaming(task_count, output_file):
+    """以只写模式生成大数据量跟踪表（项目概览 + 任务列表）"""
+    book = StreamingWorkbook()
+    register_tracker_styles(book)
+    write_overview_sheet_streaming(book, task_count)
+    write_tasks_sheet_streaming(book, generate_tasks(task_count), task_count)
+    book.save(output_file)
+    return book
+
+
+def run_benchmark(row_counts):
+    """对比逐单元格生成和流式生成任务列表的耗时与文件大小"""
+    print(f"{'行数':>8} {'逐单元格(s)':>12} {'流式(s)':>10} {'加速':>6} {'逐单元格(KB)':>14} {'流式(KB)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in row_counts:
+            legacy_path = os.path.join(tmp, f'legacy_{count}.xlsx')
+            start = time.perf_counter()
+            wb = openpyxl.Workbook()
+            create_tasks_sheet(wb, list(generate_tasks(count)))
+            wb.save(legacy_path)
+            legacy_seconds = time.perf_counter() - start
+
+            streaming_path = os.path.join(tmp, f'streaming_{count}.xlsx')
+            start = time.perf_counter()
+            book = StreamingWorkbook()
+            register_tracker_styles(book)
+            write_tasks_sheet_streaming(book, generate_tasks(count), count)
+            book.save(streaming_path)
+            streaming_seconds = time.perf_counter() - start
+
+            print(f"{count:>8} {legacy_seconds:>12.2f} {streaming_seconds:>10.2f} "
+                  f"{legacy_seconds / streaming_seconds:>5.1f}x "
+                  f"{os.path.getsize(legacy_path) / 1024:>14.0f} {os.path.getsize(streaming_path) / 1024:>10.0f}")
+
+
+def print_style_report(wb):
+    """输出工作簿中不重复的样式数量"""
+    report = style_report(wb)
+    print("[INFO] 样式表: 单元格样式 {cell_styles} 个（命名样式 {named_styles} 个），字体 {fonts}，"
+          "填充 {fills}，边框 {borders}，对齐 {alignments}".format(**report))
+
+
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description='创建项目进度跟踪电子表格')
+    parser.add_argument('--rows', type=int, help='生成指定数量的示例任务（默认使用24条示例数据）')
+    parser.add_argument('--streaming', action='store_true', help='以只写模式流式生成（项目概览 + 任务列表）')
+    parser.add_argument('--output', default='项目进度跟踪表.xlsx', help='输出文件')
+    parser.add_argument('--benchmark', type=int, nargs='+', metavar='ROWS', help='对比两种生成方式，如 --benchmark 1000 100000')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    output_file = args.output
+    if args.streaming:
+        task_count = args.rows or 24
+        print(f"正在流式生成项目进度跟踪电子表格（{task_count} 条任务）...")
+        start = time.perf_counter()
+        book = create_tracker_streaming(task_count, output_file)
+        print("[OK] 电子表格已成功创建: {}（{:.2f}s）".format(output_file, time.perf_counter() - start))
+        print_style_report(book.wb)
+        return
+
     print("正在创建项目进度跟踪电子表格...")
 
     # 创建工作簿
@@ -546,15 +667,15 @@ def main():
 
     # 创建各个工作表
     create_project_overview_sheet(wb)
-    create_tasks_sheet(wb)
+    create_tasks_sheet(wb, list(generate_tasks(args.rows)) if args.rows else None)
     create_team_sheet(wb)
     create_progress_summary_sheet(wb)
 
     # 保存文件
-    output_file = '项目进度跟踪表.xlsx'
     wb.save(output_file)
 
     print("[OK] 电子表格已成功创建: {}".format(output_file))
+    print_style_report(wb)
     print("\n[INFO] 包含以下工作表:")
     print("  1. 项目概览 - 显示关键指标和项目信息")
     print("  2. 任务列表 - 详细的任务跟踪和进度管理")
@@ -0,0 +1,162 @@
+"""中文字体管理
+
+create_chinese_pdf.py 每次运行都用 TTFont 完整解析 10~20MB 的中文TrueType字体，
+篇幅较短的文档大部分时间都花在这一步。FontManager 负责:
+
+- 把解析好的字体（字符映射、字形宽度等）按字体文件的 SHA-256 缓存为 pickle，
+  再次运行时直接加载，不再解析字体文件
+- 同一进程内每个字体只注册一次，批量生成多份文档时共用同一次注册
+- 嵌入 PDF 的字体始终是子集：TTFont 只把文档实际用到的字形写入 PDF，
+  不会嵌入整个字体文件
+
+缓存位于 .font-cache/（可删除，会自动重建），文件名包含 ReportLab 版本号，
+升级 ReportLab 后自动失效。字体文件的哈希按大小和修改时间缓存，文件不变时不重新计算。
+
+用法:
+    fonts = FontManager()
+    fonts.register('SimSun', r'C:\\Windows\\Fonts\\simsun.ttc')
+    fonts.register('SimSun', r'C:\\Windows\\Fonts\\simsun.ttc')  # 已注册，直接跳过
+    print(fonts.stats)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+import reportlab
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace
+
+REPO_ROOT = Path(__file__).resolve().parent
+CACHE_DIR = REPO_ROOT / '.font-cache'
+INDEX_FILE = 'index.json'
+HASH_CHUNK_SIZE = 1 << 20
+# 不能持久化的属性，加载时重新创建：TTFont.state 与具体文档相关，
+# TTFontFace._pdfScale 是由 unitsPerEm 生成的闭包
+TRANSIENT_FONT_ATTRS = ('state', 'face')
+TRANSIENT_FACE_ATTRS = ('_pdfScale',)
+
+
+def pdf_scale(units_per_em):
+    """字体单位到PDF千分单位的换算（与 TTFontFile.extractInfo 一致）"""
+    if units_per_em == 1000:
+        return lambda x: x
+    factor = 1000 / units_per_em
+    return lambda x: x * factor
+
+
+def dump_font(font):
+    """把解析好的 TTFont 转换为可 pickle 的字典"""
+    return {
+        'font': {k: v for k, v in font.__dict__.items() if k not in TRANSIENT_FONT_ATTRS},
+        'face': {k: v for k, v in font.face.__dict__.items() if k not in TRANSIENT_FACE_ATTRS},
+    }
+
+
+def restore_font(name, state):
+    """由 dump_font 的结果重建 TTFont，不再解析字体文件"""
+    face = TTFontFace.__new__(TTFontFace)
+    face.__dict__.update(state['face'])
+    face._pdfScale = pdf_scale(face.unitsPerEm)
+    font = TTFont.__new__(TTFont)
+    font.__dict__.update(state['font'])
+    font.fontName = name
+    font.face = face
+    font.state = WeakKeyDictionary()
+    return font
+
+
+def file_digest(path):
+    """计算文件的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FontManager:
+    """带持久化解析缓存的字体注册器"""
+
+    def __init__(self, cache_dir=CACHE_DIR, verbose=True):
+        self.cache_dir = Path(cache_dir)
+        self.verbose = verbose
+        self.stats = {'registered': 0, 'skipped': 0, 'cache_hits': 0, 'parsed': 0}
+        self._index = None
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                self._index = json.loads((self.cache_dir / INDEX_FILE).read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _write_atomic(self, path, data):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def font_digest(self, path):
+        """字体文件的哈希；大小和修改时间不变时使用缓存的结果"""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        index = self._load_index()
+        entry = index.get(path)
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            return entry['sha256']
+        digest = file_digest(path)
+        index[path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': digest}
+        self._write_atomic(self.cache_dir / INDEX_FILE,
+                           json.dumps(index, ensure_ascii=False, indent=1).encode('utf-8'))
+        return digest
+
+    def cache_path(self, digest, subfont_index=0):
+        return self.cache_dir / f'{digest}-{subfont_index}-rl{reportlab.Version}.pickle'
+
+    def load_font(self, name, path, subfont_index=0):
+        """返回 TTFont：优先从缓存加载，缓存不存在或损坏时解析字体文件并写入缓存"""
+        cache_file = self.cache_path(self.font_digest(path), subfont_index)
+        try:
+            with open(cache_file, 'rb') as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            state = None
+        except Exception:
+            # 缓存损坏或与当前 ReportLab 不兼容时重新解析
+            state = None
+
+        if state is not None:
+            self.stats['cache_hits'] += 1
+            return restore_font(name, state)
+
+        font = TTFont(name, path, subfontIndex=subfont_index)
+        self._write_atomic(cache_file, pickle.dumps(dump_font(font), protocol=pickle.HIGHEST_PROTOCOL))
+        self.stats['parsed'] += 1
+        return font
+
+    def register(self, name, path, subfont_index=0):
+        """
+        注册字体；同一进程中已注册的字体名直接跳过
+
+        Returns:
+            True 表示本次新注册，False 表示已注册过
+        """
+        if name in pdfmetrics.getRegisteredFontNames():
+            self.stats['skipped'] += 1
+            return False
+        pdfmetrics.registerFont(self.load_font(name, path, subfont_index))
+        self.stats['registered'] += 1
+        if self.verbose:
+            print(f"✓ 已注册字体: {name}")
+        return True
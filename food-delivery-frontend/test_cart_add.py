@@ -3,8 +3,8 @@
 测试目标：验证购物车的添加商品功能是否正常工作
 """
 
-from playwright.sync_api import sync_playwright, Page
-import time
+from playwright.sync_api import sync_playwright, Page, expect
+import re
 import sys
 
 def test_add_to_cart():
@@ -50,7 +50,8 @@ def test_add_to_cart():
             # 5. 验证购物车图标上的数量更新
             print("步骤5: 验证购物车数量更新")
             cart_badge = page.locator('.cart-count')
-            time.sleep(1)  # 等待状态更新
+            # 等待购物车数量变为非零（DOM更新即返回，不再固定等待1秒）
+            expect(cart_badge).to_have_text(re.compile(r'[1-9]'), timeout=5000)
             
             cart_count = cart_badge.text_content()
             print(f"购物车数量: {cart_count}")
@@ -4,6 +4,91 @@ let currentCategory = localStorage.getItem('skillCategory') || 'all';
 let currentLanguage = localStorage.getItem('skillLanguage') || 'en';
 let currentTheme = localStorage.getItem('skillTheme') || 'dark';
 
+// Catalog state (generated by build_catalog.py)
+let skillsData = [];
+let categoryEmojis = {};
+let catalogIndex = null;
+const shardCache = {};
+let searchIndex = null;
+let searchResultIds = null;
+let searchRequest = 0;
+
+// Load the compact skill index (card fields only)
+async function loadCatalog() {
+    const response = await fetch('catalog/index.json');
+    if (!response.ok) {
+        throw new Error(`Failed to load catalog: ${response.status}`);
+    }
+    catalogIndex = await response.json();
+    skillsData = catalogIndex.skills;
+    categoryEmojis = catalogIndex.categoryEmojis || {};
+}
+
+// Load a category shard once and merge source URL and resources into its skills
+async function loadSkillDetails(skill) {
+    const shardUrl = catalogIndex.shards[skill.category];
+    if (!shardUrl) return skill;
+    if (!shardCache[skill.category]) {
+        shardCache[skill.category] = fetch(shardUrl).then(response => response.json());
+    }
+    const details = await shardCache[skill.category];
+    return Object.assign(skill, details[skill.id]);
+}
+
+// Open the modal once the skill's details are loaded
+async function openSkill(skillId) {
+    const skill = skillsData.find(s => s.id === skillId);
+    if (!skill) return;
+    openModal(await loadSkillDetails(skill));
+}
+
+// Split text the same way build_catalog.py does (lowercase words and single CJK characters)
+function tokenize(text) {
+    return text.toLowerCase().match(/[a-z0-9]+|[\u4e00-\u9fff]/g) || [];
+}
+
+// Find the first term >= token in the sorted term list
+function lowerBound(terms, token) {
+    let lo = 0;
+    let hi = terms.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (terms[mid][0] < token) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+
+// Search the inverted index: every query word must prefix-match a term of the skill
+async function searchSkills(query) {
+    if (!searchIndex) {
+        const response = await fetch(catalogIndex.search);
+        searchIndex = await response.json();
+    }
+    let matches = null;
+    for (const token of new Set(tokenize(query))) {
+        const positions = new Set();
+        for (let i = lowerBound(searchIndex, token); i < searchIndex.length && searchIndex[i][0].startsWith(token); i++) {
+            searchIndex[i][1].forEach(position => positions.add(position));
+        }
+        matches = matches === null ? positions : new Set([...matches].filter(position => positions.has(position)));
+    }
+    return matches === null ? null : new Set([...matches].map(position => skillsData[position].id));
+}
+
+// Re-render the current category filtered by the search box
+async function onSearchInput(event) {
+    const request = ++searchRequest;
+    const query = event.target.value.trim();
+    const results = query ? await searchSkills(query) : null;
+    if (request !== searchRequest) return;
+    searchResultIds = results;
+    renderSkills(currentCategory, localStorage.getItem('skillSubcategory'));
+}
+
 // Get unique categories (sorted by count descending)
 function getCategories() {
     // Get categories that have skills
@@ -105,6 +190,9 @@ function updateLanguage() {
     // Update language button text
     document.getElementById('langText').textContent = currentLanguage.toUpperCase();
     
+    // Update search placeholder
+    document.getElementById('searchInput').placeholder = t('searchPlaceholder');
+
     // Update My Favorites button
     const favoritesBtn = document.querySelector('[data-category="favorites"]');
     if (favoritesBtn) {
@@ -265,6 +353,10 @@ function renderSkills(category, subCategory = null) {
         headerSubtitle.textContent = `${count.toLocaleString()}${t('categorySubtitle').replace('{category}', translatedCategory).replace('{count}', filteredSkills.length)}`;
     }
 
+    if (searchResultIds) {
+        filteredSkills = filteredSkills.filter(skill => searchResultIds.has(skill.id));
+    }
+
     if (filteredSkills.length === 0) {
         skillsGrid.innerHTML = `
             <div class="empty-state" style="grid-column: 1 / -1;">
@@ -279,7 +371,7 @@ function renderSkills(category, subCategory = null) {
     skillsGrid.innerHTML = filteredSkills.map(skill => {
         const isFavorited = favorites.includes(skill.id);
         return `
-            <div class="skill-card" style="--card-gradient: ${skill.gradient}" data-skill-id="${skill.id}" onclick="openModal(skillsData.find(s => s.id === '${skill.id}'))">
+            <div class="skill-card" style="--card-gradient: ${skill.gradient}" data-skill-id="${skill.id}" onclick="openSkill('${skill.id}')">
                 <div class="skill-icon">${skill.icon}</div>
                 <h3 class="skill-name">${getSkillTranslation(skill, 'name')}</h3>
                 <p class="skill-description">${getSkillTranslation(skill, 'description')}</p>
@@ -419,8 +511,13 @@ function showToast(message) {
 }
 
 // Initialize
-function init() {
+async function init() {
     applyTheme();
+    try {
+        await loadCatalog();
+    } catch (err) {
+        console.error(err);
+    }
     updateLanguage();
     renderCategories();
     renderCommunityCategories();
@@ -451,6 +548,8 @@ function init() {
             renderSkills(category, subCategory);
         }
     });
+
+    document.getElementById('searchInput').addEventListener('input', onSearchInput);
 }
 
 // Start the app
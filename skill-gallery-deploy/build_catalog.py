@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""生成技能画廊的目录文件
+
+读取 gallery.json（手工维护的展示信息：id、图标、渐变色、分类），
+结合各技能目录中的SKILL.md frontmatter和实际文件，生成：
+
+- catalog/index.json: 画廊启动时加载的精简索引（卡片所需字段）
+- catalog/search.json: 预先计算的倒排搜索索引（词 -> 技能序号）
+- catalog/shards/<分类>.json: 按分类拆分的详情（源文件地址、资源列表、frontmatter），打开详情时按需加载
+
+名称、描述和资源列表默认取自frontmatter和目录中的文件；只有需要不同于此的展示文案
+或精选资源列表时，才在gallery.json条目中写 name/description/resources 覆盖。
+
+只有gallery.json条目或技能文件发生变化的技能才会重新读取，内容未变的输出文件不会重写。
+
+用法:
+    python build_catalog.py [--force] [--check]
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+GALLERY_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(GALLERY_DIR / 'skills' / 'Anthropic' / 'skill-creator-SKILL' / 'scripts'))
+from quick_validate import check_frontmatter, parse_frontmatter, read_frontmatter_bytes  # noqa: E402
+
+GALLERY_FILE = GALLERY_DIR / 'gallery.json'
+CATALOG_DIR = GALLERY_DIR / 'catalog'
+CACHE_FILE = GALLERY_DIR / '.catalog-cache.json'
+
+# 修改输出格式时递增，使缓存失效
+CATALOG_VERSION = 1
+
+# 未列出资源时，从目录自动收集资源文件所忽略的内容
+IGNORED_NAMES = {'__pycache__', 'node_modules', '.DS_Store'}
+IGNORED_SUFFIXES = {'.zip', '.skill', '.pyc'}
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+|[一-鿿]')
+# 过短或过于常见、对搜索没有区分度的词
+STOP_WORDS = {'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it',
+              'of', 'on', 'or', 'that', 'the', 'this', 'to', 'with', 'md', 'skill'}
+
+
+def compact_json(data):
+    """不带多余空白的JSON文本"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=False)
+
+
+def write_if_changed(path, text):
+    """内容不同时才写入文件，返回是否写入"""
+    data = text.encode('utf-8')
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return True
+
+
+def tokenize(text):
+    """小写英文/数字词和单个汉字"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def display_name(skill_name):
+    """frontmatter中的技能名转换为卡片标题，如 'theme-factory' -> 'Theme Factory'"""
+    return ' '.join(word.capitalize() for word in skill_name.split('-'))
+
+
+def list_skill_files(skill_dir):
+    """技能目录中的所有文件（相对路径，已排序）"""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(skill_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_NAMES and not d.startswith('.'))
+        for filename in filenames:
+            if filename in IGNORED_NAMES or filename.startswith('.') or Path(filename).suffix in IGNORED_SUFFIXES:
+                continue
+            files.append((Path(dirpath) / filename).relative_to(skill_dir).as_posix())
+    return sorted(files)
+
+
+def fingerprint(entry, skill_dir, source_path):
+    """
+    技能的变化指纹：gallery.json条目 + 源文件和资源文件的大小与修改时间
+
+    未在gallery.json中列出资源的技能，指纹还包括目录中的文件列表
+    """
+    digest = hashlib.sha256(compact_json(entry).encode('utf-8'))
+    if entry.get('resources'):
+        paths = [source_path] + [skill_dir / resource['path'] for resource in entry['resources']]
+    else:
+        paths = [source_path] + [skill_dir / name for name in list_skill_files(skill_dir)] if skill_dir.is_dir() else [source_path]
+    for path in paths:
+        try:
+            stat = path.stat()
+            digest.update(f'{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n'.encode('utf-8'))
+        except OSError:
+            digest.update(f'{path}\0missing\n'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def read_skill_frontmatter(source_path):
+    """读取源文件的frontmatter，返回 (frontmatter字典或None, 问题列表)"""
+    try:
+        frontmatter_bytes, error = read_frontmatter_bytes(source_path)
+    except OSError as e:
+        return None, [f'Cannot read {source_path.name}: {e}']
+    if error:
+        return None, [error]
+    frontmatter, error = parse_frontmatter(frontmatter_bytes)
+    if error:
+        return None, [error]
+    return frontmatter, check_frontmatter(frontmatter)
+
+
+def build_skill(entry, base_url):
+    """
+    生成单个技能的卡片信息、详情和搜索文本
+
+    Returns:
+        dict: {'card', 'detail', 'search_text', 'warnings'}
+    """
+    source_path = GALLERY_DIR / entry['source']
+    skill_dir = source_path.parent
+    skill_url = base_url + skill_dir.relative_to(GALLERY_DIR).as_posix() + '/'
+    warnings = []
+    if not source_path.exists():
+        warnings.append(f"source not found: {entry['source']}")
+
+    frontmatter, violations = read_skill_frontmatter(source_path) if source_path.exists() else (None, [])
+    frontmatter = frontmatter or {}
+
+    # 卡片字段：优先使用gallery.json中的展示文案，否则取frontmatter
+    card = {
+        'id': entry['id'],
+        'name': entry.get('name') or display_name(str(frontmatter.get('name', skill_dir.name))),
+        'description': entry.get('description') or str(frontmatter.get('description', '')),
+        'category': entry['category']
+    }
+    if entry.get('subCategory'):
+        card['subCategory'] = entry['subCategory']
+    card['icon'] = entry.get('icon', '📦')
+    card['gradient'] = entry.get('gradient', 'var(--gradient-1)')
+
+    if entry.get('resources'):
+        resources = entry['resources']
+    else:
+        resources = [{'path': name} for name in list_skill_files(skill_dir)] if skill_dir.is_dir() else []
+
+    detail_resources = []
+    for resource in resources:
+        if not (skill_dir / resource['path']).exists():
+            warnings.append(f"resource not found: {entry['source']} -> {resource['path']}")
+        detail_resources.append({
+            'name': resource.get('name') or resource['path'].rsplit('/', 1)[-1],
+            'description': resource.get('description', ''),
+            'path': skill_url + resource['path']
+        })
+
+    detail = {
+        'sourceUrl': base_url + entry['source'],
+        'resources': detail_resources
+    }
+    if frontmatter:
+        detail['frontmatter'] = {key: frontmatter[key] for key in ('name', 'description', 'license')
+                                 if isinstance(frontmatter.get(key), str)}
+    if violations:
+        detail['violations'] = violations
+
+    search_text = ' '.join([
+        card['name'], card['description'], card['category'], card.get('subCategory', ''),
+        str(frontmatter.get('name', '')), str(frontmatter.get('description', '')),
+        ' '.join(resource['name'] for resource in detail_resources)
+    ])
+    return {'card': card, 'detail': detail, 'search_text': search_text, 'warnings': warnings}
+
+
+def build_search_index(search_texts):
+    """
+    倒排索引：按词排序的 [词, [技能序号...]] 列表
+
+    按词排序后前端可以二分查找前缀，搜索时不需要逐个扫描技能
+    """
+    postings = {}
+    for position, text in enumerate(search_texts):
+        for token in set(tokenize(text)):
+            postings.setdefault(token, []).append(position)
+    return [[token, postings[token]] for token in sorted(postings)]
+
+
+def load_cache(force):
+    if force or not CACHE_FILE.exists():
+        return {}
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except ValueError:
+        return {}
+    return data.get('skills', {}) if data.get('version') == CATALOG_VERSION else {}
+
+
+def build_catalog(force=False):
+    """
+    生成目录文件
+
+    Args:
+        force: 忽略缓存，重新读取所有技能
+
+    Returns:
+        dict: 构建摘要（技能数、重新读取数、写入的文件、警告）
+    """
+    gallery = json.loads(GALLERY_FILE.read_text(encoding='utf-8'))
+    base_url = gallery['baseUrl']
+    cache = load_cache(force)
+
+    built = []
+    rebuilt = 0
+    new_cache = {}
+    for entry in gallery['skills']:
+        source_path = GALLERY_DIR / entry['source']
+        key = fingerprint({'baseUrl': base_url, **entry}, source_path.parent, source_path)
+        cached = cache.get(entry['id'])
+        if cached and cached['fingerprint'] == key:
+            result = cached['result']
+        else:
+            result = build_skill(entry, base_url)
+            rebuilt += 1
+        new_cache[entry['id']] = {'fingerprint': key, 'result': result}
+        built.append(result)
+
+    ids = [item['card']['id'] for item in built]
+    duplicates = sorted({skill_id for skill_id in ids if ids.count(skill_id) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate skill ids in gallery.json: {', '.join(duplicates)}")
+
+    # 按分类拆分详情
+    shards = {}
+    for item in built:
+        shards.setdefault(item['card']['category'], {})[item['card']['id']] = item['detail']
+
+    index = {
+        'version': CATALOG_VERSION,
+        'categoryEmojis': gallery.get('categoryEmojis', {}),
+        'shards': {category: f'catalog/shards/{category}.json' for category in sorted(shards)},
+        'search': 'catalog/search.json',
+        'skills': [item['card'] for item in built]
+    }
+    outputs = {CATALOG_DIR / 'index.json': compact_json(index),
+               CATALOG_DIR / 'search.json': compact_json(build_search_index([item['search_text'] for item in built]))}
+    for category, details in shards.items():
+        outputs[CATALOG_DIR / 'shards' / f'{category}.json'] = compact_json(details)
+
+    written = [path for path, text in outputs.items() if write_if_changed(path, text)]
+
+    # 删除已不存在的分类分片
+    shard_dir = CATALOG_DIR / 'shards'
+    for stale in shard_dir.glob('*.json'):
+        if stale not in outputs:
+            stale.unlink()
+            written.append(stale)
+
+    CACHE_FILE.write_text(json.dumps({'version': CATALOG_VERSION, 'skills': new_cache}, ensure_ascii=False),
+                          encoding='utf-8')
+
+    return {
+        'skills': len(built),
+        'rebuilt': rebuilt,
+        'written': [path.relative_to(GALLERY_DIR).as_posix() for path in written],
+        'sizes': {path.relative_to(GALLERY_DIR).as_posix(): len(text.encode('utf-8')) for path, text in outputs.items()},
+        'warnings': [warning for item in built for warning in item['warnings']]
+    }
+
+
+def main():
+    force = '--force' in sys.argv[1:]
+    check = '--check' in sys.argv[1:]
+
+    summary = build_catalog(force=force)
+    print(f"📚 {summary['skills']} skills, {summary['rebuilt']} re-read")
+    for path, size in summary['sizes'].items():
+        marker = '✏️ ' if path in summary['written'] else '  '
+        print(f"  {marker}{path}: {size / 1024:.1f} KB")
+    for warning in summary['warnings']:
+        print(f"⚠️  {warning}")
+
+    # --check: 用于CI，目录文件与gallery.json不一致时返回非零
+    if check and summary['written']:
+        print("❌ Catalog was out of date; commit the regenerated files")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,30 +11,81 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
-def load_excel(file_path, sheet_name=None):
+from dataset_cache import cache_path_for, file_hash, load_dataset, save_dataset
+from out_of_core import (DEFAULT_CHUNK_ROWS, MISSING_TEXT, DatasetProfile, coerce_chunk,
+                         is_date_column_name, iter_source_chunks, quick_file_hash,
+                         write_chunked_dataset)
+from xlsx_reader import read_xlsx
+
+def load_excel(file_path, sheet_name=None, usecols=None, nrows=None):
     """
     加载Excel文件
 
+    .xlsx/.xlsm文件使用流式读取器（xlsx_reader），其他格式或流式读取失败时
+    回退到pd.read_excel。
+
     Args:
         file_path: Excel文件路径
         sheet_name: 工作表名称（可选）
+        usecols: 要读取的列名列表（可选）
+        nrows: 最多读取的数据行数（可选，用于采样）
 
     Returns:
         DataFrame: 加载的数据
     """
+    if str(file_path).lower().endswith(('.xlsx', '.xlsm')):
+        try:
+            return read_xlsx(file_path, sheet_name=sheet_name, usecols=usecols, nrows=nrows)
+        except Exception as e:
+            print(f"警告: 流式读取失败，回退到pandas读取 - {e}")
+
     try:
+        kwargs = {'usecols': usecols, 'nrows': nrows}
         if sheet_name:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+            df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
         else:
-            df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path, **kwargs)
         return df
     except Exception as e:
         print(f"错误: 读取Excel文件失败 - {e}")
         sys.exit(1)
 
+# 不同值个数不超过行数的该比例时，字符列转为category类型
+CATEGORY_MAX_RATIO = 0.5
+
+def memory_usage_kb(df):
+    """DataFrame的内存占用（KB，含对象列的实际内容）"""
+    return float(df.memory_usage(deep=True).sum() / 1024)
+
+def downcast_numeric(series):
+    """
+    数值列降精度：整数降到能容纳取值范围的最小整数类型，
+    浮点数仅在转换为float32无损时降为float32，保证统计结果不变
+
+    Args:
+        series: 数值Series
+
+    Returns:
+        Series: 降精度后的Series
+    """
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+    if pd.api.types.is_float_dtype(series) and series.dtype != np.float32:
+        values = series.to_numpy()
+        narrowed = values.astype(np.float32)
+        with np.errstate(invalid='ignore'):
+            lossless = np.array_equal(narrowed.astype(values.dtype), values, equal_nan=True)
+        if lossless:
+            return pd.Series(narrowed, index=series.index, name=series.name)
+    return series
+
 def clean_data(df):
     """
-    数据清洗和预处理
+    数据清洗和预处理（原地修改传入的DataFrame，不整表复制）
+
+    - 日期列（列名含 date/日期/时间）转换为datetime
+    - 数值列缺失值一次性计算中位数，与字符列的"无数据"一起通过单次fillna填充
+    - 低基数字符列转为category，数值列降精度
 
     Args:
         df: 原始DataFrame
@@ -42,32 +93,39 @@ def clean_data(df):
     Returns:
         DataFrame: 清洗后的数据
     """
-    # 处理缺失值
-    df_cleaned = df.copy()
-
-    # 数值列：填充中位数
-    numeric_cols = df_cleaned.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        if df_cleaned[col].isnull().sum() > 0:
-            median_val = df_cleaned[col].median()
-            df_cleaned[col].fillna(median_val, inplace=True)
-
-    # 字符列：填充"无数据"
-    string_cols = df_cleaned.select_dtypes(include=['object']).columns
-    for col in string_cols:
-        if df_cleaned[col].isnull().sum() > 0:
-            df_cleaned[col].fillna('无数据', inplace=True)
-
-    # 尝试转换日期列
-    for col in df_cleaned.columns:
-        col_lower = str(col).lower()
-        if 'date' in col_lower or '日期' in col_lower or '时间' in col_lower:
-            try:
-                df_cleaned[col] = pd.to_datetime(df_cleaned[col], errors='coerce')
-            except:
-                pass
-
-    return df_cleaned
+    # 尝试转换日期列（在填充缺失值之前，避免"无数据"被当作日期解析）
+    date_cols = [col for col in df.columns if is_date_column_name(col)]
+    for col in date_cols:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+
+    # 只处理含缺失值的列：一次isna().any()得到所有列的缺失标记
+    has_missing = df.isna().any()
+    numeric_cols = [col for col in df.select_dtypes(include=[np.number]).columns
+                    if has_missing[col] and col not in date_cols]
+    string_cols = [col for col in df.select_dtypes(include=['object']).columns
+                   if has_missing[col] and col not in date_cols]
+
+    # 数值列：填充中位数（一次向量化计算所有列的中位数）；字符列：填充"无数据"
+    fill_values = {}
+    if numeric_cols:
+        fill_values.update(df[numeric_cols].median().to_dict())
+    fill_values.update({col: MISSING_TEXT for col in string_cols})
+    if fill_values:
+        df.fillna(fill_values, inplace=True)
+
+    # 低基数字符列转为category，数值列降精度
+    max_unique = max(1, int(len(df) * CATEGORY_MAX_RATIO))
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object:
+            # 只转换纯字符串列，混合类型的列保持原样
+            if pd.api.types.infer_dtype(series, skipna=True) == 'string' and series.nunique() <= max_unique:
+                df[col] = series.astype('category')
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            df[col] = downcast_numeric(series)
+
+    return df
 
 def analyze_data_structure(df):
     """
@@ -85,7 +143,7 @@ def analyze_data_structure(df):
         'column_names': list(df.columns),
         'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
         'missing_values': {col: int(df[col].isnull().sum()) for col in df.columns},
-        'memory_usage': float(df.memory_usage(deep=True).sum() / 1024)
+        'memory_usage': memory_usage_kb(df)
     }
 
     return structure
@@ -102,7 +160,7 @@ def identify_column_types(df):
     """
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     date_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
 
     return {
         'numeric': numeric_cols,
@@ -110,6 +168,69 @@ def identify_column_types(df):
         'categorical': categorical_cols
     }
 
+def analyze_chunked(file_path, cache_file, sheet_name=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    分块模式：两遍扫描处理超出内存的数据文件
+
+    第一遍按块累积可合并的数据画像（缺失值计数、列类型、近似中位数）；第二遍用全局
+    中位数清洗每个块并逐块写入数据集缓存，同时统计结构信息。内存中始终只保留一个块。
+    cache_file为None时表示输入本身就是清洗后的缓存，只做一遍统计。
+
+    Args:
+        file_path: 数据文件路径（CSV/Parquet/xlsx/Feather）
+        cache_file: 数据集缓存路径（None表示不写缓存）
+        sheet_name: 工作表名称（仅xlsx）
+        chunk_rows: 每块行数
+
+    Returns:
+        tuple: (数据结构信息, 列类型分类, 样本数据)
+    """
+    profile = DatasetProfile(numeric_stats=False)
+    missing_raw = None
+    totals = {'memory': 0, 'dtypes': None, 'sample': None}
+
+    def tally(chunks, target):
+        for chunk in chunks:
+            target.update(chunk)
+            totals['memory'] += int(chunk.memory_usage(deep=True).sum())
+            if totals['sample'] is None:
+                totals['dtypes'] = {col: str(dtype) for col, dtype in chunk.dtypes.items()}
+                totals['sample'] = chunk.head(10).to_dict('records')
+            yield chunk
+
+    if cache_file is None:
+        for _ in tally(iter_source_chunks(file_path, chunk_rows), profile):
+            pass
+    else:
+        raw = DatasetProfile()
+        for chunk in iter_source_chunks(file_path, chunk_rows, sheet_name):
+            raw.update(chunk)
+        print(f"✓ 分块画像完成: {raw.rows} 行 × {len(raw.columns)} 列")
+        missing_raw = dict(raw.missing)
+
+        medians = raw.medians()
+        cleaned = (coerce_chunk(chunk, raw.kinds, medians)
+                   for chunk in iter_source_chunks(file_path, chunk_rows, sheet_name))
+        write_chunked_dataset(tally(cleaned, profile), cache_file)
+        print(f"✓ 数据集缓存已写入: {cache_file}")
+
+    structure = {
+        'total_rows': profile.rows,
+        'total_columns': len(profile.columns),
+        'column_names': list(profile.columns),
+        'data_types': totals['dtypes'],
+        'missing_values': dict(profile.missing),
+        'memory_usage': float(totals['memory'] / 1024)
+    }
+    if missing_raw is not None:
+        structure['missing_values_raw'] = missing_raw
+    column_types = {
+        'numeric': [col for col in profile.columns if profile.kinds[col] == 'numeric'],
+        'date': [col for col in profile.columns if profile.kinds[col] == 'datetime'],
+        'categorical': [col for col in profile.columns if profile.kinds[col] == 'string']
+    }
+    return structure, column_types, totals['sample']
+
 def save_json(data, output_path):
     """
     保存分析结果为JSON
@@ -129,6 +250,11 @@ def main():
     file_path = sys.argv[1] if len(sys.argv) > 1 else None
     output_path = sys.argv[2] if len(sys.argv) > 2 else 'analysis_result.json'
     sheet_name = None
+    cache_dir = None
+    use_cache = True
+    sample_rows = None
+    chunked = False
+    chunk_rows = DEFAULT_CHUNK_ROWS
 
     # 解析参数
     i = 3
@@ -136,32 +262,84 @@ def main():
         if sys.argv[i] == '--sheet' and i + 1 < len(sys.argv):
             sheet_name = sys.argv[i + 1]
             i += 2
+        elif sys.argv[i] == '--cache-dir' and i + 1 < len(sys.argv):
+            cache_dir = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--no-cache':
+            use_cache = False
+            i += 1
+        elif sys.argv[i] == '--sample' and i + 1 < len(sys.argv):
+            sample_rows = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--chunked':
+            chunked = True
+            i += 1
+        elif sys.argv[i] == '--chunk-rows' and i + 1 < len(sys.argv):
+            chunk_rows = int(sys.argv[i + 1])
+            i += 2
         else:
             i += 1
 
     if not file_path:
         print("错误: 请指定Excel文件路径")
-        print("用法: python analyze_excel.py <file> [--sheet <name>] [--output <output>]")
+        print("用法: python analyze_excel.py <file> [output] [--sheet <name>] [--cache-dir <dir>] [--no-cache] [--sample <n>] [--chunked [--chunk-rows <n>]]")
         sys.exit(1)
 
     print(f"📊 分析文件: {file_path}")
 
-    # 加载数据
-    df = load_excel(file_path, sheet_name)
-    print(f"✓ 加载完成: {len(df)} 行 × {len(df.columns)} 列")
+    # 数据集缓存：按源文件哈希和工作表定位（采样模式不使用缓存）
+    source_hash = None
+    cache_file = None
+    if sample_rows is None:
+        if cache_dir is None:
+            cache_dir = Path(output_path).resolve().parent / '.dataset_cache'
+        # 分块模式面向超大文件，使用快速指纹代替全文件哈希
+        source_hash = quick_file_hash(file_path) if chunked else file_hash(file_path)
+        cache_file = cache_path_for(source_hash, sheet_name, cache_dir).resolve()
+
+    if chunked and sample_rows is None:
+        if use_cache and cache_file.exists():
+            # 命中缓存：缓存中已是清洗后的数据，只需单遍扫描缓存统计结构信息
+            print("✓ 命中数据集缓存")
+            structure, column_types, sample_data = analyze_chunked(cache_file, None, chunk_rows=chunk_rows)
+        else:
+            structure, column_types, sample_data = analyze_chunked(file_path, cache_file, sheet_name, chunk_rows)
+    else:
+        memory_before = None
+        if sample_rows is not None:
+            # 采样模式：只解析前N行快速识别结构，不写入完整数据集缓存
+            df = load_excel(file_path, sheet_name, nrows=sample_rows)
+            memory_before = memory_usage_kb(df)
+            df_cleaned = clean_data(df)
+            print(f"✓ 采样加载完成: {len(df_cleaned)} 行 × {len(df_cleaned.columns)} 列")
+        elif use_cache and cache_file.exists():
+            # 命中缓存：跳过Excel解析和清洗
+            df_cleaned = load_dataset(cache_file)
+            print(f"✓ 命中数据集缓存: {len(df_cleaned)} 行 × {len(df_cleaned.columns)} 列")
+        else:
+            # 加载数据
+            df = load_excel(file_path, sheet_name)
+            print(f"✓ 加载完成: {len(df)} 行 × {len(df.columns)} 列")
+
+            # 数据清洗
+            memory_before = memory_usage_kb(df)
+            df_cleaned = clean_data(df)
+            print(f"✓ 数据清洗完成（内存 {memory_before:.2f} KB → {memory_usage_kb(df_cleaned):.2f} KB）")
 
-    # 数据清洗
-    df_cleaned = clean_data(df)
-    print("✓ 数据清洗完成")
+            # 写入列式缓存，供后续分析阶段加载完整数据
+            save_dataset(df_cleaned, cache_file)
+            print(f"✓ 数据集缓存已写入: {cache_file}")
 
-    # 分析数据结构
-    structure = analyze_data_structure(df_cleaned)
+        # 分析数据结构
+        structure = analyze_data_structure(df_cleaned)
+        if memory_before is not None:
+            structure['memory_usage_before_cleaning'] = memory_before
 
-    # 识别列类型
-    column_types = identify_column_types(df_cleaned)
+        # 识别列类型
+        column_types = identify_column_types(df_cleaned)
 
-    # 保存数据样本
-    sample_data = df_cleaned.head(10).to_dict('records')
+        # 保存数据样本
+        sample_data = df_cleaned.head(10).to_dict('records')
 
     # 组装结果
     result = {
@@ -169,7 +347,16 @@ def main():
         'timestamp': datetime.now().isoformat(),
         'structure': structure,
         'column_types': column_types,
-        'sample_data': sample_data
+        'sample_data': sample_data,
+        'dataset_cache': {
+            'path': str(cache_file),
+            'format': 'feather',
+            'source_hash': source_hash,
+            'sheet': sheet_name,
+            'rows': structure['total_rows'],
+            'columns': [str(col) for col in structure['column_names']]
+        } if cache_file else None,
+        'sampled_rows': sample_rows
     }
 
     # 保存结果
@@ -181,7 +368,10 @@ def main():
     print(f"  - 数值列: {len(column_types['numeric'])}")
     print(f"  - 日期列: {len(column_types['date'])}")
     print(f"  - 分类列: {len(column_types['categorical'])}")
-    print(f"  - 内存占用: {structure['memory_usage']:.2f} KB")
+    if 'memory_usage_before_cleaning' in structure:
+        print(f"  - 内存占用: {structure['memory_usage']:.2f} KB（清洗前 {structure['memory_usage_before_cleaning']:.2f} KB）")
+    else:
+        print(f"  - 内存占用: {structure['memory_usage']:.2f} KB")
 
 if __name__ == '__main__':
     main()
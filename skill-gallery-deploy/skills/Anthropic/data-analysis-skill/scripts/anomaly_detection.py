@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+滚动窗口异常检测模块
+基于滚动中位数/MAD（稳健z-score）和季节残差检测局部异常，
+用stride tricks向量化计算，支持分块流式处理，结果为紧凑的下标数组
+"""
+
+import sys
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# MAD换算为正态分布标准差的系数
+MAD_SCALE = 1.4826
+ANOMALY_METHODS = ('zscore', 'rolling', 'seasonal')
+
+def rolling_median_mad(values, window, block_size=1 << 18):
+    """
+    计算所有长度为window的滑动窗口的中位数和MAD（中位数绝对偏差）
+
+    用sliding_window_view得到窗口视图（不复制数据），按块计算以限制临时数组大小。
+
+    Args:
+        values: 一维数值数组（不含NaN）
+        window: 窗口长度
+        block_size: 每块处理的窗口数
+
+    Returns:
+        tuple: (median, mad) 数组，长度为 len(values) - window + 1，
+               第i个元素对应 values[i:i + window]
+    """
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values) - window + 1
+    if count <= 0:
+        return np.empty(0), np.empty(0)
+
+    median = np.empty(count)
+    mad = np.empty(count)
+    for start in range(0, count, block_size):
+        stop = min(start + block_size, count)
+        view = sliding_window_view(values[start:stop + window - 1], window)
+        # 窗口很短时，沿窗口轴整体排序比np.median逐行选择更快
+        block_median = _sorted_median(np.sort(view, axis=1))
+        median[start:stop] = block_median
+        mad[start:stop] = _sorted_median(np.sort(np.abs(view - block_median[:, None]), axis=1))
+    return median, mad
+
+def _sorted_median(rows):
+    """每行已排序的二维数组的逐行中位数"""
+    width = rows.shape[1]
+    mid = width // 2
+    if width % 2:
+        return rows[:, mid].copy()
+    return (rows[:, mid - 1] + rows[:, mid]) / 2
+
+def seasonal_baseline(values, period, seasons):
+    """
+    季节基线：每个点取前 seasons 个周期同相位值的中位数
+
+    Args:
+        values: 一维数值数组
+        period: 季节周期（点数）
+        seasons: 参与计算的历史周期数
+
+    Returns:
+        ndarray: 长度为 len(values) - period * seasons 的基线，第i个元素对应 values[i + period * seasons]
+    """
+    values = np.asarray(values, dtype=np.float64)
+    lag = period * seasons
+    count = len(values) - lag
+    if count <= 0:
+        return np.empty(0)
+    lagged = np.stack([values[lag - k * period:lag - k * period + count] for k in range(1, seasons + 1)], axis=1)
+    return _sorted_median(np.sort(lagged, axis=1))
+
+class RollingAnomalyDetector:
+    """
+    流式滚动异常检测器
+
+    每个点与其之前 window 个点（季节模式下为季节残差）的中位数比较，
+    稳健z-score = (x - median) / (1.4826 * MAD)，绝对值超过阈值即为异常。
+    分块调用update，块之间只保留必要的尾部历史，结果与一次性处理整条序列相同。
+
+    Args:
+        window: 滚动窗口长度
+        threshold: 稳健z-score阈值
+        period: 季节周期（点数，None表示不做季节调整）
+        seasons: 季节基线使用的历史周期数
+    """
+
+    def __init__(self, window=60, threshold=3.5, period=None, seasons=3):
+        self.window = window
+        self.threshold = threshold
+        self.period = period
+        self.seasons = seasons if period else 0
+        self.lag = (period or 0) * self.seasons
+        self.history = self.lag + window
+        self.tail = np.empty(0)
+        self.seen = 0
+        self.indices = []
+        self.values = []
+        self.scores = []
+
+    def update(self, chunk):
+        """
+        处理一个数据块
+
+        Args:
+            chunk: 一维数值数组（不含NaN）
+
+        Returns:
+            ndarray: 本块中异常点的全局下标
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        ext = np.concatenate([self.tail, chunk])
+        offset = self.seen - len(self.tail)
+
+        if self.period:
+            series = ext[self.lag:] - seasonal_baseline(ext, self.period, self.seasons)
+            series_offset = offset + self.lag
+        else:
+            series = ext
+            series_offset = offset
+
+        found = np.empty(0, dtype=np.int64)
+        if len(series) > self.window:
+            # 第i个窗口 series[i:i+window] 作为 series[i+window] 的基准（不含当前点）
+            median, mad = rolling_median_mad(series[:-1], self.window)
+            current = series[self.window:]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                score = (current - median) / (MAD_SCALE * mad)
+            # MAD为0（窗口内大多数值相同）时，只要偏离中位数即视为异常
+            score = np.where(mad == 0, np.where(current == median, 0.0, np.inf * np.sign(current - median)), score)
+            positions = series_offset + self.window + np.arange(len(current))
+            # 只报告本块新增的点（尾部历史中的点在上一块已经判定过）
+            new = positions >= self.seen
+            hit = new & (np.abs(score) > self.threshold)
+            found = positions[hit].astype(np.int64)
+            self.indices.append(found)
+            self.values.append(ext[found - offset])
+            self.scores.append(score[hit])
+
+        self.seen += len(chunk)
+        self.tail = ext[-self.history:] if self.history else np.empty(0)
+        return found
+
+    def result(self):
+        """
+        Returns:
+            dict: {'indices': int64数组, 'values': 数组, 'scores': 数组}
+        """
+        def join(parts, dtype):
+            return np.concatenate(parts).astype(dtype) if parts else np.empty(0, dtype=dtype)
+
+        return {
+            'indices': join(self.indices, np.int64),
+            'values': join(self.values, np.float64),
+            'scores': join(self.scores, np.float64)
+        }
+
+def detect_rolling_anomalies(values, window=60, threshold=3.5, period=None, seasons=3, chunk_size=1 << 20):
+    """
+    对整条序列分块运行滚动异常检测
+
+    Args:
+        values: 一维数值数组
+        window: 滚动窗口长度
+        threshold: 稳健z-score阈值
+        period: 季节周期（None表示不做季节调整）
+        seasons: 季节基线使用的历史周期数
+        chunk_size: 每块点数
+
+    Returns:
+        dict: {'indices', 'values', 'scores'} 数组
+    """
+    values = np.asarray(values, dtype=np.float64)
+    detector = RollingAnomalyDetector(window, threshold, period, seasons)
+    for start in range(0, len(values), chunk_size):
+        detector.update(values[start:start + chunk_size])
+    return detector.result()
+
+def benchmark(n_points=10000000, window=60, period=24):
+    """在合成序列（噪声 / 季节 + 噪声，注入尖峰异常）上测量各方法的耗时和检出情况"""
+    rng = np.random.default_rng(0)
+    t = np.arange(n_points)
+    noise = rng.normal(0, 1, n_points)
+    injected = rng.choice(n_points, size=max(n_points // 10000, 1), replace=False)
+    spikes = np.zeros(n_points)
+    spikes[injected] = rng.choice([-1, 1], size=len(injected)) * 15
+
+    cases = (
+        ('rolling', np.cumsum(rng.normal(0, 0.05, n_points)) + noise + spikes, {}),
+        ('seasonal', 0.0001 * t + 10 * np.sin(2 * np.pi * t / period) + noise + spikes, {'period': period})
+    )
+    print(f"基准测试: {n_points} 点，窗口 {window}，季节周期 {period}，注入异常 {len(injected)} 个")
+    for name, values, kwargs in cases:
+        start = time.perf_counter()
+        found = detect_rolling_anomalies(values, window, **kwargs)['indices']
+        elapsed = time.perf_counter() - start
+        recall = np.isin(injected, found).mean()
+        print(f"  - {name}: {elapsed:.2f}s（{n_points / elapsed / 1e6:.1f}M 点/秒），"
+              f"检出 {len(found)} 个，注入异常召回率 {recall:.1%}，"
+              f"结果数组 {found.nbytes / 1024:.0f} KB")
+
+if __name__ == '__main__':
+    n = int(sys.argv[sys.argv.index('--benchmark') + 1]) if '--benchmark' in sys.argv[:-1] else 10000000
+    benchmark(n)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+多序列批量趋势分析模块
+日期只解析一次，按分组列和值列拆分出所有序列，用向量化的groupby运算一次算出
+全部序列的移动平均、增长率、线性趋势和异常值，大数据量时按分组并行
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from downsample import DEFAULT_MAX_POINTS, downsample_indices
+
+# 总行数超过该值且jobs>1时，按分组拆分到多个进程并行计算
+PARALLEL_MIN_ROWS = 1000000
+
+METRIC = '__metric'
+VALUE = '__value'
+
+def to_long_format(df, date_column, value_columns, key_column=None):
+    """
+    将宽表整理为长表（分组列、日期、指标名、值），日期只解析一次
+
+    Args:
+        df: DataFrame
+        date_column: 日期列名
+        value_columns: 值列名列表
+        key_column: 分组列名（可选，如SKU）
+
+    Returns:
+        DataFrame: 按序列和日期排序的长表
+    """
+    id_vars = [date_column] + ([key_column] if key_column else [])
+    frame = df[id_vars + list(value_columns)]
+    if not pd.api.types.is_datetime64_any_dtype(frame[date_column]):
+        frame = frame.assign(**{date_column: pd.to_datetime(frame[date_column], errors='coerce')})
+    long = frame.melt(id_vars=id_vars, value_vars=list(value_columns), var_name=METRIC, value_name=VALUE)
+    long[VALUE] = pd.to_numeric(long[VALUE], errors='coerce')
+    long = long.dropna(subset=[date_column, VALUE])
+    sort_keys = ([key_column] if key_column else []) + [METRIC, date_column]
+    return long.sort_values(sort_keys, kind='stable').reset_index(drop=True)
+
+def _series_keys(key_column):
+    return ([key_column] if key_column else []) + [METRIC]
+
+def _sample_points(x, values, max_points, method):
+    """去掉非有限值后降采样，返回 (序列内位置数组, 值列表)"""
+    positions = np.flatnonzero(np.isfinite(values))
+    kept = positions[downsample_indices(x[positions], values[positions], max_points, method)]
+    return kept, values[kept].tolist()
+
+def _format_dates(dates):
+    """datetime64数组格式化为与str(Timestamp)相同的文本（只格式化需要输出的点）"""
+    return np.char.replace(np.datetime_as_string(dates, unit='s'), 'T', ' ').tolist()
+
+def analyze_series_frame(long, date_column, key_column=None, period=7, threshold=2,
+                         max_points=DEFAULT_MAX_POINTS, method='lttb'):
+    """
+    对长表中的所有序列做趋势分析（各指标按序列向量化计算）
+
+    Args:
+        long: to_long_format的结果（按序列和日期排序）
+        date_column: 日期列名
+        key_column: 分组列名（可选）
+        period: 移动平均周期
+        threshold: 异常值z-score阈值
+        max_points: 每条逐点序列最多输出的点数
+        method: 降采样方法
+
+    Returns:
+        list: 每个序列一个结果字典
+    """
+    keys = _series_keys(key_column)
+    grouped = long.groupby(keys, sort=False)
+    group_id = grouped.ngroup().to_numpy()
+    y = long[VALUE].to_numpy(dtype=np.float64)
+    x = grouped.cumcount().to_numpy(dtype=np.float64)
+
+    # 每个序列的计数、均值、方差等（一次groupby聚合）
+    summary = grouped[VALUE].agg(['size', 'mean', 'var', 'min', 'max'])
+    n = summary['size'].to_numpy(dtype=np.float64)
+    mean_y = summary['mean'].to_numpy()
+
+    # 线性趋势：x为序列内位置，Σx、Σx²有闭式解，Σxy用bincount一次累加
+    mean_x = (n - 1) / 2.0
+    sxx = n * (n * n - 1) / 12.0
+    sxy = np.bincount(group_id, weights=x * y, minlength=len(n)) - n * mean_x * mean_y
+    syy = summary['var'].to_numpy() * (n - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = sxy / sxx
+        intercept = mean_y - slope * mean_x
+        r = np.clip(np.where(syy > 0, sxy / np.sqrt(sxx * syy), 0.0), -1.0, 1.0)
+        t = r * np.sqrt((n - 2) / (1 - r * r))
+        p_value = np.where(np.abs(r) < 1, 2 * stats.t.sf(np.abs(t), n - 2), 0.0)
+
+    # 移动平均：组内累积和错位相减
+    csum = grouped[VALUE].cumsum().to_numpy()
+    shifted = pd.Series(csum).groupby(group_id).shift(period, fill_value=0.0).to_numpy()
+    ma = np.where(x >= period - 1, (csum - shifted) / period, np.nan)
+
+    # 环比增长率
+    growth = grouped[VALUE].pct_change().to_numpy() * 100
+    growth_summary = pd.Series(growth).groupby(group_id).agg(['mean', 'std', 'max', 'min'])
+
+    # z-score异常值（总体标准差，与scipy.stats.zscore一致）
+    std0 = np.sqrt(syy / n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.abs((y - mean_y[group_id]) / std0[group_id])
+    anomaly = z > threshold
+
+    # 各序列的边界（长表已按序列排序，序列在长表中连续）
+    bounds = np.flatnonzero(np.diff(group_id)) + 1
+    starts = np.concatenate([[0], bounds])
+    ends = np.concatenate([bounds, [len(group_id)]])
+    dates = long[date_column].to_numpy(dtype='datetime64[ns]')
+    metrics = long[METRIC].to_numpy()
+    key_values = long[key_column].to_numpy() if key_column else None
+
+    results = []
+    for gid, (start, end) in enumerate(zip(starts, ends)):
+        metric = metrics[start]
+        item = {}
+        if key_column:
+            key = key_values[start]
+            item['key'] = key.item() if isinstance(key, np.generic) else key
+        item.update({
+            'value_column': metric,
+            'period': period,
+            'data_points': int(n[gid]),
+            'date_range': dict(zip(('start', 'end'), _format_dates(dates[[start, end - 1]])))
+        })
+        series_dates = dates[start:end]
+        x_dates = series_dates.astype(np.int64).astype(np.float64)
+
+        if n[gid] >= period:
+            kept, values = _sample_points(x_dates, ma[start:end], max_points, method)
+            item['moving_average'] = {d: {metric: v} for d, v in zip(_format_dates(series_dates[kept]), values)}
+
+        kept, values = _sample_points(x_dates, growth[start:end], max_points, method)
+        item['growth_rate'] = {
+            'mean': float(growth_summary['mean'].iloc[gid]),
+            'std': float(growth_summary['std'].iloc[gid]),
+            'max': float(growth_summary['max'].iloc[gid]),
+            'min': float(growth_summary['min'].iloc[gid]),
+            'values': dict(zip(_format_dates(series_dates[kept]), values))
+        }
+
+        if n[gid] >= 3:
+            item['trend_line'] = {
+                'trend': [float(intercept[gid]), float(intercept[gid] + slope[gid] * (n[gid] - 1))],
+                'trend_index': [0, int(n[gid]) - 1],
+                'slope': float(slope[gid]),
+                'intercept': float(intercept[gid]),
+                'r_squared': float(r[gid] ** 2),
+                'p_value': float(p_value[gid])
+            }
+
+        flagged = np.flatnonzero(anomaly[start:end])
+        item['anomalies'] = {
+            'count': int(len(flagged)),
+            'indices': flagged.tolist(),
+            'values': y[start:end][flagged].tolist(),
+            'threshold': threshold
+        }
+        results.append(item)
+    return results
+
+def _partition_groups(long, key_column, parts):
+    """按序列大小把长表均衡拆分为若干份（同一序列不跨份）"""
+    sizes = long.groupby(_series_keys(key_column), sort=False).size().to_numpy()
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    targets = np.linspace(0, bounds[-1], parts + 1)[1:-1]
+    cuts = np.unique(bounds[np.searchsorted(bounds, targets)])
+    edges = [0] + [int(c) for c in cuts if 0 < c < bounds[-1]] + [int(bounds[-1])]
+    return [long.iloc[a:b] for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+def _analyze_partition(args):
+    return analyze_series_frame(*args)
+
+def analyze_trend_batch(df, date_column, value_columns, key_column=None, period=7, threshold=2,
+                        max_points=DEFAULT_MAX_POINTS, method='lttb', jobs=None):
+    """
+    多序列批量趋势分析
+
+    Args:
+        df: DataFrame
+        date_column: 日期列名
+        value_columns: 值列名列表
+        key_column: 分组列名（可选）
+        period: 移动平均周期
+        threshold: 异常值z-score阈值
+        max_points: 每条逐点序列最多输出的点数
+        method: 降采样方法
+        jobs: 并行进程数（None表示CPU核数，仅在数据量超过PARALLEL_MIN_ROWS时生效）
+
+    Returns:
+        dict: 合并后的批量分析结果
+    """
+    long = to_long_format(df, date_column, value_columns, key_column)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    params = (date_column, key_column, period, threshold, max_points, method)
+    if jobs > 1 and len(long) >= PARALLEL_MIN_ROWS:
+        partitions = _partition_groups(long, key_column, jobs)
+        with ProcessPoolExecutor(max_workers=len(partitions)) as executor:
+            series = [item for part in executor.map(_analyze_partition, [(p,) + params for p in partitions])
+                      for item in part]
+    elif len(long):
+        series = analyze_series_frame(long, *params)
+    else:
+        series = []
+
+    return {
+        'date_column': date_column,
+        'key_column': key_column,
+        'value_columns': list(value_columns),
+        'period': period,
+        'series_count': len(series),
+        'data_points': int(len(long)),
+        'series': series
+    }
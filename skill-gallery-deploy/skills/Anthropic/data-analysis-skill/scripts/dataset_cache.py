@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+数据集缓存模块
+将清洗后的完整数据集以列式格式（Feather/Arrow）缓存，供后续分析阶段内存映射加载
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+import pandas as pd
+
+# 缓存文件格式版本，清洗逻辑变化时递增以使旧缓存失效
+CACHE_VERSION = 2
+
+def file_hash(file_path, chunk_size=1 << 20):
+    """
+    计算源文件的SHA-256哈希
+
+    Args:
+        file_path: 文件路径
+        chunk_size: 每次读取的字节数
+
+    Returns:
+        str: 十六进制哈希值
+    """
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def cache_path_for(source_hash, sheet_name, cache_dir):
+    """
+    根据源文件哈希和工作表名称生成缓存文件路径
+
+    Args:
+        source_hash: 源文件哈希
+        sheet_name: 工作表名称（None表示第一个工作表）
+        cache_dir: 缓存目录
+
+    Returns:
+        Path: 缓存文件路径
+    """
+    sheet_key = re.sub(r'[^\w\-]+', '_', str(sheet_name)) if sheet_name is not None else '_default'
+    return Path(cache_dir) / f"{source_hash[:16]}_{sheet_key}_v{CACHE_VERSION}.feather"
+
+def save_dataset(df, cache_file):
+    """
+    将DataFrame保存为未压缩的Feather文件（可内存映射）
+
+    Args:
+        df: 清洗后的DataFrame
+        cache_file: 缓存文件路径
+
+    Returns:
+        Path: 缓存文件路径
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    cache_file = Path(cache_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    frame = df.reset_index(drop=True)
+    frame.columns = [str(col) for col in frame.columns]
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # 混合类型的对象列无法直接转换，统一转为字符串
+        object_cols = frame.select_dtypes(include=['object']).columns
+        frame[object_cols] = frame[object_cols].astype(str)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    # 先写临时文件再替换，避免并发读取到半写入的缓存
+    tmp_file = cache_file.with_suffix('.tmp')
+    feather.write_feather(table, str(tmp_file), compression='uncompressed')
+    tmp_file.replace(cache_file)
+    return cache_file
+
+def load_dataset(cache_file, columns=None):
+    """
+    以内存映射方式加载缓存数据集
+
+    Args:
+        cache_file: 缓存文件路径
+        columns: 需要加载的列（可选，仅读取这些列）
+
+    Returns:
+        DataFrame: 数据集
+    """
+    import pyarrow.feather as feather
+
+    table = feather.read_table(str(cache_file), columns=columns, memory_map=True)
+    return table.to_pandas(split_blocks=True)
+
+def iter_dataset_batches(cache_file, columns=None):
+    """
+    按记录批次流式读取缓存数据集（每批约64K行），不将整个数据集载入内存
+
+    Args:
+        cache_file: 缓存文件路径
+        columns: 需要读取的列（可选）
+
+    Yields:
+        DataFrame: 一个批次的数据
+    """
+    import pyarrow as pa
+
+    with pa.memory_map(str(cache_file)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            table = pa.Table.from_batches([reader.get_batch(i)])
+            if columns is not None:
+                table = table.select(columns)
+            yield table.to_pandas()
+
+def load_analysis_dataset(data, columns=None):
+    """
+    从analyze_excel.py的结果中加载完整数据集，缓存不可用时回退到样本数据
+
+    Args:
+        data: 分析结果字典（包含dataset_cache或sample_data）
+        columns: 需要加载的列（可选）
+
+    Returns:
+        tuple: (DataFrame或None, 是否为完整数据集)
+    """
+    cache_info = data.get('dataset_cache') or {}
+    cache_file = cache_info.get('path')
+    if cache_file and Path(cache_file).exists():
+        if columns is not None:
+            available = set(cache_info.get('columns') or [])
+            columns = [col for col in columns if not available or col in available]
+        return load_dataset(cache_file, columns), True
+
+    sample_data = data.get('sample_data', [])
+    if sample_data:
+        df = pd.DataFrame(sample_data)
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
+        return df, False
+
+    return None, False
@@ -10,59 +10,100 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from dataset_cache import iter_dataset_batches, load_analysis_dataset
+from streaming_stats import ColumnStatsSketch, MomentAccumulator, format_statistics
+
+# 精确模式下每次作为一个二维数组处理的列数
+DEFAULT_BLOCK_SIZE = 64
+# 近似模式下每次并入草图的行数
+DEFAULT_CHUNK_ROWS = 65536
+
 def load_json(file_path):
     """加载JSON分析结果"""
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def calculate_statistics(series):
+def to_numeric_block(df, columns):
     """
-    计算统计指标
+    将若干列转换为一个二维float64数组（行×列，缺失值为NaN）
 
     Args:
-        series: pandas Series
+        df: DataFrame
+        columns: 列名列表
 
     Returns:
-        dict: 统计指标
+        tuple: (二维数组, 成功转换的列名列表)
     """
-    stats = {
-        'count': int(series.count()),
-        'mean': float(series.mean()),
-        'std': float(series.std()),
-        'min': float(series.min()),
-        'max': float(series.max()),
-        'median': float(series.median()),
-        'q25': float(series.quantile(0.25)),
-        'q75': float(series.quantile(0.75)),
-        'range': float(series.max() - series.min())
-    }
+    block = np.empty((len(df), len(columns)), dtype=np.float64)
+    converted = []
+    for col in columns:
+        try:
+            values = pd.to_numeric(df[col], errors='coerce')
+            block[:, len(converted)] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            converted.append(col)
+        except Exception as e:
+            print(f"警告: 列 '{col}' 分析失败 - {e}")
+    return block[:, :len(converted)], converted
+
+def _sorted_quantiles(ordered, counts, q):
+    """在按列排序的数组上以线性插值计算分位数（与pandas默认方法一致）"""
+    pos = q * np.maximum(counts - 1, 0)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.ceil(pos).astype(np.int64)
+    cols = np.arange(ordered.shape[1])
+    v_lo = ordered[lo, cols]
+    v_hi = ordered[hi, cols]
+    return np.where(counts > 0, v_lo + (v_hi - v_lo) * (pos - lo), np.nan)
+
+def _sorted_mode(values):
+    """已排序数组中出现次数最多的值（并列时取最小值）"""
+    if len(values) == 0:
+        return None
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    run_lengths = np.diff(np.r_[starts, len(values)])
+    return values[starts[np.argmax(run_lengths)]]
+
+def compute_block_statistics(block, columns):
+    """
+    对一个列块单次计算全部统计指标
 
-    # 计算众数
-    try:
-        mode_val = series.mode().iloc[0] if len(series.mode()) > 0 else None
-        stats['mode'] = mode_val
-    except:
-        stats['mode'] = None
+    矩（均值、标准差、偏度、峰度、最值）由一次向量化累加得到；中位数、四分位数和众数
+    共用同一次按列排序的结果。
 
-    # 计算偏度和峰度
-    stats['skewness'] = float(series.skew())
-    stats['kurtosis'] = float(series.kurtosis())
+    Args:
+        block: 二维float64数组（行×列）
+        columns: 列名列表
 
-    # 计算变异系数
-    if stats['mean'] != 0:
-        stats['cv'] = float(stats['std'] / abs(stats['mean']))
+    Returns:
+        dict: {列名: 统计指标}
+    """
+    moments = MomentAccumulator(block.shape[1]).update(block).results()
+    counts = moments['count']
+    if len(block) == 0:
+        quantiles = {q: np.full(len(columns), np.nan) for q in (0.25, 0.5, 0.75)}
+        ordered = block
     else:
-        stats['cv'] = None
+        ordered = np.sort(block, axis=0)  # NaN排在每列末尾
+        quantiles = {q: _sorted_quantiles(ordered, counts, q) for q in (0.25, 0.5, 0.75)}
 
-    return stats
+    results = {}
+    for j, col in enumerate(columns):
+        results[col] = format_statistics(
+            {name: values[j] for name, values in moments.items()},
+            quantiles[0.5][j], quantiles[0.25][j], quantiles[0.75][j],
+            _sorted_mode(ordered[:counts[j], j])
+        )
+    return results
 
-def analyze_columns(df, columns=None):
+def analyze_columns(df, columns=None, approximate=False, block_size=DEFAULT_BLOCK_SIZE):
     """
     分析指定列
 
     Args:
         df: DataFrame
         columns: 要分析的列名列表
+        approximate: 是否使用流式草图（近似分位数和众数）
+        block_size: 每次作为一个二维数组处理的列数
 
     Returns:
         dict: 分析结果
@@ -70,19 +111,46 @@ def analyze_columns(df, columns=None):
     if columns is None:
         # 分析所有数值列
         columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    columns = [col for col in columns if col in df.columns]
 
-    results = {}
-    for col in columns:
-        if col in df.columns:
-            try:
-                series = pd.to_numeric(df[col], errors='coerce')
-                stats = calculate_statistics(series.dropna())
-                results[col] = stats
-            except Exception as e:
-                print(f"警告: 列 '{col}' 分析失败 - {e}")
+    if approximate:
+        chunks = (df.iloc[start:start + DEFAULT_CHUNK_ROWS]
+                  for start in range(0, len(df), DEFAULT_CHUNK_ROWS))
+        return analyze_columns_streaming(chunks, columns)
 
+    results = {}
+    for start in range(0, len(columns), block_size):
+        block, converted = to_numeric_block(df, columns[start:start + block_size])
+        results.update(compute_block_statistics(block, converted))
     return results
 
+def analyze_columns_streaming(chunks, columns, k=200):
+    """
+    分块流式计算统计指标：矩使用Welford/Chan合并（精确），分位数使用KLL草图，
+    众数使用Misra-Gries摘要（近似），内存占用与数据总行数无关
+
+    Args:
+        chunks: 可迭代的DataFrame块
+        columns: 要分析的列名列表
+        k: KLL精度参数
+
+    Returns:
+        dict: {列名: 统计指标}
+    """
+    sketch = None
+    for chunk in chunks:
+        block, converted = to_numeric_block(chunk, [col for col in columns if col in chunk.columns])
+        if sketch is None:
+            sketch = ColumnStatsSketch(converted, k=k)
+        elif converted != sketch.columns:
+            # 某个块中转换失败的列按缺失值处理，保持列顺序一致
+            full = np.full((len(chunk), len(sketch.columns)), np.nan)
+            for j, col in enumerate(converted):
+                full[:, sketch.columns.index(col)] = block[:, j]
+            block = full
+        sketch.update(block)
+    return sketch.results() if sketch is not None else {}
+
 def generate_summary(stats):
     """
     生成统计摘要
@@ -137,6 +205,7 @@ def main():
     input_path = sys.argv[1] if len(sys.argv) > 1 else 'analysis_result.json'
     output_path = sys.argv[2] if len(sys.argv) > 2 else 'descriptive_stats.json'
     columns = None
+    approximate = False
 
     # 解析参数
     i = 3
@@ -144,6 +213,9 @@ def main():
         if sys.argv[i] == '--columns' and i + 1 < len(sys.argv):
             columns = sys.argv[i + 1].split(',')
             i += 2
+        elif sys.argv[i] == '--approx':
+            approximate = True
+            i += 1
         else:
             i += 1
 
@@ -153,27 +225,36 @@ def main():
     # 加载分析结果
     data = load_json(input_path)
 
-    # 从原始数据重建DataFrame
-    sample_data = data.get('sample_data', [])
-    if sample_data:
-        df = pd.DataFrame(sample_data)
+    cache_info = data.get('dataset_cache') or {}
+    if approximate and cache_info.get('path') and Path(cache_info['path']).exists():
+        # 近似模式：按批次流式读取缓存，不将完整数据集载入内存
+        if not columns:
+            columns = data.get('column_types', {}).get('numeric', [])
+        columns = [col for col in columns if col in cache_info.get('columns', columns)]
+        print(f"✓ 近似模式: 流式读取 {cache_info.get('rows', '?')} 行, 分析列: {', '.join(columns)}")
+        stats = analyze_columns_streaming(iter_dataset_batches(cache_info['path'], columns), columns)
+        is_full = True
     else:
-        print("错误: 无法获取数据样本")
-        sys.exit(1)
-
-    print(f"✓ 数据加载完成: {len(df)} 行 × {len(df.columns)} 列")
-
-    # 选择要分析的列
-    if columns:
-        # 过滤只存在的列
-        columns = [col for col in columns if col in df.columns]
-        print(f"✓ 分析列: {', '.join(columns)}")
-    else:
-        columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        print(f"✓ 自动检测到 {len(columns)} 个数值列")
+        # 优先从数据集缓存加载完整数据，缓存不可用时回退到样本数据
+        df, is_full = load_analysis_dataset(data, columns)
+        if df is None:
+            print("错误: 无法获取数据样本")
+            sys.exit(1)
+
+        source = "完整数据集缓存" if is_full else "数据样本"
+        print(f"✓ 数据加载完成（{source}）: {len(df)} 行 × {len(df.columns)} 列")
+
+        # 选择要分析的列
+        if columns:
+            # 过滤只存在的列
+            columns = [col for col in columns if col in df.columns]
+            print(f"✓ 分析列: {', '.join(columns)}")
+        else:
+            columns = df.select_dtypes(include=[np.number]).columns.tolist()
+            print(f"✓ 自动检测到 {len(columns)} 个数值列")
 
-    # 计算统计指标
-    stats = analyze_columns(df, columns)
+        # 计算统计指标
+        stats = analyze_columns(df, columns, approximate=approximate)
     print(f"✓ 统计指标计算完成")
 
     # 生成摘要
@@ -183,8 +264,12 @@ def main():
     result = {
         'timestamp': pd.Timestamp.now().isoformat(),
         'statistics': stats,
-        'summary': summary
+        'summary': summary,
+        'full_dataset': is_full,
+        'approximate': approximate
     }
+    if data.get('dataset_cache'):
+        result['dataset_cache'] = data['dataset_cache']
 
     # 保存结果
     save_json(result, output_path)
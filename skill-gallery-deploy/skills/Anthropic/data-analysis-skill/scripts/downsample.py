@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+时间序列降采样模块
+为图表输出限制数据点数量（LTTB / 最小-最大值），并提供二进制数组旁路文件的读写
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 2000
+DOWNSAMPLE_METHODS = ('lttb', 'minmax')
+# 平均每桶点数不超过该值时，LTTB使用纯Python内循环
+LTTB_SMALL_BUCKET = 32
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets降采样，保留视觉形状最重要的点
+
+    Args:
+        x: X值数组（数值，单调递增）
+        y: Y值数组
+        n_out: 输出点数（>=3）
+
+    Returns:
+        ndarray: 被选中点的下标（升序，包含首尾点）
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 首尾点固定，中间n-2个点均分为n_out-2个桶
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    # 各桶的平均点与选点无关，用reduceat一次算出；最后一个桶的"下一桶"为末尾点
+    counts = (ends - starts).astype(np.float64)
+    avg_x = np.append(np.add.reduceat(x[:-1], starts)[1:] / counts[1:], x[-1])
+    avg_y = np.append(np.add.reduceat(y[:-1], starts)[1:] / counts[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # 选点依赖上一个选中点，只能逐桶进行；桶很小时NumPy的调用开销大于计算本身，改用纯Python循环
+    if n / (n_out - 2) <= LTTB_SMALL_BUCKET:
+        xs, ys = x.tolist(), y.tolist()
+        prev = 0
+        for i, (start, end, ax, ay) in enumerate(zip(starts.tolist(), ends.tolist(),
+                                                     avg_x.tolist(), avg_y.tolist())):
+            px, py = xs[prev], ys[prev]
+            best, best_area = start, -1.0
+            for j in range(start, end):
+                area = abs((px - ax) * (ys[j] - py) - (px - xs[j]) * (ay - py))
+                if area > best_area:
+                    best, best_area = j, area
+            prev = best
+            selected[i + 1] = prev
+        return selected
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = starts[i], ends[i]
+        px, py = x[prev], y[prev]
+        # 与上一个选中点、下一桶平均点构成的三角形面积最大的点
+        area = np.abs((px - avg_x[i]) * (y[start:end] - py) - (px - x[start:end]) * (avg_y[i] - py))
+        prev = start + int(area.argmax())
+        selected[i + 1] = prev
+    return selected
+
+def minmax_indices(y, n_out):
+    """
+    最小-最大值降采样：每个桶保留最小值和最大值点，保证峰值不丢失
+
+    Args:
+        y: Y值数组
+        n_out: 输出点数上限
+
+    Returns:
+        ndarray: 被选中点的下标（升序，去重）
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return np.arange(n)
+
+    starts = np.linspace(0, n, n_buckets + 1).astype(np.int64)[:-1]
+    # reduceat一次求出每个桶的极值，再在桶内定位极值的下标
+    bucket = np.repeat(np.arange(n_buckets), np.diff(np.append(starts, n)))
+    mins = np.minimum.reduceat(y, starts)[bucket]
+    maxs = np.maximum.reduceat(y, starts)[bucket]
+    positions = np.arange(n)
+    first_min = np.minimum.reduceat(np.where(y == mins, positions, n), starts)
+    first_max = np.minimum.reduceat(np.where(y == maxs, positions, n), starts)
+    return np.unique(np.concatenate([first_min, first_max]))
+
+def downsample_indices(x, y, max_points=DEFAULT_MAX_POINTS, method='lttb'):
+    """
+    计算降采样后保留的下标
+
+    Args:
+        x: X值数组（数值）
+        y: Y值数组
+        max_points: 最多保留的点数（None或0表示不降采样）
+        method: 'lttb' 或 'minmax'
+
+    Returns:
+        ndarray: 保留点的下标
+    """
+    if not max_points or len(y) <= max_points:
+        return np.arange(len(y))
+    if method == 'minmax':
+        return minmax_indices(y, max_points)
+    if method == 'lttb':
+        return lttb_indices(x, y, max_points)
+    raise ValueError(f"未知的降采样方法: {method}")
+
+def downsample_series(series, max_points=DEFAULT_MAX_POINTS, method='lttb'):
+    """
+    对以日期（或数值）为索引的Series降采样
+
+    Args:
+        series: 数值Series（索引为DatetimeIndex或数值索引）
+        max_points: 最多保留的点数（None或0表示不降采样）
+        method: 'lttb' 或 'minmax'
+
+    Returns:
+        Series: 降采样后的Series
+    """
+    index = series.index
+    if isinstance(index, pd.DatetimeIndex):
+        x = index.asi8.astype(np.float64)
+    else:
+        x = np.arange(len(series), dtype=np.float64)
+    return series.iloc[downsample_indices(x, series.to_numpy(dtype=np.float64), max_points, method)]
+
+def save_series_sidecar(output_path, arrays):
+    """
+    将图表序列保存为二进制数组旁路文件（.npz），代替JSON中逐点的字典
+
+    Args:
+        output_path: 旁路文件路径
+        arrays: {名称: ndarray}，日期使用datetime64
+
+    Returns:
+        Path: 旁路文件路径
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        np.savez(f, **arrays)
+    return output_path
+
+def load_series_sidecar(sidecar_path):
+    """
+    读取二进制数组旁路文件
+
+    Args:
+        sidecar_path: .npz文件路径
+
+    Returns:
+        dict: {名称: ndarray}
+    """
+    with np.load(sidecar_path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
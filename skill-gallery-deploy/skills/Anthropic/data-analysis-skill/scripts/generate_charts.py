@@ -5,17 +5,55 @@
 """
 
 import sys
+import os
 import json
+import time
+import pickle
+import hashlib
 import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')  # 使用非交互式后端
 import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
 from pathlib import Path
 
+from dataset_cache import load_analysis_dataset
+from downsample import DEFAULT_MAX_POINTS, downsample_series, load_series_sidecar
+
 # 设置中文字体支持
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
+# 图表样式版本，修改绘图代码后递增，使已有图表的哈希失效
+CHART_STYLE_VERSION = 1
+CHART_MANIFEST = '.chart_manifest.json'
+
+# 每个进程内按尺寸复用的Figure（不经过pyplot，避免全局状态和重复创建）
+_FIGURES = {}
+
+def _get_axes(figsize):
+    """
+    获取指定尺寸的Figure和Axes，同一进程内复用Figure对象（clear后重新添加坐标轴）
+
+    Args:
+        figsize: 图表尺寸 (宽, 高)
+
+    Returns:
+        tuple: (fig, ax)
+    """
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        fig = _FIGURES[figsize] = Figure(figsize=figsize)
+    else:
+        fig.clear()
+    return fig, fig.add_subplot()
+
+def _save_figure(fig, output_path):
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=300, bbox_inches='tight')
+
 def load_json(file_path):
     """加载JSON分析结果"""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -32,7 +70,7 @@ def create_line_chart(data, x_column, y_column, output_path, title=None):
         output_path: 输出路径
         title: 图表标题
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _get_axes((12, 6))
 
     # 从数据中提取值
     x_values = list(data.keys())
@@ -46,11 +84,8 @@ def create_line_chart(data, x_column, y_column, output_path, title=None):
         ax.set_title(title, fontsize=14, fontweight='bold')
 
     ax.grid(True, alpha=0.3)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    ax.tick_params(axis='x', labelrotation=45)
+    _save_figure(fig, output_path)
 
 def create_bar_chart(data, x_column, y_column, output_path, title=None):
     """
@@ -63,7 +98,7 @@ def create_bar_chart(data, x_column, y_column, output_path, title=None):
         output_path: 输出路径
         title: 图表标题
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _get_axes((12, 6))
 
     # 从数据中提取值
     x_values = list(data.keys())
@@ -84,11 +119,8 @@ def create_bar_chart(data, x_column, y_column, output_path, title=None):
         ax.set_title(title, fontsize=14, fontweight='bold')
 
     ax.grid(True, axis='y', alpha=0.3)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    ax.tick_params(axis='x', labelrotation=45)
+    _save_figure(fig, output_path)
 
 def create_scatter_plot(x_data, y_data, x_label, y_label, output_path, title=None):
     """
@@ -102,7 +134,7 @@ def create_scatter_plot(x_data, y_data, x_label, y_label, output_path, title=Non
         output_path: 输出路径
         title: 图表标题
     """
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = _get_axes((10, 8))
 
     ax.scatter(x_data, y_data, alpha=0.6, s=50, edgecolors='blue', linewidths=0.5)
 
@@ -112,10 +144,7 @@ def create_scatter_plot(x_data, y_data, x_label, y_label, output_path, title=Non
         ax.set_title(title, fontsize=14, fontweight='bold')
 
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, output_path)
 
 def create_box_plot(data, output_path, title=None):
     """
@@ -126,7 +155,7 @@ def create_box_plot(data, output_path, title=None):
         output_path: 输出路径
         title: 图表标题
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _get_axes((12, 6))
 
     # 准备数据
     labels = list(data.keys())
@@ -144,43 +173,71 @@ def create_box_plot(data, output_path, title=None):
         ax.set_title(title, fontsize=14, fontweight='bold')
 
     ax.grid(True, axis='y', alpha=0.3)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=45)
+    _save_figure(fig, output_path)
 
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+def _chart_task(renderer, output_path, *args, title=None):
+    """图表任务：渲染函数名、输出路径和参数（可pickle，可在工作进程中执行）"""
+    return {'renderer': renderer, 'path': str(output_path), 'args': args, 'title': title}
 
-def generate_trend_charts(trend_data, output_dir):
+def _line_points(data, max_points=DEFAULT_MAX_POINTS):
     """
-    生成趋势分析图表
+    整理折线图数据：日期字符串键转为日期（按时间轴绘制，而不是逐个分类标签），
+    点数超过上限时按LTTB降采样（兼容未降采样的旧结果）
+    """
+    keys = pd.to_datetime(pd.Index(list(data.keys())), errors='coerce')
+    if keys.isna().any():
+        keys = pd.Index(list(data.keys()))
+    series = pd.Series(list(data.values()), index=keys, dtype=float)
+    if len(series) > max_points:
+        series = downsample_series(series, max_points)
+    return dict(zip(series.index, series.tolist()))
+
+def _sidecar_points(dates, values):
+    """旁路文件中的日期和值数组转为 {日期: 值} 字典"""
+    return dict(zip(pd.DatetimeIndex(dates), values.tolist()))
+
+def trend_chart_tasks(trend_data, output_dir):
+    """
+    构建趋势分析图表任务
 
     Args:
         trend_data: 趋势分析结果
         output_dir: 输出目录
 
     Returns:
-        list: 生成的图表路径列表
+        list: 图表任务列表
     """
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    tasks = []
 
-    chart_files = []
+    # 逐点序列保存在二进制旁路文件中时，从.npz读取
+    sidecar = trend_data.get('series_sidecar') or {}
+    arrays = load_series_sidecar(sidecar['path']) \
+        if sidecar.get('path') and Path(sidecar['path']).exists() else {}
 
     # 1. 移动平均图
-    if 'moving_average' in trend_data:
-        chart_path = output_path / 'moving_average.png'
+    if 'moving_average_values' in arrays:
+        tasks.append(_chart_task(
+            'line', output_path / 'moving_average.png',
+            _sidecar_points(arrays['moving_average_dates'], arrays['moving_average_values']),
+            '日期', f'{trend_data["value_column"]} (移动平均{trend_data["period"]}天)',
+            title='移动平均趋势'))
+    elif 'moving_average' in trend_data:
         ma_data = trend_data['moving_average']
-        date_col = list(ma_data.keys())
-        value_col = [v[trend_data['value_column']] for v in ma_data.values()]
-
-        create_line_chart({k: v[trend_data['value_column']] for k, v in ma_data.items()},
-                       '日期', f'{trend_data["value_column"]} (移动平均{trend_data["period"]}天)',
-                       str(chart_path), '移动平均趋势')
-        chart_files.append(str(chart_path))
+        tasks.append(_chart_task(
+            'line', output_path / 'moving_average.png',
+            _line_points({k: v[trend_data['value_column']] for k, v in ma_data.items()}),
+            '日期', f'{trend_data["value_column"]} (移动平均{trend_data["period"]}天)',
+            title='移动平均趋势'))
 
     # 2. 增长率图
-    if 'growth_rate' in trend_data and 'values' in trend_data['growth_rate']:
-        chart_path = output_path / 'growth_rate.png'
+    if 'growth_rate_values' in arrays:
+        tasks.append(_chart_task(
+            'line', output_path / 'growth_rate.png',
+            _sidecar_points(arrays['growth_rate_dates'], arrays['growth_rate_values']),
+            '日期', '增长率 (%)', title='增长率变化'))
+    elif 'growth_rate' in trend_data and 'values' in trend_data['growth_rate']:
         growth_data = trend_data['growth_rate']['values']
         date_col = list(growth_data.keys())
         value_col = list(growth_data.values())
@@ -190,14 +247,14 @@ def generate_trend_charts(trend_data, output_dir):
         growth_df['value'] = pd.to_numeric(growth_df['value'], errors='coerce')
         growth_df = growth_df.dropna()
 
-        create_line_chart(dict(zip(growth_df['date'], growth_df['value'])),
-                       '日期', '增长率 (%)', str(chart_path), '增长率变化')
-        chart_files.append(str(chart_path))
+        tasks.append(_chart_task(
+            'line', output_path / 'growth_rate.png',
+            _line_points(dict(zip(growth_df['date'], growth_df['value']))),
+            '日期', '增长率 (%)', title='增长率变化'))
 
     # 3. 季节性图
     if 'seasonality' in trend_data:
         # 周期性图表
-        chart_path = output_path / 'seasonality.png'
         seasonality = trend_data['seasonality']['day_of_week']
         if seasonality:
             day_names = ['周一', '周二', '周三', '周四', '周五', '周六', '周日']
@@ -206,66 +263,98 @@ def generate_trend_charts(trend_data, output_dir):
             else:
                 values = [v for v in seasonality.values()]
 
-            create_bar_chart(dict(zip(day_names, values)),
-                          '星期', trend_data['value_column'],
-                          str(chart_path), '周周期性')
-            chart_files.append(str(chart_path))
+            tasks.append(_chart_task(
+                'bar', output_path / 'seasonality.png',
+                dict(zip(day_names, values)), '星期', trend_data['value_column'],
+                title='周周期性'))
 
-    return chart_files
+    return tasks
 
-def generate_stats_charts(stats_data, output_dir):
+def stats_chart_tasks(stats_data, output_dir):
     """
-    生成统计图表
+    构建统计图表任务
 
     Args:
         stats_data: 统计分析结果
         output_dir: 输出目录
 
     Returns:
-        list: 生成的图表路径列表
+        list: 图表任务列表
     """
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    chart_files = []
+    tasks = []
     statistics = stats_data.get('statistics', {})
 
     if not statistics:
-        return chart_files
+        return tasks
 
     # 1. 均值对比图
-    chart_path = output_path / 'mean_comparison.png'
     mean_values = {col: stats['mean'] for col, stats in statistics.items()}
-
-    create_bar_chart(mean_values, '列名', '均值',
-                   str(chart_path), '各列均值对比')
-    chart_files.append(str(chart_path))
+    tasks.append(_chart_task('bar', output_path / 'mean_comparison.png',
+                             mean_values, '列名', '均值', title='各列均值对比'))
 
     # 2. 标准差对比图
-    chart_path = output_path / 'std_comparison.png'
     std_values = {col: stats['std'] for col, stats in statistics.items()}
-
-    create_bar_chart(std_values, '列名', '标准差',
-                   str(chart_path), '各列标准差对比')
-    chart_files.append(str(chart_path))
+    tasks.append(_chart_task('bar', output_path / 'std_comparison.png',
+                             std_values, '列名', '标准差', title='各列标准差对比'))
 
     # 3. 箱线图
     if len(statistics) > 1:
         chart_path = output_path / 'distribution.png'
-        box_data = {}
-        for col, stats in statistics.items():
-            # 使用样本数据模拟（简化）
-            box_data[col] = [stats['min'], stats['q25'], stats['median'],
-                          stats['q75'], stats['max']]
+        df, is_full = load_analysis_dataset(stats_data, list(statistics.keys())) \
+            if stats_data.get('dataset_cache') else (None, False)
+
+        if is_full:
+            # 有完整数据集缓存时，直接使用真实数据绘制箱线图
+            box_data = {col: df[col].dropna().to_numpy(dtype=float)
+                        for col in statistics if col in df.columns}
+            tasks.append(_chart_task('box', chart_path, box_data, title='数据分布'))
+        else:
+            box_data = {}
+            for col, stats in statistics.items():
+                # 使用样本数据模拟（简化）
+                box_data[col] = [stats['min'], stats['q25'], stats['median'],
+                              stats['q75'], stats['max']]
+
+            tasks.append(_chart_task('box_from_stats', chart_path, box_data, title='数据分布'))
+
+    return tasks
+
+def generate_trend_charts(trend_data, output_dir, jobs=1, force=False):
+    """
+    生成趋势分析图表
+
+    Args:
+        trend_data: 趋势分析结果
+        output_dir: 输出目录
+        jobs: 并行渲染的进程数
+        force: 是否忽略哈希强制重新渲染
 
-        create_box_chart_from_stats(box_data, str(chart_path), '数据分布')
-        chart_files.append(str(chart_path))
+    Returns:
+        list: 生成的图表路径列表
+    """
+    results = render_charts(trend_chart_tasks(trend_data, output_dir), output_dir, jobs, force)
+    return [r['path'] for r in results]
+
+def generate_stats_charts(stats_data, output_dir, jobs=1, force=False):
+    """
+    生成统计图表
+
+    Args:
+        stats_data: 统计分析结果
+        output_dir: 输出目录
+        jobs: 并行渲染的进程数
+        force: 是否忽略哈希强制重新渲染
 
-    return chart_files
+    Returns:
+        list: 生成的图表路径列表
+    """
+    results = render_charts(stats_chart_tasks(stats_data, output_dir), output_dir, jobs, force)
+    return [r['path'] for r in results]
 
 def create_box_chart_from_stats(stats_dict, output_path, title=None):
     """从统计指标创建简化的箱线图"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _get_axes((12, 6))
 
     labels = list(stats_dict.keys())
     values = list(stats_dict.values())
@@ -287,17 +376,94 @@ def create_box_chart_from_stats(stats_dict, output_path, title=None):
         ax.set_title(title, fontsize=14, fontweight='bold')
 
     ax.grid(True, axis='y', alpha=0.3)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=45)
+    _save_figure(fig, output_path)
+
+CHART_RENDERERS = {
+    'line': create_line_chart,
+    'bar': create_bar_chart,
+    'scatter': create_scatter_plot,
+    'box': create_box_plot,
+    'box_from_stats': create_box_chart_from_stats
+}
+
+def chart_task_hash(task):
+    """图表输入数据的哈希（含渲染函数、参数和样式版本）"""
+    payload = (CHART_STYLE_VERSION, task['renderer'], task['args'], task['title'])
+    return hashlib.sha256(pickle.dumps(payload, protocol=4)).hexdigest()
+
+def _init_worker():
+    """工作进程初始化：预先创建Figure并渲染一次，完成字体加载等一次性开销"""
+    fig, ax = _get_axes((12, 6))
+    ax.set_title('预热')
+    fig.canvas.draw()
+
+def _render_task(task):
+    """在当前进程中渲染一个图表任务，返回耗时（秒）"""
+    start = time.perf_counter()
+    CHART_RENDERERS[task['renderer']](*task['args'], task['path'], title=task['title'])
+    return time.perf_counter() - start
+
+def render_charts(tasks, output_dir, jobs=1, force=False):
+    """
+    渲染图表任务
+
+    输入数据哈希与上次渲染相同且图表文件存在时跳过；其余任务在进程池中并行渲染，
+    每个工作进程保持matplotlib已导入并复用Figure对象。
 
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    Args:
+        tasks: 图表任务列表
+        output_dir: 输出目录（哈希清单保存在该目录下）
+        jobs: 并行进程数（None表示CPU核数，1表示在当前进程渲染）
+        force: 是否忽略哈希强制重新渲染
+
+    Returns:
+        list: 每个图表的 {'path', 'seconds', 'skipped'}
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    manifest_file = output_path / CHART_MANIFEST
+    try:
+        manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        manifest = {}
+
+    results = []
+    pending = []
+    for task in tasks:
+        digest = chart_task_hash(task)
+        name = Path(task['path']).name
+        result = {'path': task['path'], 'seconds': 0.0, 'skipped': False}
+        if not force and manifest.get(name) == digest and Path(task['path']).exists():
+            result['skipped'] = True
+        else:
+            pending.append((task, result, name, digest))
+        results.append(result)
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(pending))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+            timings = list(executor.map(_render_task, [item[0] for item in pending]))
+    else:
+        timings = [_render_task(item[0]) for item in pending]
+
+    for (task, result, name, digest), seconds in zip(pending, timings):
+        result['seconds'] = seconds
+        manifest[name] = digest
+    if pending:
+        manifest_file.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    return results
 
 def main():
     # 解析命令行参数
     input_path = sys.argv[1] if len(sys.argv) > 1 else None
     output_dir = sys.argv[2] if len(sys.argv) > 2 else 'charts'
     chart_type = None
+    jobs = None
+    force = False
 
     # 解析参数
     i = 3
@@ -305,12 +471,18 @@ def main():
         if sys.argv[i] == '--type' and i + 1 < len(sys.argv):
             chart_type = sys.argv[i + 1]
             i += 2
+        elif sys.argv[i] == '--jobs' and i + 1 < len(sys.argv):
+            jobs = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--force':
+            force = True
+            i += 1
         else:
             i += 1
 
     if not input_path:
         print("错误: 请指定输入文件")
-        print("用法: python generate_charts.py --input <file> --output <dir> [--type <type>]")
+        print("用法: python generate_charts.py --input <file> --output <dir> [--type <type>] [--jobs <n>] [--force]")
         sys.exit(1)
 
     print(f"📊 生成图表")
@@ -320,22 +492,23 @@ def main():
     # 加载数据
     data = load_json(input_path)
 
-    chart_files = []
+    results = []
+    start = time.perf_counter()
 
     # 根据数据类型生成图表
-    if 'moving_average' in data or 'growth_rate' in data:
+    if 'moving_average' in data or 'growth_rate' in data or 'series_sidecar' in data:
         # 趋势分析数据
-        chart_files = generate_trend_charts(data, output_dir)
-        print(f"✓ 生成趋势分析图表: {len(chart_files)} 个")
+        results = render_charts(trend_chart_tasks(data, output_dir), output_dir, jobs, force)
+        print(f"✓ 生成趋势分析图表: {len(results)} 个")
     elif 'statistics' in data:
         # 统计分析数据
-        chart_files = generate_stats_charts(data, output_dir)
-        print(f"✓ 生成统计图表: {len(chart_files)} 个")
+        results = render_charts(stats_chart_tasks(data, output_dir), output_dir, jobs, force)
+        print(f"✓ 生成统计图表: {len(results)} 个")
 
-    print(f"\n图表列表:")
-    for chart_file in chart_files:
-        print(f"  - {chart_file}")
+    print(f"\n图表列表（总耗时 {time.perf_counter() - start:.2f}s）:")
+    for result in results:
+        status = '未变化，跳过' if result['skipped'] else f"{result['seconds']:.2f}s"
+        print(f"  - {result['path']} ({status})")
 
 if __name__ == '__main__':
-    import pandas as pd
     main()
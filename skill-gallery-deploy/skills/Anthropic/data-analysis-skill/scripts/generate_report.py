@@ -127,7 +127,8 @@ def generate_markdown_report(data, charts_dir=None, output_path='report.md'):
         if 'anomalies' in data:
             anomalies = data['anomalies']
             md.append(f"### 异常值检测\n\n")
-            md.append(f"检测到 **{anomalies['count']}** 个异常值 (Z-score > {anomalies['threshold']})\n\n")
+            score_name = 'Z-score' if anomalies.get('method', 'zscore') == 'zscore' else '滚动稳健Z-score'
+            md.append(f"检测到 **{anomalies['count']}** 个异常值 ({score_name} > {anomalies['threshold']})\n\n")
 
         # 季节性
         if 'seasonality' in data:
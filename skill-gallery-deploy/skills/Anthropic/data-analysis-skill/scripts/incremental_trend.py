@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+增量趋势分析模块
+持久化趋势分析的运行状态（回归累加和、移动平均窗口、Welford矩、季节性分桶累加器），
+追加新数据时只处理新增行，结果格式与trend_analysis.analyze_trend一致
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from downsample import DEFAULT_MAX_POINTS
+from streaming_stats import MomentAccumulator
+
+STATE_VERSION = 1
+
+# 季节性分桶：名称 -> (桶数, 从DatetimeIndex取桶号的函数, 桶号偏移)
+SEASONALITY_BUCKETS = {
+    'day_of_week': (7, lambda index: index.dayofweek, 0),
+    'day_of_month': (31, lambda index: index.day, 1),
+    'month': (12, lambda index: index.month, 1)
+}
+
+def _moments_to_dict(acc):
+    return {name: getattr(acc, name).tolist() for name in ('n', 'mean', 'm2', 'm3', 'm4', 'min', 'max')}
+
+def _moments_from_dict(data):
+    acc = MomentAccumulator(1)
+    for name, values in data.items():
+        setattr(acc, name, np.asarray(values, dtype=np.float64))
+    return acc
+
+class TrendState:
+    """
+    趋势分析的可持久化运行状态
+
+    每次update只处理新增的数据点：线性回归使用 Σy、Σxy 累加和（x为位置序号，Σx、Σx²有闭式解），
+    移动平均保留最近 period-1 个值的窗口，z-score和增长率统计使用Welford/Chan矩累加器，
+    季节性按桶累加和与计数。图表序列只保留最近 max_points 个点。
+
+    Args:
+        value_column: 值列名
+        period: 移动平均周期
+        threshold: 异常值z-score阈值
+        max_points: 保留的最近图表序列点数
+    """
+
+    def __init__(self, value_column, period=7, threshold=2, max_points=DEFAULT_MAX_POINTS):
+        self.value_column = value_column
+        self.period = period
+        self.threshold = threshold
+        self.max_points = max_points
+        self.n = 0
+        self.first_date = None
+        self.last_date = None
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        self.window = deque(maxlen=max(period - 1, 1))
+        self.values = MomentAccumulator(1)
+        self.growth = MomentAccumulator(1)
+        self.anomaly_indices = []
+        self.anomaly_values = []
+        self.season_sums = {name: np.zeros(size) for name, (size, _, _) in SEASONALITY_BUCKETS.items()}
+        self.season_counts = {name: np.zeros(size) for name, (size, _, _) in SEASONALITY_BUCKETS.items()}
+        self.recent_ma = deque(maxlen=max_points)
+        self.recent_growth = deque(maxlen=max_points)
+
+    def update(self, series):
+        """
+        追加新数据点
+
+        Args:
+            series: 以日期为索引、按日期排序的数值Series；不晚于已处理的最后日期的点会被忽略
+
+        Returns:
+            int: 实际追加的点数
+        """
+        series = series.dropna()
+        if self.last_date is not None:
+            series = series[series.index > pd.Timestamp(self.last_date)]
+        m = len(series)
+        if m == 0:
+            return 0
+
+        y = series.to_numpy(dtype=np.float64)
+        index = series.index
+        x = np.arange(self.n, self.n + m, dtype=np.float64)
+
+        # 线性回归累加和
+        self.sum_y += float(y.sum())
+        self.sum_xy += float(x @ y)
+
+        # 移动平均：窗口缓冲 + 新值，用累积和一次求出新点的窗口均值
+        history = np.asarray(self.window, dtype=np.float64)
+        combined = np.concatenate([history, y])
+        if self.n + m >= self.period:
+            csum = np.concatenate([[0.0], np.cumsum(combined)])
+            ma = (csum[self.period:] - csum[:-self.period]) / self.period
+            self.recent_ma.extend(zip([str(k) for k in index[-len(ma):]], ma.tolist()))
+
+        # 环比增长率：上一个值 + 新值
+        prev = np.concatenate([history[-1:], y[:-1]]) if len(history) else y[:-1]
+        current = y[len(y) - len(prev):]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = (current - prev) / prev * 100
+        finite = np.isfinite(growth)
+        self.growth.update(growth[finite])
+        growth_dates = [str(k) for k in index[len(y) - len(prev):]]
+        self.recent_growth.extend((d, g) for d, g, ok in zip(growth_dates, growth.tolist(), finite) if ok)
+        self.window.extend(y.tolist())
+
+        # Welford矩：先并入新值，再用更新后的均值和总体标准差对新点计算z-score
+        self.values.update(y)
+        mean = float(self.values.mean[0])
+        std = float(np.sqrt(self.values.m2[0] / self.values.n[0]))
+        if std > 0:
+            flagged = np.flatnonzero(np.abs((y - mean) / std) > self.threshold)
+            self.anomaly_indices.extend((flagged + self.n).tolist())
+            self.anomaly_values.extend(y[flagged].tolist())
+
+        # 季节性分桶累加
+        for name, (size, bucket_of, offset) in SEASONALITY_BUCKETS.items():
+            buckets = np.asarray(bucket_of(index)) - offset
+            self.season_sums[name] += np.bincount(buckets, weights=y, minlength=size)
+            self.season_counts[name] += np.bincount(buckets, minlength=size)
+
+        if self.first_date is None:
+            self.first_date = str(index[0])
+        self.last_date = str(index[-1])
+        self.n += m
+        return m
+
+    def trend_line(self):
+        """由累加和计算线性趋势线（与scipy.stats.linregress一致）"""
+        n = self.n
+        mean_x = (n - 1) / 2.0
+        mean_y = self.sum_y / n
+        sxx = n * (n * n - 1) / 12.0
+        sxy = self.sum_xy - n * mean_x * mean_y
+        syy = float(self.values.m2[0])
+        slope = sxy / sxx
+        intercept = mean_y - slope * mean_x
+        r = sxy / np.sqrt(sxx * syy) if syy > 0 else 0.0
+        r = float(np.clip(r, -1.0, 1.0))
+        if n > 2 and abs(r) < 1:
+            t = r * np.sqrt((n - 2) / (1 - r * r))
+            p_value = float(2 * stats.t.sf(abs(t), n - 2))
+        else:
+            p_value = 0.0
+        # 趋势为直线，只输出首尾两点（trend_index为原序列中的位置）
+        return {
+            'trend': [float(intercept), float(intercept + slope * (n - 1))],
+            'trend_index': [0, n - 1],
+            'slope': float(slope),
+            'intercept': float(intercept),
+            'r_squared': r * r,
+            'p_value': p_value
+        }
+
+    def seasonality(self):
+        """各季节性分桶的均值，格式与analyze_seasonality一致"""
+        result = {}
+        for name, (size, _, offset) in SEASONALITY_BUCKETS.items():
+            counts = self.season_counts[name]
+            result[name] = {int(i + offset): {self.value_column: float(self.season_sums[name][i] / counts[i])}
+                            for i in np.flatnonzero(counts)}
+        return result
+
+    def results(self, date_column):
+        """
+        Args:
+            date_column: 日期列名
+
+        Returns:
+            dict: 趋势分析结果（移动平均和增长率逐点序列为最近 max_points 个点）
+        """
+        growth = self.growth.results()
+        results = {
+            'date_column': date_column,
+            'value_column': self.value_column,
+            'period': self.period,
+            'data_points': self.n,
+            'date_range': {'start': self.first_date, 'end': self.last_date}
+        }
+        if self.recent_ma:
+            results['moving_average'] = {d: {self.value_column: v} for d, v in self.recent_ma}
+        results['growth_rate'] = {
+            'mean': float(growth['mean'][0]),
+            'std': float(growth['std'][0]),
+            'max': float(growth['max'][0]),
+            'min': float(growth['min'][0]),
+            'values': dict(self.recent_growth)
+        }
+        if self.n >= 3:
+            results['trend_line'] = self.trend_line()
+        results['anomalies'] = {
+            'count': len(self.anomaly_indices),
+            'indices': list(self.anomaly_indices),
+            'values': list(self.anomaly_values),
+            'threshold': self.threshold
+        }
+        if self.n >= 30:
+            results['seasonality'] = self.seasonality()
+        return results
+
+    def to_dict(self):
+        return {
+            'version': STATE_VERSION,
+            'value_column': self.value_column,
+            'period': self.period,
+            'threshold': self.threshold,
+            'max_points': self.max_points,
+            'n': self.n,
+            'first_date': self.first_date,
+            'last_date': self.last_date,
+            'sum_y': self.sum_y,
+            'sum_xy': self.sum_xy,
+            'window': list(self.window),
+            'values': _moments_to_dict(self.values),
+            'growth': _moments_to_dict(self.growth),
+            'anomaly_indices': self.anomaly_indices,
+            'anomaly_values': self.anomaly_values,
+            'season_sums': {k: v.tolist() for k, v in self.season_sums.items()},
+            'season_counts': {k: v.tolist() for k, v in self.season_counts.items()},
+            'recent_ma': list(self.recent_ma),
+            'recent_growth': list(self.recent_growth)
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls(data['value_column'], data['period'], data['threshold'], data['max_points'])
+        for name in ('n', 'first_date', 'last_date', 'sum_y', 'sum_xy', 'anomaly_indices', 'anomaly_values'):
+            setattr(state, name, data[name])
+        state.window.extend(data['window'])
+        state.values = _moments_from_dict(data['values'])
+        state.growth = _moments_from_dict(data['growth'])
+        state.season_sums = {k: np.asarray(v) for k, v in data['season_sums'].items()}
+        state.season_counts = {k: np.asarray(v) for k, v in data['season_counts'].items()}
+        state.recent_ma.extend(tuple(item) for item in data['recent_ma'])
+        state.recent_growth.extend(tuple(item) for item in data['recent_growth'])
+        return state
+
+    def save(self, state_path):
+        """写入状态文件（先写临时文件再替换）"""
+        state_path = Path(state_path)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = state_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.to_dict(), ensure_ascii=False), encoding='utf-8')
+        tmp_path.replace(state_path)
+        return state_path
+
+def load_state(state_path, value_column, period=7, threshold=2, max_points=DEFAULT_MAX_POINTS):
+    """
+    加载状态文件；文件不存在、版本或参数不一致时返回新的空状态
+
+    Returns:
+        TrendState: 运行状态
+    """
+    state_path = Path(state_path)
+    if state_path.exists():
+        try:
+            data = json.loads(state_path.read_text(encoding='utf-8'))
+        except ValueError:
+            data = None
+        if (data and data.get('version') == STATE_VERSION and data['value_column'] == value_column
+                and data['period'] == period and data['threshold'] == threshold):
+            return TrendState.from_dict(data)
+    return TrendState(value_column, period, threshold, max_points)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+分块（超出内存）执行模块
+按行块读取CSV/Parquet/xlsx，用可合并的部分聚合量完成数据画像、清洗和分组聚合
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from streaming_stats import KLLSketch, MomentAccumulator
+from xlsx_reader import iter_xlsx_chunks
+
+DEFAULT_CHUNK_ROWS = 200000
+MISSING_TEXT = '无数据'
+
+def is_date_column_name(col):
+    """按列名判断是否为日期列（与clean_data的规则一致）"""
+    col_lower = str(col).lower()
+    return 'date' in col_lower or '日期' in col_lower or '时间' in col_lower
+
+def quick_file_hash(file_path, sample_bytes=1 << 20):
+    """
+    大文件的快速指纹：文件大小、修改时间以及首尾各1MB内容的哈希
+
+    Args:
+        file_path: 文件路径
+        sample_bytes: 首尾采样字节数
+
+    Returns:
+        str: 十六进制哈希值
+    """
+    stat = os.stat(file_path)
+    h = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with open(file_path, 'rb') as f:
+        h.update(f.read(sample_bytes))
+        if stat.st_size > sample_bytes:
+            f.seek(max(stat.st_size - sample_bytes, sample_bytes))
+            h.update(f.read(sample_bytes))
+    return h.hexdigest()
+
+def iter_source_chunks(file_path, chunk_rows=DEFAULT_CHUNK_ROWS, sheet_name=None, columns=None):
+    """
+    按行块读取数据文件
+
+    Args:
+        file_path: .csv/.tsv/.parquet/.feather/.arrow/.xlsx/.xlsm 文件
+        chunk_rows: 每块行数
+        sheet_name: 工作表名称（仅xlsx）
+        columns: 要读取的列（可选）
+
+    Yields:
+        DataFrame: 数据块
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix in ('.csv', '.tsv', '.txt'):
+        sep = '\t' if suffix == '.tsv' else ','
+        yield from pd.read_csv(file_path, sep=sep, usecols=columns, chunksize=chunk_rows)
+    elif suffix == '.parquet':
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    elif suffix in ('.feather', '.arrow'):
+        from dataset_cache import iter_dataset_batches
+
+        yield from iter_dataset_batches(file_path, columns)
+    elif suffix in ('.xlsx', '.xlsm'):
+        for chunk in iter_xlsx_chunks(file_path, sheet_name, usecols=columns, chunk_size=chunk_rows):
+            yield pd.DataFrame(chunk)
+    else:
+        raise ValueError(f"分块模式不支持的文件格式: {suffix}")
+
+def _column_kind(series):
+    if is_date_column_name(series.name) or pd.api.types.is_datetime64_any_dtype(series):
+        return 'datetime'
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return 'numeric'
+    return 'string'
+
+class DatasetProfile:
+    """
+    可合并的数据集画像：行数、各列缺失值计数、列类型以及数值列的矩和近似中位数
+
+    各数据块分别profile后merge，结果与块的划分方式无关（中位数为KLL近似值）。
+
+    Args:
+        numeric_stats: 是否累积数值列的矩和分位数草图（仅需计数时可关闭）
+    """
+
+    def __init__(self, numeric_stats=True):
+        self.numeric_stats = numeric_stats
+        self.rows = 0
+        self.columns = []
+        self.kinds = {}
+        self.missing = {}
+        self.moments = {}
+        self.quantiles = {}
+
+    def update(self, chunk):
+        """并入一个数据块"""
+        self.rows += len(chunk)
+        for col in chunk.columns:
+            series = chunk[col]
+            if col not in self.kinds:
+                self.columns.append(col)
+                self.kinds[col] = _column_kind(series)
+                self.missing[col] = 0
+            elif self.kinds[col] == 'numeric' and _column_kind(series) == 'string' and series.notna().any():
+                # 后续块中出现非数值内容，整列降级为字符列
+                self.kinds[col] = 'string'
+            self.missing[col] += int(series.isna().sum())
+
+            if self.numeric_stats and self.kinds[col] == 'numeric':
+                values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                self.moments.setdefault(col, MomentAccumulator(1)).update(values)
+                self.quantiles.setdefault(col, KLLSketch()).update(values)
+        return self
+
+    def merge(self, other):
+        """合并另一个画像"""
+        self.rows += other.rows
+        for col in other.columns:
+            if col not in self.kinds:
+                self.columns.append(col)
+                self.kinds[col] = other.kinds[col]
+                self.missing[col] = 0
+            elif other.kinds[col] == 'string':
+                self.kinds[col] = 'string'
+            self.missing[col] += other.missing[col]
+            if col in other.moments:
+                if col in self.moments:
+                    self.moments[col].merge(other.moments[col])
+                    self.quantiles[col].merge(other.quantiles[col])
+                else:
+                    self.moments[col] = other.moments[col]
+                    self.quantiles[col] = other.quantiles[col]
+        return self
+
+    def medians(self):
+        """各数值列的近似中位数"""
+        return {col: float(self.quantiles[col].quantiles([0.5])[0])
+                for col in self.columns if self.kinds[col] == 'numeric' and col in self.quantiles}
+
+def coerce_chunk(chunk, kinds, fill_values):
+    """
+    按全局画像确定的类型清洗一个数据块，保证各块的列类型一致
+
+    Args:
+        chunk: 数据块
+        kinds: {列名: 'numeric'|'datetime'|'string'}
+        fill_values: 数值列的全局填充值（中位数）
+
+    Returns:
+        DataFrame: 清洗后的数据块
+    """
+    data = {}
+    for col, kind in kinds.items():
+        if col not in chunk.columns:
+            series = pd.Series([None] * len(chunk), index=chunk.index, dtype=object)
+        else:
+            series = chunk[col]
+        if kind == 'numeric':
+            data[col] = pd.to_numeric(series, errors='coerce').astype(np.float64).fillna(fill_values.get(col, np.nan))
+        elif kind == 'datetime':
+            data[col] = pd.to_datetime(series, errors='coerce')
+        else:
+            data[col] = series.astype(object).where(series.notna(), MISSING_TEXT).astype(str)
+    return pd.DataFrame(data, index=chunk.index)
+
+def write_chunked_dataset(chunks, cache_file):
+    """
+    将清洗后的数据块逐块写入Feather（Arrow IPC）文件，内存中始终只有一个块
+
+    Args:
+        chunks: 可迭代的DataFrame块（列类型一致）
+        cache_file: 缓存文件路径
+
+    Returns:
+        Path: 缓存文件路径
+    """
+    import pyarrow as pa
+
+    cache_file = Path(cache_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.tmp')
+
+    writer = None
+    schema = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk.reset_index(drop=True), preserve_index=False)
+            if writer is None:
+                schema = table.schema.remove_metadata()
+                writer = pa.ipc.new_file(str(tmp_file), schema)
+            writer.write_table(table.replace_schema_metadata(None).cast(schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError("数据文件为空")
+    tmp_file.replace(cache_file)
+    return cache_file
+
+class GroupByAccumulator:
+    """
+    可合并的分组聚合：按分组键累加 sum/count/min/max，可得出 sum/mean/count/min/max
+
+    Args:
+        key_column: 分组列名
+        value_columns: 值列名列表
+        key_func: 对分组键的预处理（如按天取整），可选
+    """
+
+    def __init__(self, key_column, value_columns, key_func=None):
+        self.key_column = key_column
+        self.value_columns = list(value_columns)
+        self.key_func = key_func
+        self.partial = None
+
+    def update(self, chunk):
+        """并入一个数据块的部分聚合结果"""
+        keys = chunk[self.key_column]
+        if self.key_func is not None:
+            keys = self.key_func(keys)
+        values = chunk[self.value_columns].apply(pd.to_numeric, errors='coerce')
+        grouped = values.groupby(keys.rename(self.key_column))
+        part = {'sum': grouped.sum(), 'count': grouped.count(),
+                'min': grouped.min(), 'max': grouped.max()}
+        return self._merge_partial(part)
+
+    def merge(self, other):
+        return self._merge_partial(other.partial) if other.partial is not None else self
+
+    def _merge_partial(self, part):
+        if self.partial is None:
+            self.partial = part
+            return self
+        # 各部分聚合量都可以再次按键聚合：sum/count相加，min/max取极值
+        reducers = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'}
+        self.partial = {
+            name: pd.concat([self.partial[name], part[name]]).groupby(level=0).agg(how)
+            for name, how in reducers.items()
+        }
+        return self
+
+    def result(self, agg='sum'):
+        """
+        Args:
+            agg: 'sum'、'mean'、'count'、'min' 或 'max'
+
+        Returns:
+            DataFrame: 以分组键为索引的聚合结果（已排序）
+        """
+        if self.partial is None:
+            return pd.DataFrame(columns=self.value_columns)
+        if agg == 'mean':
+            out = self.partial['sum'] / self.partial['count'].replace(0, np.nan)
+        else:
+            out = self.partial[agg]
+        return out.sort_index()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+流式统计模块
+提供可合并的统计累加器：矩（Welford/Chan合并公式）、KLL分位数草图和Misra-Gries众数，
+用于单次扫描和超出内存的数据集
+"""
+
+import numpy as np
+
+def finalize_moments(n, mean, m2, m3, m4):
+    """
+    由中心矩之和计算标准差、偏度和峰度（与pandas的无偏估计一致）
+
+    Args:
+        n: 各列有效值个数（数组）
+        mean: 各列均值
+        m2, m3, m4: 各列二、三、四阶中心矩之和
+
+    Returns:
+        tuple: (std, skewness, kurtosis) 数组
+    """
+    n = np.asarray(n, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.where(n > 1, np.sqrt(m2 / (n - 1)), np.nan)
+
+        skew = (n * np.sqrt(n - 1) / (n - 2)) * (m3 / m2 ** 1.5)
+        skew = np.where(m2 == 0, 0.0, skew)
+        skew = np.where(n < 3, np.nan, skew)
+
+        adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        kurt = n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2) - adj
+        kurt = np.where(m2 == 0, 0.0, kurt)
+        kurt = np.where(n < 4, np.nan, kurt)
+    return std, skew, kurt
+
+class MomentAccumulator:
+    """
+    按列向量化的矩累加器（计数、均值、二至四阶中心矩、最小值、最大值）
+
+    每次update处理一个二维数据块（行×列，缺失值为NaN），块内用NumPy一次算出块统计量，
+    再用Chan/Pébay合并公式并入累计值，因此可以任意分块、并行计算后merge。
+
+    Args:
+        n_columns: 列数
+    """
+
+    def __init__(self, n_columns):
+        self.n = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.m3 = np.zeros(n_columns)
+        self.m4 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, block):
+        """并入一个二维数据块"""
+        block = np.asarray(block, dtype=np.float64)
+        if block.ndim == 1:
+            block = block[:, None]
+        valid = ~np.isnan(block)
+        nb = valid.sum(axis=0).astype(np.float64)
+        if not nb.any():
+            return self
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_b = np.where(nb > 0, np.nansum(block, axis=0) / nb, 0.0)
+            d = np.where(valid, block - mean_b, 0.0)
+            d2 = d * d
+            other = MomentAccumulator(block.shape[1])
+            other.n = nb
+            other.mean = mean_b
+            other.m2 = d2.sum(axis=0)
+            other.m3 = (d2 * d).sum(axis=0)
+            other.m4 = (d2 * d2).sum(axis=0)
+            other.min = np.where(nb > 0, np.nanmin(np.where(valid, block, np.inf), axis=0), np.inf)
+            other.max = np.where(nb > 0, np.nanmax(np.where(valid, block, -np.inf), axis=0), -np.inf)
+        return self.merge(other)
+
+    def merge(self, other):
+        """合并另一个累加器（并行/分块计算的结果）"""
+        na, nb = self.n, other.n
+        n = na + nb
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta = other.mean - self.mean
+            safe_n = np.where(n > 0, n, 1.0)
+            mean = self.mean + delta * nb / safe_n
+            m2 = self.m2 + other.m2 + delta ** 2 * na * nb / safe_n
+            m3 = (self.m3 + other.m3
+                  + delta ** 3 * na * nb * (na - nb) / safe_n ** 2
+                  + 3 * delta * (na * other.m2 - nb * self.m2) / safe_n)
+            m4 = (self.m4 + other.m4
+                  + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / safe_n ** 3
+                  + 6 * delta ** 2 * (na * na * other.m2 + nb * nb * self.m2) / safe_n ** 2
+                  + 4 * delta * (na * other.m3 - nb * self.m3) / safe_n)
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def results(self):
+        """
+        Returns:
+            dict: 各统计量数组（count/mean/std/min/max/skewness/kurtosis）
+        """
+        std, skew, kurt = finalize_moments(self.n, self.mean, self.m2, self.m3, self.m4)
+        empty = self.n == 0
+        return {
+            'count': self.n.astype(np.int64),
+            'mean': np.where(empty, np.nan, self.mean),
+            'std': std,
+            'min': np.where(empty, np.nan, self.min),
+            'max': np.where(empty, np.nan, self.max),
+            'skewness': skew,
+            'kurtosis': kurt
+        }
+
+class KLLSketch:
+    """
+    KLL分位数草图：固定内存的近似分位数，可批量更新和合并
+
+    Args:
+        k: 精度参数（越大越精确，误差约为 1.65/k）
+        seed: 随机种子
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # 奇数个时保留一个在本层，其余两两取一（随机偏移）晋升到上一层，权重翻倍
+                if len(items) % 2:
+                    self.levels[level] = items[-1:]
+                    items = items[:-1]
+                else:
+                    self.levels[level] = np.empty(0)
+                offset = int(self._rng.integers(2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[offset::2]])
+            level += 1
+
+    def update(self, values):
+        """批量加入数值（忽略NaN）"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.n += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other):
+        """合并另一个草图"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for i, items in enumerate(other.levels):
+            self.levels[i] = np.concatenate([self.levels[i], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantiles(self, qs):
+        """
+        查询近似分位数
+
+        Args:
+            qs: 分位点列表（0~1）
+
+        Returns:
+            ndarray: 分位数（空草图返回NaN）
+        """
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lv), 2.0 ** i) for i, lv in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cum = items[order], np.cumsum(weights[order])
+        idx = np.searchsorted(cum, qs * cum[-1], side='left')
+        return items[np.clip(idx, 0, len(items) - 1)]
+
+class MisraGries:
+    """
+    Misra-Gries频繁项摘要，用于近似众数
+
+    Args:
+        k: 保留的候选项数量
+    """
+
+    def __init__(self, k=64):
+        self.k = k
+        self.counts = {}
+
+    def _prune(self):
+        if len(self.counts) > self.k:
+            threshold = sorted(self.counts.values(), reverse=True)[self.k]
+            self.counts = {v: c - threshold for v, c in self.counts.items() if c > threshold}
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        uniques, counts = np.unique(values, return_counts=True)
+        for v, c in zip(uniques.tolist(), counts.tolist()):
+            self.counts[v] = self.counts.get(v, 0) + c
+        self._prune()
+        return self
+
+    def merge(self, other):
+        for v, c in other.counts.items():
+            self.counts[v] = self.counts.get(v, 0) + c
+        self._prune()
+        return self
+
+    def mode(self):
+        """出现次数最多的候选值（并列时取最小值）"""
+        if not self.counts:
+            return None
+        return min(self.counts.items(), key=lambda item: (-item[1], item[0]))[0]
+
+class ColumnStatsSketch:
+    """
+    多列近似统计：矩精确累加，分位数和众数使用草图，可分块更新和合并
+
+    Args:
+        columns: 列名列表
+        k: KLL精度参数
+    """
+
+    def __init__(self, columns, k=200):
+        self.columns = list(columns)
+        self.moments = MomentAccumulator(len(self.columns))
+        self.quantile_sketches = [KLLSketch(k) for _ in self.columns]
+        self.mode_sketches = [MisraGries() for _ in self.columns]
+
+    def update(self, block):
+        """并入二维数据块（行×列，列顺序与columns一致）"""
+        block = np.asarray(block, dtype=np.float64)
+        self.moments.update(block)
+        for j in range(block.shape[1]):
+            self.quantile_sketches[j].update(block[:, j])
+            self.mode_sketches[j].update(block[:, j])
+        return self
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        for mine, theirs in zip(self.quantile_sketches, other.quantile_sketches):
+            mine.merge(theirs)
+        for mine, theirs in zip(self.mode_sketches, other.mode_sketches):
+            mine.merge(theirs)
+        return self
+
+    def results(self):
+        """
+        Returns:
+            dict: {列名: 统计指标}，格式与descriptive_stats.analyze_columns的结果一致
+        """
+        moments = self.moments.results()
+        stats = {}
+        for j, col in enumerate(self.columns):
+            q25, median, q75 = self.quantile_sketches[j].quantiles([0.25, 0.5, 0.75])
+            stats[col] = format_statistics(
+                {name: values[j] for name, values in moments.items()},
+                median, q25, q75, self.mode_sketches[j].mode()
+            )
+        return stats
+
+def format_statistics(moments, median, q25, q75, mode):
+    """将单列统计量整理为统计结果字典（descriptive_stats与streaming_stats共用）"""
+    mean = float(moments['mean'])
+    std = float(moments['std'])
+    stats = {
+        'count': int(moments['count']),
+        'mean': mean,
+        'std': std,
+        'min': float(moments['min']),
+        'max': float(moments['max']),
+        'median': float(median),
+        'q25': float(q25),
+        'q75': float(q75),
+        'range': float(moments['max'] - moments['min']),
+        'mode': None if mode is None else float(mode),
+        'skewness': float(moments['skewness']),
+        'kurtosis': float(moments['kurtosis'])
+    }
+    stats['cv'] = float(std / abs(mean)) if mean != 0 else None
+    return stats
@@ -12,6 +12,13 @@ from pathlib import Path
 from datetime import datetime
 from scipy import stats
 
+from dataset_cache import iter_dataset_batches, load_analysis_dataset
+from downsample import DEFAULT_MAX_POINTS, DOWNSAMPLE_METHODS, downsample_series, save_series_sidecar
+from anomaly_detection import ANOMALY_METHODS, detect_rolling_anomalies
+from batch_trend import analyze_trend_batch
+from incremental_trend import load_state
+from out_of_core import GroupByAccumulator, iter_source_chunks
+
 def load_json(file_path):
     """加载JSON分析结果"""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -98,26 +105,55 @@ def calculate_trend_line(df):
         'p_value': float(p_value)
     }
 
-def detect_anomalies(df, threshold=2):
+def detect_anomalies(df, threshold=None, method='zscore', window=60, season_period=None, compact=False):
     """
-    检测异常值（基于Z-score）
+    检测异常值
+
+    - zscore: 全局Z-score（默认阈值2）
+    - rolling: 滚动中位数/MAD稳健z-score，检测局部异常（默认阈值3.5）
+    - seasonal: 先减去前几个周期同相位的中位数，再对季节残差做滚动中位数/MAD（需指定season_period）
 
     Args:
         df: 时间序列DataFrame
-        threshold: Z-score阈值
+        threshold: 阈值（None表示使用方法的默认值）
+        method: 'zscore'、'rolling' 或 'seasonal'
+        window: 滚动窗口长度（rolling/seasonal）
+        season_period: 季节周期点数（seasonal）
+        compact: 为True时indices/values保持为NumPy数组（用于写入二进制旁路文件）
 
     Returns:
         dict: 异常值信息
     """
     values = df.values.flatten()
-    z_scores = np.abs(stats.zscore(values))
+
+    if method == 'zscore':
+        threshold = 2 if threshold is None else threshold
+        mask = np.abs(stats.zscore(values)) > threshold
+        indices = np.flatnonzero(mask)
+        anomaly_values = values[mask]
+        params = {}
+    elif method in ('rolling', 'seasonal'):
+        if method == 'seasonal' and not season_period:
+            raise ValueError("seasonal方法需要指定季节周期")
+        threshold = 3.5 if threshold is None else threshold
+        found = detect_rolling_anomalies(values, window, threshold,
+                                         season_period if method == 'seasonal' else None)
+        indices = found['indices']
+        anomaly_values = found['values']
+        params = {'window': window}
+        if method == 'seasonal':
+            params['season_period'] = season_period
+    else:
+        raise ValueError(f"未知的异常检测方法: {method}")
 
     anomalies = {
-        'count': int(np.sum(z_scores > threshold)),
-        'indices': np.where(z_scores > threshold)[0].tolist(),
-        'values': values[z_scores > threshold].tolist(),
-        'threshold': threshold
+        'count': int(len(indices)),
+        'indices': indices if compact else indices.tolist(),
+        'values': anomaly_values if compact else anomaly_values.tolist(),
+        'threshold': threshold,
+        'method': method
     }
+    anomalies.update(params)
 
     return anomalies
 
@@ -140,22 +176,33 @@ def analyze_seasonality(df, period=None):
 
     # 计算各周期的平均值
     seasonality = {
-        'day_of_week': df_period.groupby('day_of_week').mean().to_dict(),
-        'day_of_month': df_period.groupby('day_of_month').mean().to_dict(),
-        'month': df_period.groupby('month').mean().to_dict()
+        'day_of_week': df_period.groupby('day_of_week')[list(df.columns)].mean().to_dict('index'),
+        'day_of_month': df_period.groupby('day_of_month')[list(df.columns)].mean().to_dict('index'),
+        'month': df_period.groupby('month')[list(df.columns)].mean().to_dict('index')
     }
 
     return seasonality
 
-def analyze_trend(df, date_column, value_column, period=7):
+def analyze_trend(df, date_column, value_column, period=7, max_points=DEFAULT_MAX_POINTS,
+                  method='lttb', sidecar_path=None, anomaly_method='zscore', anomaly_window=60,
+                  season_period=None):
     """
     完整的趋势分析
 
+    汇总指标（增长率统计、趋势斜率、异常值等）始终基于全部数据计算，
+    供绘图的逐点序列（移动平均、增长率、趋势线）降采样到最多 max_points 个点。
+
     Args:
         df: DataFrame
         date_column: 日期列名
         value_column: 值列名
         period: 移动平均周期
+        max_points: 每条逐点序列最多输出的点数（None或0表示输出全部点）
+        method: 降采样方法（'lttb' 或 'minmax'）
+        sidecar_path: 二进制数组旁路文件路径（可选，指定后逐点序列和异常值下标写入.npz而不写入JSON）
+        anomaly_method: 异常检测方法（'zscore'、'rolling' 或 'seasonal'）
+        anomaly_window: 滚动异常检测的窗口长度
+        season_period: 季节残差异常检测的周期点数
 
     Returns:
         dict: 趋势分析结果
@@ -174,30 +221,75 @@ def analyze_trend(df, date_column, value_column, period=7):
         }
     }
 
+    downsampling = {'method': method, 'max_points': max_points or None, 'series': {}}
+    arrays = {}
+
+    def sample(name, values):
+        # 降采样一条逐点序列，并记录原始点数和输出点数
+        sampled = downsample_series(values, max_points, method)
+        downsampling['series'][name] = {'original_points': len(values), 'points': len(sampled)}
+        return sampled
+
     # 移动平均
     if len(df_ts) >= period:
         ma = calculate_moving_average(df_ts, period)
-        results['moving_average'] = ma.dropna().to_dict()
+        ma_points = sample('moving_average', ma[value_column].dropna())
+        if sidecar_path is None:
+            # 按日期组织（{日期: {列: 值}}），日期转为字符串以便JSON序列化
+            results['moving_average'] = {str(k): {value_column: float(v)}
+                                         for k, v in ma_points.items()}
+        else:
+            arrays['moving_average_dates'] = ma_points.index.to_numpy(dtype='datetime64[ns]')
+            arrays['moving_average_values'] = ma_points.to_numpy(dtype=np.float64)
 
     # 增长率
-    growth = calculate_growth_rate(df_ts)
+    growth = calculate_growth_rate(df_ts)[value_column]
     results['growth_rate'] = {
         'mean': float(growth.mean()),
         'std': float(growth.std()),
         'max': float(growth.max()),
-        'min': float(growth.min()),
-        'values': growth.dropna().to_dict()
+        'min': float(growth.min())
     }
+    growth_points = sample('growth_rate', growth.replace([np.inf, -np.inf], np.nan).dropna())
+    if sidecar_path is None:
+        results['growth_rate']['values'] = {str(k): float(v) for k, v in growth_points.items()}
+    else:
+        arrays['growth_rate_dates'] = growth_points.index.to_numpy(dtype='datetime64[ns]')
+        arrays['growth_rate_values'] = growth_points.to_numpy(dtype=np.float64)
 
     # 趋势线
     if len(df_ts) >= 3:
         trend_line = calculate_trend_line(df_ts)
+        # 逐点趋势值按位置降采样，trend_index记录保留点在原序列中的位置
+        trend = pd.Series(trend_line['trend'])
+        trend_points = sample('trend_line', trend)
+        if len(trend_points) < len(trend):
+            trend_line['trend'] = trend_points.tolist()
+            trend_line['trend_index'] = trend_points.index.tolist()
+        if sidecar_path is not None:
+            arrays['trend_index'] = trend_points.index.to_numpy(dtype=np.int64)
+            arrays['trend_values'] = trend_points.to_numpy(dtype=np.float64)
+            del trend_line['trend']
+            trend_line.pop('trend_index', None)
         results['trend_line'] = trend_line
 
     # 异常值检测
-    anomalies = detect_anomalies(df_ts)
+    anomalies = detect_anomalies(df_ts, method=anomaly_method, window=anomaly_window,
+                                 season_period=season_period, compact=sidecar_path is not None)
+    if sidecar_path is not None:
+        arrays['anomaly_indices'] = anomalies.pop('indices').astype(np.int64)
+        arrays['anomaly_values'] = anomalies.pop('values').astype(np.float64)
     results['anomalies'] = anomalies
 
+    results['downsampling'] = downsampling
+    if sidecar_path is not None:
+        save_series_sidecar(sidecar_path, arrays)
+        results['series_sidecar'] = {
+            'path': str(Path(sidecar_path).resolve()),
+            'format': 'npz',
+            'arrays': sorted(arrays)
+        }
+
     # 季节性分析
     if len(df_ts) >= 30:  # 至少30天数据
         seasonality = analyze_seasonality(df_ts)
@@ -205,6 +297,45 @@ def analyze_trend(df, date_column, value_column, period=7):
 
     return results
 
+def aggregate_time_series_chunked(chunks, date_column, value_column, freq='D', agg='sum'):
+    """
+    分块模式：逐块按时间粒度做部分聚合并合并，得到可放入内存的聚合时间序列
+
+    Args:
+        chunks: 可迭代的DataFrame块
+        date_column: 日期列名
+        value_column: 值列名
+        freq: 聚合粒度（pandas频率字符串，如 'D'、'W'、'M'、'h'）
+        agg: 聚合方式（sum/mean/count/min/max）
+
+    Returns:
+        DataFrame: 包含日期列和值列的聚合数据
+    """
+    accumulator = GroupByAccumulator(
+        date_column, [value_column],
+        # to_period 支持 W/M/Q 等非固定频率（dt.floor 只支持 D、h 等固定频率），取每个周期的起始时间
+        key_func=lambda s: pd.to_datetime(s, errors='coerce').dt.to_period(freq).dt.start_time
+    )
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result(agg).reset_index()
+
+def update_trend_state(state, df, date_column, value_column):
+    """
+    增量模式：把一批新数据并入趋势状态，只处理晚于已处理最后日期的行
+
+    Args:
+        state: incremental_trend.TrendState
+        df: 包含日期列和值列的DataFrame
+        date_column: 日期列名
+        value_column: 值列名
+
+    Returns:
+        int: 追加的数据点数
+    """
+    df_ts = prepare_time_series(df, date_column, value_column)
+    return state.update(df_ts[value_column])
+
 def save_json(data, output_path):
     """保存JSON结果"""
     output_file = Path(output_path)
@@ -220,6 +351,21 @@ def main():
     date_column = None
     value_column = None
     period = 7
+    chunked = False
+    freq = 'D'
+    agg = 'sum'
+    max_points = DEFAULT_MAX_POINTS
+    method = 'lttb'
+    sidecar = False
+    incremental = False
+    state_path = None
+    append_path = None
+    value_columns = None
+    group_by = None
+    jobs = None
+    anomaly_method = 'zscore'
+    anomaly_window = 60
+    season_period = None
 
     # 解析参数
     i = 3
@@ -233,40 +379,174 @@ def main():
         elif sys.argv[i] == '--period' and i + 1 < len(sys.argv):
             period = int(sys.argv[i + 1])
             i += 2
+        elif sys.argv[i] == '--chunked':
+            chunked = True
+            i += 1
+        elif sys.argv[i] == '--freq' and i + 1 < len(sys.argv):
+            freq = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--agg' and i + 1 < len(sys.argv):
+            agg = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--max-points' and i + 1 < len(sys.argv):
+            max_points = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--downsample' and i + 1 < len(sys.argv):
+            method = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--sidecar':
+            sidecar = True
+            i += 1
+        elif sys.argv[i] == '--incremental':
+            incremental = True
+            i += 1
+        elif sys.argv[i] == '--state' and i + 1 < len(sys.argv):
+            state_path = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--value-columns' and i + 1 < len(sys.argv):
+            value_columns = [col.strip() for col in sys.argv[i + 1].split(',') if col.strip()]
+            i += 2
+        elif sys.argv[i] == '--group-by' and i + 1 < len(sys.argv):
+            group_by = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--jobs' and i + 1 < len(sys.argv):
+            jobs = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--anomaly-method' and i + 1 < len(sys.argv):
+            anomaly_method = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--anomaly-window' and i + 1 < len(sys.argv):
+            anomaly_window = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--season-period' and i + 1 < len(sys.argv):
+            season_period = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--append' and i + 1 < len(sys.argv):
+            append_path = sys.argv[i + 1]
+            incremental = True
+            i += 2
         else:
             i += 1
 
+    if value_columns is None and value_column and group_by:
+        value_columns = [value_column]
+    if value_columns and not value_column:
+        value_column = value_columns[0]
+
     if not date_column or not value_column:
         print("错误: 请指定日期列和值列")
-        print("用法: python trend_analysis.py --date-column <name> --value-column <name> [--period <n>]")
+        print("用法: python trend_analysis.py --date-column <name> (--value-column <name> | --value-columns <a,b,...>) [--group-by <key>] [--jobs <n>] [--period <n>] [--chunked [--freq <D|W|M|h>] [--agg <sum|mean|count|min|max>]] [--max-points <n>] [--downsample <lttb|minmax>] [--sidecar] [--anomaly-method <zscore|rolling|seasonal> [--anomaly-window <n>] [--season-period <n>]] [--incremental [--state <file>] [--append <file>]]")
+        sys.exit(1)
+
+    if method not in DOWNSAMPLE_METHODS:
+        print(f"错误: 未知的降采样方法 '{method}'，可选: {', '.join(DOWNSAMPLE_METHODS)}")
+        sys.exit(1)
+
+    if anomaly_method not in ANOMALY_METHODS:
+        print(f"错误: 未知的异常检测方法 '{anomaly_method}'，可选: {', '.join(ANOMALY_METHODS)}")
+        sys.exit(1)
+    if anomaly_method == 'seasonal' and not season_period:
+        print("错误: seasonal异常检测需要 --season-period <n>")
         sys.exit(1)
 
     print(f"📈 趋势分析")
     print(f"   输入: {input_path}")
     print(f"   日期列: {date_column}")
-    print(f"   值列: {value_column}")
+    print(f"   值列: {', '.join(value_columns) if value_columns else value_column}")
+    if group_by:
+        print(f"   分组列: {group_by}")
     print(f"   周期: {period}")
 
-    # 加载数据
-    data = load_json(input_path)
-
-    # 从样本数据重建DataFrame
-    sample_data = data.get('sample_data', [])
-    if sample_data:
-        df = pd.DataFrame(sample_data)
+    if value_columns:
+        # 批量模式：日期只解析一次，所有分组和值列的序列一起向量化计算
+        data = load_json(input_path)
+        columns = [date_column] + ([group_by] if group_by else []) + value_columns
+        df, is_full = load_analysis_dataset(data, columns)
+        if df is None:
+            print("错误: 无法获取数据样本")
+            sys.exit(1)
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            print(f"错误: 列 {', '.join(missing)} 不存在")
+            print(f"可用列: {', '.join(df.columns)}")
+            sys.exit(1)
+        results = analyze_trend_batch(df, date_column, value_columns, group_by, period,
+                                      max_points=max_points, method=method, jobs=jobs)
+        results['full_dataset'] = is_full
+        if data.get('dataset_cache'):
+            results['dataset_cache'] = data['dataset_cache']
+        print(f"✓ 批量趋势分析完成: {results['series_count']} 个序列")
+
+        save_json(results, output_path)
+        print(f"✓ 结果已保存: {output_path}")
+        print(f"\n批量趋势分析摘要:")
+        print(f"  - 序列数: {results['series_count']}")
+        print(f"  - 数据点数: {results['data_points']}")
+        rising = sum(1 for item in results['series'] if item.get('trend_line', {}).get('slope', 0) > 0)
+        print(f"  - 上升趋势序列: {rising} 个")
+        print(f"  - 异常值: {sum(item['anomalies']['count'] for item in results['series'])} 个")
+        return
+
+    if incremental:
+        # 增量模式：加载运行状态，只把新增行并入状态
+        state_path = Path(state_path) if state_path else Path(output_path).with_suffix('.state.json')
+        state = load_state(state_path, value_column, period, max_points=max_points or DEFAULT_MAX_POINTS)
+        print(f"   状态: {state_path}（已处理 {state.n} 个数据点）")
+        if append_path:
+            # 直接读取新增数据文件（CSV/Parquet/xlsx），按块并入
+            data = {}
+            chunks = iter_source_chunks(append_path, columns=[date_column, value_column])
+            is_full = True
+        else:
+            data = load_json(input_path)
+            df, is_full = load_analysis_dataset(data, [date_column, value_column])
+            if df is None:
+                print("错误: 无法获取数据样本")
+                sys.exit(1)
+            chunks = [df]
+        added = sum(update_trend_state(state, chunk, date_column, value_column) for chunk in chunks)
+        state.save(state_path)
+        results = state.results(date_column)
+        results['full_dataset'] = is_full
+        results['incremental'] = {'state': str(state_path.resolve()), 'new_points': added}
+        if data.get('dataset_cache'):
+            results['dataset_cache'] = data['dataset_cache']
+        print(f"✓ 增量更新完成: 新增 {added} 个数据点")
     else:
-        print("错误: 无法获取数据样本")
-        sys.exit(1)
-
-    # 检查列是否存在
-    if date_column not in df.columns or value_column not in df.columns:
-        print(f"错误: 列 '{date_column}' 或 '{value_column}' 不存在")
-        print(f"可用列: {', '.join(df.columns)}")
-        sys.exit(1)
-
-    # 趋势分析
-    results = analyze_trend(df, date_column, value_column, period)
-    print("✓ 趋势分析完成")
+        # 加载数据
+        data = load_json(input_path)
+
+        cache_info = data.get('dataset_cache') or {}
+        if chunked and cache_info.get('path') and Path(cache_info['path']).exists():
+            # 分块模式：流式读取缓存，按时间粒度部分聚合后合并，不将原始明细载入内存
+            batches = iter_dataset_batches(cache_info['path'], [date_column, value_column])
+            df = aggregate_time_series_chunked(batches, date_column, value_column, freq, agg)
+            is_full = True
+            print(f"✓ 分块聚合完成（{freq}/{agg}）: {len(df)} 个时间点")
+        else:
+            # 优先从数据集缓存加载完整数据（只读取需要的两列），缓存不可用时回退到样本数据
+            df, is_full = load_analysis_dataset(data, [date_column, value_column])
+            if df is None:
+                print("错误: 无法获取数据样本")
+                sys.exit(1)
+            print(f"✓ 数据加载完成（{'完整数据集缓存' if is_full else '数据样本'}）: {len(df)} 行")
+
+        # 检查列是否存在
+        if date_column not in df.columns or value_column not in df.columns:
+            print(f"错误: 列 '{date_column}' 或 '{value_column}' 不存在")
+            print(f"可用列: {', '.join(df.columns)}")
+            sys.exit(1)
+
+        # 趋势分析
+        sidecar_path = Path(output_path).with_suffix('.npz') if sidecar else None
+        results = analyze_trend(df, date_column, value_column, period, max_points, method, sidecar_path,
+                                anomaly_method, anomaly_window, season_period)
+        results['full_dataset'] = is_full
+        if chunked:
+            results['aggregation'] = {'freq': freq, 'agg': agg}
+        if data.get('dataset_cache'):
+            results['dataset_cache'] = data['dataset_cache']
+        print("✓ 趋势分析完成")
 
     # 保存结果
     save_json(results, output_path)
@@ -275,6 +555,11 @@ def main():
     # 打印摘要
     print(f"\n趋势分析摘要:")
     print(f"  - 数据点数: {results['data_points']}")
+    for name, info in results.get('downsampling', {}).get('series', {}).items():
+        if info['points'] < info['original_points']:
+            print(f"  - {name}: 降采样 {info['original_points']} → {info['points']} 点（{method}）")
+    if 'series_sidecar' in results:
+        print(f"  - 逐点序列: {results['series_sidecar']['path']}")
     print(f"  - 日期范围: {results['date_range']['start']} 至 {results['date_range']['end']}")
     if 'trend_line' in results:
         print(f"  - 趋势斜率: {results['trend_line']['slope']:.4f}")
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+流式xlsx读取模块
+直接从zip包中流式解析工作表XML，避免openpyxl构建完整的单元格对象模型
+"""
+
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from posixpath import join, normpath
+
+import numpy as np
+import pandas as pd
+
+NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+C_TAG = NS_MAIN + 'c'
+V_TAG = NS_MAIN + 'v'
+T_TAG = NS_MAIN + 't'
+IS_TAG = NS_MAIN + 'is'
+ROW_TAG = NS_MAIN + 'row'
+SHEET_DATA_TAG = NS_MAIN + 'sheetData'
+DIMENSION_TAG = NS_MAIN + 'dimension'
+
+# 内置日期数字格式（含中文区域设置使用的27-36、50-58）
+BUILTIN_DATE_FORMATS = set(range(14, 23)) | set(range(27, 37)) | set(range(45, 48)) | set(range(50, 59))
+
+DEFAULT_CHUNK_SIZE = 65536
+
+class _DateSerial(float):
+    """带日期样式的数值单元格（Excel序列日期）"""
+    __slots__ = ()
+
+def _column_index(ref):
+    """将单元格引用（如 'AB12'）的列部分转换为从0开始的列号"""
+    idx = 0
+    for ch in ref:
+        if 'A' <= ch <= 'Z':
+            idx = idx * 26 + (ord(ch) - 64)
+        else:
+            break
+    return idx - 1
+
+def _is_date_format(format_code):
+    """判断自定义数字格式是否为日期/时间格式"""
+    # 去掉引号内文本、转义字符和方括号（颜色、条件、区域设置）
+    code = re.sub(r'"[^"]*"|\\.|\[[^\]]*\]', '', format_code)
+    return bool(re.search(r'[dmyhs]', code, re.IGNORECASE))
+
+def _resolve_target(base_dir, target):
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return normpath(join(base_dir, target))
+
+class XlsxWorkbook:
+    """
+    xlsx工作簿的轻量句柄：一次性解析工作表列表、共享字符串和日期样式
+
+    Args:
+        file_path: xlsx文件路径
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._zip = zipfile.ZipFile(file_path)
+        self.sheets, self.date1904 = self._read_workbook()
+        self._shared_strings = None
+        self._date_styles = None
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _read_workbook(self):
+        root = ET.fromstring(self._zip.read('xl/workbook.xml'))
+        rels_root = ET.fromstring(self._zip.read('xl/_rels/workbook.xml.rels'))
+        targets = {rel.get('Id'): rel.get('Target') for rel in rels_root.iter(NS_PKG_REL + 'Relationship')}
+
+        sheets = []
+        for sheet in root.iter(NS_MAIN + 'sheet'):
+            target = targets.get(sheet.get(NS_REL + 'id'))
+            if target:
+                sheets.append((sheet.get('name'), _resolve_target('xl', target)))
+
+        props = root.find(NS_MAIN + 'workbookPr')
+        date1904 = props is not None and props.get('date1904') in ('1', 'true')
+        return sheets, date1904
+
+    @property
+    def shared_strings(self):
+        """共享字符串表（首次访问时解析一次）"""
+        if self._shared_strings is None:
+            strings = []
+            if 'xl/sharedStrings.xml' in self._zip.namelist():
+                with self._zip.open('xl/sharedStrings.xml') as f:
+                    for _, elem in ET.iterparse(f):
+                        if elem.tag == NS_MAIN + 'si':
+                            # 富文本由多个<r><t>组成，拼接全部文本
+                            strings.append(''.join(t.text or '' for t in elem.iter(T_TAG)))
+                            elem.clear()
+            self._shared_strings = strings
+        return self._shared_strings
+
+    @property
+    def date_styles(self):
+        """使用日期格式的单元格样式索引集合"""
+        if self._date_styles is None:
+            styles = set()
+            if 'xl/styles.xml' in self._zip.namelist():
+                root = ET.fromstring(self._zip.read('xl/styles.xml'))
+                custom_dates = set()
+                num_fmts = root.find(NS_MAIN + 'numFmts')
+                if num_fmts is not None:
+                    for fmt in num_fmts:
+                        if _is_date_format(fmt.get('formatCode', '')):
+                            custom_dates.add(int(fmt.get('numFmtId')))
+                cell_xfs = root.find(NS_MAIN + 'cellXfs')
+                if cell_xfs is not None:
+                    for i, xf in enumerate(cell_xfs):
+                        fmt_id = int(xf.get('numFmtId', 0))
+                        if fmt_id in BUILTIN_DATE_FORMATS or fmt_id in custom_dates:
+                            styles.add(str(i))
+            self._date_styles = styles
+        return self._date_styles
+
+    def sheet_path(self, sheet_name=None):
+        """按名称或序号定位工作表XML路径，None表示第一个工作表"""
+        if not self.sheets:
+            raise ValueError("工作簿中没有工作表")
+        if sheet_name is None:
+            return self.sheets[0][1]
+        if isinstance(sheet_name, int):
+            return self.sheets[sheet_name][1]
+        for name, path in self.sheets:
+            if name == sheet_name:
+                return path
+        raise ValueError(f"工作表不存在: {sheet_name}")
+
+    def dimension(self, sheet_name=None):
+        """读取工作表<dimension>声明的行数（无需解析全部数据），未声明时返回None"""
+        with self._zip.open(self.sheet_path(sheet_name)) as f:
+            for _, elem in ET.iterparse(f, events=('start',)):
+                if elem.tag == DIMENSION_TAG:
+                    ref = elem.get('ref', '')
+                    match = re.search(r'(\d+)$', ref)
+                    return int(match.group(1)) if match else None
+                if elem.tag == SHEET_DATA_TAG:
+                    return None
+        return None
+
+    def iter_rows(self, sheet_name=None):
+        """
+        流式逐行读取工作表
+
+        Yields:
+            tuple: (行号（从1开始）, {列号: 值})
+        """
+        shared = self.shared_strings
+        date_styles = self.date_styles
+
+        with self._zip.open(self.sheet_path(sheet_name)) as f:
+            sheet_data = None
+            row = {}
+            next_col = 0
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                tag = elem.tag
+                if event == 'start':
+                    if tag == ROW_TAG:
+                        row = {}
+                        next_col = 0
+                    elif tag == SHEET_DATA_TAG:
+                        sheet_data = elem
+                    continue
+
+                if tag == C_TAG:
+                    ref = elem.get('r')
+                    col = _column_index(ref) if ref else next_col
+                    next_col = col + 1
+                    cell_type = elem.get('t')
+                    if cell_type == 'inlineStr':
+                        inline = elem.find(IS_TAG)
+                        row[col] = ''.join(t.text or '' for t in inline.iter(T_TAG)) if inline is not None else None
+                        continue
+                    v = elem.find(V_TAG)
+                    if v is None or v.text is None:
+                        continue
+                    text = v.text
+                    if cell_type is None or cell_type == 'n':
+                        value = float(text)
+                        row[col] = _DateSerial(value) if elem.get('s') in date_styles else value
+                    elif cell_type == 's':
+                        row[col] = shared[int(text)]
+                    elif cell_type == 'str':
+                        row[col] = text
+                    elif cell_type == 'b':
+                        row[col] = text == '1'
+                    elif cell_type == 'd':
+                        row[col] = pd.Timestamp(text)
+                    # 't="e"'（错误值）按缺失处理
+                elif tag == ROW_TAG:
+                    yield int(elem.get('r') or 0), row
+                    if sheet_data is not None:
+                        # 释放已处理的行，保持内存占用恒定
+                        sheet_data.clear()
+
+def _serial_to_datetime(serials, date1904):
+    epoch = np.datetime64('1904-01-01' if date1904 else '1899-12-30', 'ms')
+    millis = np.round(np.asarray(serials, dtype=np.float64) * 86400000.0)
+    mask = np.isnan(millis)
+    result = epoch + np.where(mask, 0, millis).astype(np.int64).astype('timedelta64[ms]')
+    result = result.astype('datetime64[ns]')
+    result[mask] = np.datetime64('NaT')
+    return result
+
+def _build_column(values, date1904):
+    """根据读取时推断的类型，将一列值转换为NumPy数组"""
+    kinds = {type(v) for v in values if v is not None}
+    if not kinds:
+        return np.full(len(values), np.nan)
+    if kinds == {float}:
+        arr = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        # 全部为整数且无缺失时使用int64，与pandas读取结果一致
+        if not np.isnan(arr).any() and np.array_equal(arr, np.trunc(arr)) \
+                and np.abs(arr).max(initial=0) < 2 ** 53:
+            return arr.astype(np.int64)
+        return arr
+    if kinds == {bool} and None not in values:
+        return np.array(values, dtype=bool)
+    if kinds == {_DateSerial}:
+        return _serial_to_datetime([np.nan if v is None else v for v in values], date1904)
+    if kinds <= {float, _DateSerial}:
+        # 同一列中数值与日期混合时按数值处理，与pandas行为一致
+        return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+    out = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        if type(v) is _DateSerial:
+            v = pd.Timestamp(_serial_to_datetime([v], date1904)[0])
+        out[i] = v
+    return out
+
+def _select_columns(header, usecols):
+    """将usecols（列名或序号）解析为列号集合"""
+    if usecols is None:
+        return None
+    if isinstance(usecols, str):
+        usecols = [c.strip() for c in usecols.split(',')]
+    by_name = {name: idx for idx, name in header.items()}
+    selected = set()
+    for col in usecols:
+        if isinstance(col, int):
+            selected.add(col)
+        elif col in by_name:
+            selected.add(by_name[col])
+        else:
+            raise ValueError(f"列不存在: {col}")
+    return selected
+
+def iter_xlsx_chunks(file_path, sheet_name=None, usecols=None, nrows=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    流式读取xlsx，按行块产出已类型化的列数组
+
+    首行作为表头；usecols和nrows在解析时下推，未选中的单元格不做类型转换，
+    达到nrows后立即停止解析。
+
+    Args:
+        file_path: xlsx文件路径
+        sheet_name: 工作表名称或序号（可选）
+        usecols: 要读取的列名/列序号列表（可选）
+        nrows: 最多读取的数据行数（可选）
+        chunk_size: 每块的行数
+
+    Yields:
+        dict: {列名: numpy数组}
+    """
+    with XlsxWorkbook(file_path) as wb:
+        rows = wb.iter_rows(sheet_name)
+        header = {}
+        header_row = None
+        for row_num, cells in rows:
+            if cells:
+                header_row = row_num
+                header = {idx: (str(v) if v is not None else None) for idx, v in cells.items()}
+                break
+        if header_row is None:
+            return
+
+        selected = _select_columns(header, usecols)
+        columns = {}
+        buffers = {}
+        count = 0
+        last_row = header_row
+
+        def flush():
+            n = count
+            chunk = {}
+            for idx in sorted(columns):
+                values = buffers[idx]
+                values.extend([None] * (n - len(values)))
+                chunk[columns[idx]] = _build_column(values, wb.date1904)
+            return chunk
+
+        def add_column(idx):
+            name = header.get(idx) or f"Unnamed: {idx}"
+            columns[idx] = name
+            buffers[idx] = [None] * count
+
+        for idx in sorted(header):
+            if selected is None or idx in selected:
+                add_column(idx)
+
+        for row_num, cells in rows:
+            # 补齐XML中省略的空行，保持行位置与Excel一致
+            gap = row_num - last_row - 1 if row_num else 0
+            last_row = row_num or last_row + 1
+            for _ in range(max(gap, 0)):
+                if nrows is not None and count >= nrows:
+                    break
+                count += 1
+
+            if nrows is not None and count >= nrows:
+                break
+
+            for idx, value in cells.items():
+                if idx not in columns:
+                    if selected is not None and idx not in selected:
+                        continue
+                    add_column(idx)
+                buf = buffers[idx]
+                if len(buf) < count:
+                    buf.extend([None] * (count - len(buf)))
+                buf.append(value)
+            count += 1
+
+            if count >= chunk_size:
+                yield flush()
+                buffers = {idx: [] for idx in columns}
+                if nrows is not None:
+                    nrows -= count
+                count = 0
+
+        if count:
+            yield flush()
+
+def read_xlsx(file_path, sheet_name=None, usecols=None, nrows=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    流式读取xlsx为DataFrame
+
+    Args:
+        file_path: xlsx文件路径
+        sheet_name: 工作表名称或序号（可选）
+        usecols: 要读取的列（可选）
+        nrows: 最多读取的数据行数（可选）
+        chunk_size: 每块的行数
+
+    Returns:
+        DataFrame: 读取的数据
+    """
+    parts = {}
+    order = []
+    total = 0
+    for chunk in iter_xlsx_chunks(file_path, sheet_name, usecols, nrows, chunk_size):
+        n = len(next(iter(chunk.values()))) if chunk else 0
+        for name, arr in chunk.items():
+            if name not in parts:
+                # 后续块中才出现的列，在前面补齐缺失值
+                parts[name] = [np.full(total, np.nan)] if total else []
+                order.append(name)
+            parts[name].append(arr)
+        for name in order:
+            if name not in chunk:
+                parts[name].append(np.full(n, np.nan))
+        total += n
+
+    data = {}
+    for name in order:
+        arrays = parts[name]
+        if len(arrays) == 1:
+            data[name] = arrays[0]
+        elif len({a.dtype for a in arrays}) == 1:
+            data[name] = np.concatenate(arrays)
+        else:
+            data[name] = pd.concat([pd.Series(a) for a in arrays], ignore_index=True)
+    return pd.DataFrame(data, columns=order)
+
+def sample_xlsx(file_path, sheet_name=None, nrows=1000):
+    """
+    采样模式：只解析前nrows行用于快速识别数据结构
+
+    Args:
+        file_path: xlsx文件路径
+        sheet_name: 工作表名称或序号（可选）
+        nrows: 采样行数
+
+    Returns:
+        tuple: (样本DataFrame, 工作表声明的总数据行数或None)
+    """
+    df = read_xlsx(file_path, sheet_name, nrows=nrows)
+    with XlsxWorkbook(file_path) as wb:
+        last_row = wb.dimension(sheet_name)
+    total_rows = last_row - 1 if last_row else None
+    return df, total_rows
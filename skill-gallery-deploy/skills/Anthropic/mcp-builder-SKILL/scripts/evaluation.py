@@ -16,7 +16,7 @@ from typing import Any
 
 from anthropic import Anthropic
 
-from connections import create_connection
+from connections import CachingConnection, MCPConnectionPool, ToolResultCache, create_connection
 
 EVALUATION_PROMPT = """You are an AI assistant with access to tools.
 
@@ -83,14 +83,32 @@ def extract_xml_content(text: str, tag: str) -> str | None:
     return matches[-1].strip() if matches else None
 
 
+async def execute_tool_call(connection: Any, tool_use: Any) -> tuple[str, float]:
+    """Execute one tool_use block and return its serialized result and duration."""
+    tool_start_ts = time.time()
+    try:
+        tool_result = await connection.call_tool(tool_use.name, tool_use.input)
+        tool_response = json.dumps(tool_result) if isinstance(tool_result, (dict, list)) else str(tool_result)
+    except Exception as e:
+        tool_response = f"Error executing tool {tool_use.name}: {str(e)}\n"
+        tool_response += traceback.format_exc()
+    return tool_response, time.time() - tool_start_ts
+
+
 async def agent_loop(
     client: Anthropic,
     model: str,
     question: str,
     tools: list[dict[str, Any]],
     connection: Any,
-) -> tuple[str, dict[str, Any]]:
-    """Run the agent loop with MCP tools."""
+) -> tuple[str, dict[str, Any], float]:
+    """Run the agent loop with MCP tools.
+
+    All tool_use blocks of a turn run concurrently and their results are sent back
+    in a single user message. Each call's duration is measured on its own, so
+    per-tool durations can overlap; the returned wall time is the elapsed time spent
+    waiting on tool batches.
+    """
     messages = [{"role": "user", "content": question}]
 
     response = await asyncio.to_thread(
@@ -105,34 +123,29 @@ async def agent_loop(
     messages.append({"role": "assistant", "content": response.content})
 
     tool_metrics = {}
+    tool_wall_time = 0.0
 
     while response.stop_reason == "tool_use":
-        tool_use = next(block for block in response.content if block.type == "tool_use")
-        tool_name = tool_use.name
-        tool_input = tool_use.input
-
-        tool_start_ts = time.time()
-        try:
-            tool_result = await connection.call_tool(tool_name, tool_input)
-            tool_response = json.dumps(tool_result) if isinstance(tool_result, (dict, list)) else str(tool_result)
-        except Exception as e:
-            tool_response = f"Error executing tool {tool_name}: {str(e)}\n"
-            tool_response += traceback.format_exc()
-        tool_duration = time.time() - tool_start_ts
-
-        if tool_name not in tool_metrics:
-            tool_metrics[tool_name] = {"count": 0, "durations": []}
-        tool_metrics[tool_name]["count"] += 1
-        tool_metrics[tool_name]["durations"].append(tool_duration)
-
-        messages.append({
-            "role": "user",
-            "content": [{
+        tool_uses = [block for block in response.content if block.type == "tool_use"]
+
+        batch_start_ts = time.time()
+        outcomes = await asyncio.gather(*(execute_tool_call(connection, tool_use) for tool_use in tool_uses))
+        tool_wall_time += time.time() - batch_start_ts
+
+        tool_results = []
+        for tool_use, (tool_response, tool_duration) in zip(tool_uses, outcomes):
+            if tool_use.name not in tool_metrics:
+                tool_metrics[tool_use.name] = {"count": 0, "durations": []}
+            tool_metrics[tool_use.name]["count"] += 1
+            tool_metrics[tool_use.name]["durations"].append(tool_duration)
+
+            tool_results.append({
                 "type": "tool_result",
                 "tool_use_id": tool_use.id,
                 "content": tool_response,
-            }]
-        })
+            })
+
+        messages.append({"role": "user", "content": tool_results})
 
         response = await asyncio.to_thread(
             client.messages.create,
@@ -148,7 +161,7 @@ async def agent_loop(
         (block.text for block in response.content if hasattr(block, "text")),
         None,
     )
-    return response_text, tool_metrics
+    return response_text, tool_metrics, tool_wall_time
 
 
 async def evaluate_single_task(
@@ -163,7 +176,7 @@ async def evaluate_single_task(
     start_time = time.time()
 
     print(f"Task {task_index + 1}: Running task with question: {qa_pair['question']}")
-    response, tool_metrics = await agent_loop(client, model, qa_pair["question"], tools, connection)
+    response, tool_metrics, tool_wall_time = await agent_loop(client, model, qa_pair["question"], tools, connection)
 
     response_value = extract_xml_content(response, "response")
     summary = extract_xml_content(response, "summary")
@@ -179,11 +192,31 @@ async def evaluate_single_task(
         "total_duration": duration_seconds,
         "tool_calls": tool_metrics,
         "num_tool_calls": sum(len(metrics["durations"]) for metrics in tool_metrics.values()),
+        "tool_wall_time": tool_wall_time,
+        "tool_summed_time": sum(sum(metrics["durations"]) for metrics in tool_metrics.values()),
         "summary": summary,
         "feedback": feedback,
     }
 
 
+def failed_result(qa_pair: dict[str, Any], error: str, duration_seconds: float) -> dict[str, Any]:
+    """Result for a task that raised before producing an answer; scored as incorrect."""
+    return {
+        "question": qa_pair["question"],
+        "expected": qa_pair["answer"],
+        "actual": None,
+        "score": 0,
+        "total_duration": duration_seconds,
+        "tool_calls": {},
+        "num_tool_calls": 0,
+        "tool_wall_time": 0.0,
+        "tool_summed_time": 0.0,
+        "summary": None,
+        "feedback": None,
+        "error": error,
+    }
+
+
 REPORT_HEADER = """
 # Evaluation Report
 
@@ -193,6 +226,20 @@ REPORT_HEADER = """
 - **Average Task Duration**: {average_duration_s:.2f}s
 - **Average Tool Calls per Task**: {average_tool_calls:.2f}
 - **Total Tool Calls**: {total_tool_calls}
+- **Concurrency**: {concurrency}
+- **Wall-Clock Time**: {wall_clock_s:.2f}s
+- **Summed Task Duration**: {summed_duration_s:.2f}s ({speedup:.2f}x speedup)
+
+---
+"""
+
+CACHE_TEMPLATE = """
+## Tool Result Cache
+
+- **Hits**: {hits}
+- **Misses**: {misses}
+- **Hit Rate**: {hit_rate:.1f}%
+- **Cached Entries**: {size}
 
 ---
 """
@@ -205,6 +252,7 @@ TASK_TEMPLATE = """
 **Actual Answer**: `{actual_answer}`
 **Correct**: {correct_indicator}
 **Duration**: {total_duration:.2f}s
+**Tool Time**: {tool_wall_time:.2f}s wall-clock, {tool_summed_time:.2f}s summed across calls
 **Tool Calls**: {tool_calls}
 
 **Summary**
@@ -221,8 +269,14 @@ async def run_evaluation(
     eval_path: Path,
     connection: Any,
     model: str = "claude-3-7-sonnet-20250219",
+    concurrency: int = 1,
 ) -> str:
-    """Run evaluation with MCP server tools."""
+    """Run evaluation with MCP server tools.
+
+    Up to `concurrency` tasks run at once over the shared connection (or pool of
+    connections); MCP sessions multiplex requests, so concurrent tool calls do not
+    need separate connections. Results are reported in the original task order.
+    """
     print("🚀 Starting Evaluation")
 
     client = Anthropic()
@@ -233,17 +287,34 @@ async def run_evaluation(
     qa_pairs = parse_evaluation_file(eval_path)
     print(f"📋 Loaded {len(qa_pairs)} evaluation tasks")
 
-    results = []
-    for i, qa_pair in enumerate(qa_pairs):
-        print(f"Processing task {i + 1}/{len(qa_pairs)}")
-        result = await evaluate_single_task(client, model, qa_pair, tools, connection, i)
-        results.append(result)
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_task(i: int, qa_pair: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            print(f"Processing task {i + 1}/{len(qa_pairs)}")
+            start_time = time.time()
+            try:
+                return await evaluate_single_task(client, model, qa_pair, tools, connection, i)
+            except Exception as e:
+                # Record the failure (e.g. a rate-limit error) so the other tasks still get reported
+                error = f"{type(e).__name__}: {e}"
+                print(f"Task {i + 1}: Failed with {error}")
+                return failed_result(qa_pair, error, time.time() - start_time)
+
+    wall_start = time.time()
+    results = await asyncio.gather(*(run_task(i, qa_pair) for i, qa_pair in enumerate(qa_pairs)))
+    wall_clock_s = time.time() - wall_start
 
     correct = sum(r["score"] for r in results)
     accuracy = (correct / len(results)) * 100 if results else 0
     average_duration_s = sum(r["total_duration"] for r in results) / len(results) if results else 0
     average_tool_calls = sum(r["num_tool_calls"] for r in results) / len(results) if results else 0
     total_tool_calls = sum(r["num_tool_calls"] for r in results)
+    summed_duration_s = sum(r["total_duration"] for r in results)
+    speedup = summed_duration_s / wall_clock_s if wall_clock_s > 0 else 1.0
+
+    cache_stats = connection.cache.stats() if isinstance(connection, CachingConnection) else None
 
     report = REPORT_HEADER.format(
         correct=correct,
@@ -252,8 +323,17 @@ async def run_evaluation(
         average_duration_s=average_duration_s,
         average_tool_calls=average_tool_calls,
         total_tool_calls=total_tool_calls,
+        concurrency=concurrency,
+        wall_clock_s=wall_clock_s,
+        summed_duration_s=summed_duration_s,
+        speedup=speedup,
     )
 
+    if cache_stats is not None:
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        hit_rate = (cache_stats["hits"] / lookups) * 100 if lookups else 0
+        report += CACHE_TEMPLATE.format(hit_rate=hit_rate, **cache_stats)
+
     report += "".join([
         TASK_TEMPLATE.format(
             task_num=i + 1,
@@ -262,8 +342,10 @@ async def run_evaluation(
             actual_answer=result["actual"] or "N/A",
             correct_indicator="✅" if result["score"] else "❌",
             total_duration=result["total_duration"],
+            tool_wall_time=result["tool_wall_time"],
+            tool_summed_time=result["tool_summed_time"],
             tool_calls=json.dumps(result["tool_calls"], indent=2),
-            summary=result["summary"] or "N/A",
+            summary=result["summary"] or (f"Task failed: {result['error']}" if result.get("error") else "N/A"),
             feedback=result["feedback"] or "N/A",
         )
         for i, (qa_pair, result) in enumerate(zip(qa_pairs, results))
@@ -316,12 +398,23 @@ Examples:
 
   # Evaluate an HTTP MCP server with custom model
   python evaluation.py -t http -u https://example.com/mcp -m claude-3-5-sonnet-20241022 eval.xml
+
+  # Run up to 8 tasks at a time
+  python evaluation.py -t stdio -c python -a my_server.py --concurrency 8 eval.xml
+
+  # Cache results of read-only tools across tasks and runs
+  python evaluation.py -t stdio -c python -a my_server.py --cache-tools search_issues get_user --cache-file .tool_cache eval.xml
+
+  # Spread concurrent tasks over 4 server sessions
+  python evaluation.py -t stdio -c python -a my_server.py --concurrency 8 --pool-size 4 eval.xml
         """,
     )
 
     parser.add_argument("eval_file", type=Path, help="Path to evaluation XML file")
     parser.add_argument("-t", "--transport", choices=["stdio", "sse", "http"], default="stdio", help="Transport type (default: stdio)")
     parser.add_argument("-m", "--model", default="claude-3-7-sonnet-20250219", help="Claude model to use (default: claude-3-7-sonnet-20250219)")
+    parser.add_argument("-j", "--concurrency", type=int, default=1, help="Number of tasks to run concurrently (default: 1)")
+    parser.add_argument("-p", "--pool-size", type=int, default=1, help="Number of MCP sessions to open and share between tasks (default: 1)")
 
     stdio_group = parser.add_argument_group("stdio options")
     stdio_group.add_argument("-c", "--command", help="Command to run MCP server (stdio only)")
@@ -332,6 +425,12 @@ Examples:
     remote_group.add_argument("-u", "--url", help="MCP server URL (sse/http only)")
     remote_group.add_argument("-H", "--header", nargs="+", dest="headers", help="HTTP headers in 'Key: Value' format (sse/http only)")
 
+    cache_group = parser.add_argument_group("tool result cache options")
+    cache_group.add_argument("--cache-tools", nargs="+", help="Names of read-only, idempotent tools whose results may be cached")
+    cache_group.add_argument("--cache-ttl", type=float, default=3600.0, help="Seconds a cached result stays valid (default: 3600)")
+    cache_group.add_argument("--cache-size", type=int, default=1024, help="Maximum number of cached results kept in memory (default: 1024)")
+    cache_group.add_argument("--cache-file", help="Persist cached results to this file so later runs can reuse them")
+
     parser.add_argument("-o", "--output", type=Path, help="Output file for evaluation report (default: stdout)")
 
     args = parser.parse_args()
@@ -343,24 +442,33 @@ Examples:
     headers = parse_headers(args.headers) if args.headers else None
     env_vars = parse_env_vars(args.env) if args.env else None
 
+    connection_kwargs = {
+        "transport": args.transport,
+        "command": args.command,
+        "args": args.args,
+        "env": env_vars,
+        "url": args.url,
+        "headers": headers,
+    }
+
     try:
-        connection = create_connection(
-            transport=args.transport,
-            command=args.command,
-            args=args.args,
-            env=env_vars,
-            url=args.url,
-            headers=headers,
-        )
+        if args.pool_size > 1:
+            connection = MCPConnectionPool(size=args.pool_size, **connection_kwargs)
+        else:
+            connection = create_connection(**connection_kwargs)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
 
+    if args.cache_tools:
+        cache = ToolResultCache(max_size=args.cache_size, ttl=args.cache_ttl, path=args.cache_file)
+        connection = CachingConnection(connection, args.cache_tools, cache)
+
     print(f"🔗 Connecting to MCP server via {args.transport}...")
 
     async with connection:
         print("✅ Connected successfully")
-        report = await run_evaluation(args.eval_file, connection, args.model)
+        report = await run_evaluation(args.eval_file, connection, args.model, args.concurrency)
 
         if args.output:
             args.output.write_text(report)
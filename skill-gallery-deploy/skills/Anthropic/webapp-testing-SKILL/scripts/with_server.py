@@ -2,6 +2,17 @@
 """
 Start one or more servers, wait for them to be ready, run a command, then clean up.
 
+All servers are launched at once and probed concurrently. A server is ready when
+its port accepts connections (polled with a fast backoff), when an optional HTTP
+health path answers with a 2xx/3xx status, or when a line of its output matches
+an optional regex. Server output is drained in the background so a chatty dev
+server can never block on a full pipe.
+
+A server command that exits with code 0 (e.g. "docker compose up -d" or
+"npm run dev &") is treated as having started the server in the background:
+readiness is probed until the timeout, and on POSIX the processes it left in
+its process group are stopped on exit.
+
 Usage:
     # Single server
     python scripts/with_server.py --server "npm run dev" --port 5173 -- python automation.py
@@ -12,24 +23,235 @@ Usage:
       --server "cd backend && python server.py" --port 3000 \
       --server "cd frontend && npm run dev" --port 5173 \
       -- python test.py
+
+    # Readiness by HTTP health check or log line (one value for all servers, or one per server; "-" skips a server)
+    python scripts/with_server.py --server "python api.py" --port 8000 --health /healthz -- python test.py
+    python scripts/with_server.py --server "npm run dev" --port 5173 --ready-log "Local:.*5173" -- python test.py
+
+    # Print server output as it arrives instead of only on failure
+    python scripts/with_server.py --server "npm run dev" --port 5173 --stream-output -- python test.py
 """
 
-import subprocess
-import socket
-import time
-import sys
 import argparse
+import asyncio
+import os
+import re
+import signal
+import sys
+import time
+from collections import deque
+
+# Readiness polling backoff: first retry after 10ms, doubling up to 250ms
+POLL_INITIAL = 0.01
+POLL_MAX = 0.25
+# Server output lines kept for the failure report
+OUTPUT_TAIL_LINES = 50
+# Output is read in chunks and split into lines here, so a huge line cannot stall the reader
+READ_CHUNK_SIZE = 65536
+# Longer lines (e.g. progress bars redrawn with \r) are reported in pieces
+MAX_LINE_BYTES = 65536
+# Seconds to wait after SIGTERM before killing, and for output to reach EOF afterwards
+STOP_TIMEOUT = 5
+DRAIN_TIMEOUT = 1
+
+
+class Server:
+    """A launched server process with its readiness state and output tail."""
+
+    def __init__(self, index, cmd, port, health=None, ready_log=None):
+        self.index = index
+        self.cmd = cmd
+        self.port = port
+        self.health = health
+        self.ready_log = re.compile(ready_log) if ready_log else None
+        self.process = None
+        self.started = None
+        self.ready_after = None
+        self.log_matched = asyncio.Event()
+        self.output = deque(maxlen=OUTPUT_TAIL_LINES)
 
-def is_server_ready(port, timeout=30):
-    """Wait for server to be ready by polling the port."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    @property
+    def label(self):
+        return f"server {self.index + 1} (port {self.port})"
+
+    async def start(self):
+        self.started = time.perf_counter()
+        kwargs = {}
+        if os.name == 'posix':
+            # Own process group, so shell children such as "cd x && npm run dev" are stopped too
+            kwargs['start_new_session'] = True
+        # Use shell to support commands with cd and &&
+        self.process = await asyncio.create_subprocess_shell(
+            self.cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            **kwargs
+        )
+
+    async def drain(self, stream_output):
+        """Read output until the process closes it, keeping a tail and watching for the ready line."""
+        pending = b''
+        while True:
+            chunk = await self.process.stdout.read(READ_CHUNK_SIZE)
+            if not chunk:
+                if pending:
+                    self.handle_line(pending, stream_output)
+                return
+            *lines, pending = (pending + chunk).split(b'\n')
+            for line in lines:
+                self.handle_line(line, stream_output)
+            while len(pending) > MAX_LINE_BYTES:
+                self.handle_line(pending[:MAX_LINE_BYTES], stream_output)
+                pending = pending[MAX_LINE_BYTES:]
+
+    def handle_line(self, line, stream_output):
+        text = line.decode(errors='replace').rstrip()
+        self.output.append(text)
+        if stream_output:
+            print(f"[{self.index + 1}] {text}", flush=True)
+        if self.ready_log and not self.log_matched.is_set() and self.ready_log.search(text):
+            self.log_matched.set()
+
+    async def probe(self):
+        """Return True once the server passes its readiness check."""
+        if self.ready_log:
+            return self.log_matched.is_set()
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection('localhost', self.port), timeout=1)
+        except (OSError, asyncio.TimeoutError):
+            return False
         try:
-            with socket.create_connection(('localhost', port), timeout=1):
+            if not self.health:
                 return True
-        except (socket.error, ConnectionRefusedError):
-            time.sleep(0.5)
-    return False
+            request = f"GET {self.health} HTTP/1.0\r\nHost: localhost:{self.port}\r\n\r\n"
+            writer.write(request.encode())
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), timeout=2)
+            parts = status_line.split()
+            return len(parts) >= 2 and parts[1][:1] in (b'2', b'3')
+        except (OSError, asyncio.TimeoutError):
+            return False
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def wait_ready(self, timeout):
+        """
+        Poll readiness with exponential backoff.
+
+        Fails early if the server command exits with an error; after a clean exit
+        (a backgrounded server) probing continues until the timeout.
+        """
+        deadline = self.started + timeout
+        delay = POLL_INITIAL
+        while True:
+            if await self.probe():
+                self.ready_after = time.perf_counter() - self.started
+                print(f"Server ready on port {self.port} after {self.ready_after:.2f}s")
+                return
+            returncode = self.process.returncode
+            if returncode:
+                raise RuntimeError(f"{self.label} exited with code {returncode} before becoming ready")
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                detail = " (its command exited with code 0)" if returncode == 0 else ""
+                raise RuntimeError(f"{self.label} failed to become ready within {timeout}s{detail}")
+            # Wake up immediately when the ready line shows up or the process exits
+            waiters = [asyncio.ensure_future(self.log_matched.wait())]
+            if returncode is None:
+                waiters.append(asyncio.ensure_future(self.process.wait()))
+            await asyncio.wait(waiters, timeout=min(delay, remaining), return_when=asyncio.FIRST_COMPLETED)
+            for waiter in waiters:
+                waiter.cancel()
+            delay = min(delay * 2, POLL_MAX)
+
+    def signal_group(self, sig):
+        """Send a signal to the server's process group; return False if the group is gone."""
+        try:
+            os.killpg(self.process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            return False
+        return True
+
+    async def stop(self):
+        if self.process is None:
+            return
+        if os.name != 'posix':
+            if self.process.returncode is None:
+                try:
+                    self.process.terminate()
+                    await asyncio.wait_for(self.process.wait(), timeout=STOP_TIMEOUT)
+                except ProcessLookupError:
+                    pass
+                except asyncio.TimeoutError:
+                    self.process.kill()
+            await self.process.wait()
+            return
+
+        # Signal the group even if the shell already exited: backgrounded
+        # children ("npm run dev &") are still running in it
+        if self.signal_group(signal.SIGTERM):
+            deadline = time.perf_counter() + STOP_TIMEOUT
+            while self.signal_group(0):
+                if time.perf_counter() >= deadline:
+                    self.signal_group(signal.SIGKILL)
+                    break
+                await asyncio.sleep(POLL_INITIAL)
+        await self.process.wait()
+
+
+def per_server(values, count, option):
+    """Expand an optional per-server option: omitted, given once for all, or once per server ("-" = none)."""
+    if not values:
+        return [None] * count
+    if len(values) == 1:
+        values = values * count
+    if len(values) != count:
+        raise ValueError(f"{option} must be given once or once per --server")
+    return [None if value == '-' else value for value in values]
+
+
+async def run(servers, command, timeout, stream_output):
+    drainers = []
+    try:
+        print(f"Starting {len(servers)} server(s)...")
+        for server in servers:
+            print(f"  {server.index + 1}: {server.cmd}")
+            await server.start()
+            drainers.append(asyncio.create_task(server.drain(stream_output)))
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(server.wait_ready(timeout) for server in servers), return_exceptions=True)
+        failures = [(server, result) for server, result in zip(servers, results) if isinstance(result, Exception)]
+        if failures:
+            for server, error in failures:
+                print(f"Error: {error}")
+                if server.output and not stream_output:
+                    print(f"--- last output of {server.label} ---")
+                    print("\n".join(server.output))
+            return 1
+
+        print(f"\nAll {len(servers)} server(s) ready in {time.perf_counter() - start:.2f}s")
+
+        # Run the command while server output keeps draining in the background
+        print(f"Running: {' '.join(command)}\n")
+        process = await asyncio.create_subprocess_exec(*command)
+        return await process.wait()
+
+    finally:
+        print(f"\nStopping {len(servers)} server(s)...")
+        await asyncio.gather(*(server.stop() for server in servers), return_exceptions=True)
+        # Stopping the process groups closes their output, so the drainers finish on their own;
+        # cancel any that are still held open, and wait for them before the loop closes
+        if drainers:
+            _, pending = await asyncio.wait(drainers, timeout=DRAIN_TIMEOUT)
+            for drainer in pending:
+                drainer.cancel()
+            await asyncio.gather(*drainers, return_exceptions=True)
+        print("All servers stopped")
 
 
 def main():
@@ -37,6 +259,9 @@ def main():
     parser.add_argument('--server', action='append', dest='servers', required=True, help='Server command (can be repeated)')
     parser.add_argument('--port', action='append', dest='ports', type=int, required=True, help='Port for each server (must match --server count)')
     parser.add_argument('--timeout', type=int, default=30, help='Timeout in seconds per server (default: 30)')
+    parser.add_argument('--health', action='append', help='HTTP path that must answer 2xx/3xx, e.g. /healthz (once, or once per server)')
+    parser.add_argument('--ready-log', action='append', dest='ready_logs', help='Regex matched against server output to signal readiness (once, or once per server)')
+    parser.add_argument('--stream-output', action='store_true', help='Print server output as it arrives')
     parser.add_argument('command', nargs=argparse.REMAINDER, help='Command to run after server(s) ready')
 
     args = parser.parse_args()
@@ -54,53 +279,20 @@ def main():
         print("Error: Number of --server and --port arguments must match")
         sys.exit(1)
 
-    servers = []
-    for cmd, port in zip(args.servers, args.ports):
-        servers.append({'cmd': cmd, 'port': port})
-
-    server_processes = []
-
     try:
-        # Start all servers
-        for i, server in enumerate(servers):
-            print(f"Starting server {i+1}/{len(servers)}: {server['cmd']}")
-
-            # Use shell=True to support commands with cd and &&
-            process = subprocess.Popen(
-                server['cmd'],
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            server_processes.append(process)
-
-            # Wait for this server to be ready
-            print(f"Waiting for server on port {server['port']}...")
-            if not is_server_ready(server['port'], timeout=args.timeout):
-                raise RuntimeError(f"Server failed to start on port {server['port']} within {args.timeout}s")
-
-            print(f"Server ready on port {server['port']}")
-
-        print(f"\nAll {len(servers)} server(s) ready")
+        healths = per_server(args.health, len(args.servers), '--health')
+        ready_logs = per_server(args.ready_logs, len(args.servers), '--ready-log')
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
-        # Run the command
-        print(f"Running: {' '.join(args.command)}\n")
-        result = subprocess.run(args.command)
-        sys.exit(result.returncode)
+    async def orchestrate():
+        servers = [Server(i, cmd, port, health, ready_log)
+                   for i, (cmd, port, health, ready_log) in enumerate(zip(args.servers, args.ports, healths, ready_logs))]
+        return await run(servers, args.command, args.timeout, args.stream_output)
 
-    finally:
-        # Clean up all servers
-        print(f"\nStopping {len(server_processes)} server(s)...")
-        for i, process in enumerate(server_processes):
-            try:
-                process.terminate()
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
-            print(f"Server {i+1} stopped")
-        print("All servers stopped")
+    sys.exit(asyncio.run(orchestrate()))
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
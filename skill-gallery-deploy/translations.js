@@ -17,6 +17,7 @@ const translations = {
         // Header
         allSkillsTitle: "All Skills",
         allSkillsSubtitle: "Explore and discover powerful skills from Github",
+        searchPlaceholder: "Search skills",
         myFavoritesTitle: "My Favorites",
         myFavoritesSubtitle: "skills in your collection",
         categorySubtitle: "skills available in {category} (showing {count} samples)",
@@ -198,6 +199,7 @@ const translations = {
         // Header
         allSkillsTitle: "所有技能",
         allSkillsSubtitle: "探索和发现来自 Github 的强大技能",
+        searchPlaceholder: "搜索技能",
         myFavoritesTitle: "我的收藏",
         myFavoritesSubtitle: "个技能在你的收藏中",
         categorySubtitle: "个{category}技能可用 (显示{count}个示例)",
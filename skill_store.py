@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""技能文件的内容寻址存储与同步工具
+
+skills/ 和 skill-gallery-deploy/skills/ 中保存着同一批技能的完整副本，另外还有
+pdf-skills.zip、xlsx-SKILL.zip 等打包文件。该工具把所有文件内容按SHA-256存入
+.skill-store/objects（相同内容只存一份），为每个目录树记录一份清单（路径 -> 哈希），
+再根据清单用reflink/硬链接还原目录树和zip包，并通过比较清单只部署有变化的文件。
+
+- 每个文件只在大小、修改时间或inode变化时才重新计算哈希（stat缓存）
+- zip包按成员记录，成员内容与目录中的同名文件共用同一份数据
+- 还原时优先使用reflink（写时复制），不支持时用硬链接，再不行才复制
+
+用法:
+    python skill_store.py ingest [目录树 ...]              # 默认 skills skill-gallery-deploy/skills
+    python skill_store.py diff <清单或目录树> <清单或目录树> [--json]
+    python skill_store.py materialize <目录树> <目标目录> [--link auto|reflink|hardlink|copy]
+    python skill_store.py stats
+    python skill_store.py gc
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows：不支持reflink，auto模式回退到硬链接或复制
+    fcntl = None
+
+REPO_ROOT = Path(__file__).resolve().parent
+STORE_DIR = REPO_ROOT / '.skill-store'
+OBJECTS_DIR = STORE_DIR / 'objects'
+MANIFESTS_DIR = STORE_DIR / 'manifests'
+STAT_CACHE_FILE = STORE_DIR / 'stat-cache.json'
+
+DEFAULT_TREES = ('skills', 'skill-gallery-deploy/skills')
+# 还原目录中记录当前内容的清单文件
+DEST_MANIFEST = '.skill-manifest.json'
+
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 20
+SKIP_NAMES = {'.git', '__pycache__', 'node_modules', '.DS_Store', DEST_MANIFEST}
+# zip成员的固定时间戳，保证还原出的zip内容确定
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+# Linux的FICLONE ioctl（reflink）
+FICLONE = 0x40049409
+LINK_MODES = ('auto', 'reflink', 'hardlink', 'copy')
+
+
+def object_path(digest):
+    return OBJECTS_DIR / digest[:2] / digest[2:]
+
+
+def tree_key(tree):
+    """目录树在仓库中的相对路径，用作清单名"""
+    path = Path(tree).resolve()
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix().lstrip('/')
+
+
+def manifest_path(tree):
+    return MANIFESTS_DIR / (tree_key(tree).replace('/', '__') + '.json')
+
+
+def write_json(path, data):
+    """先写临时文件再替换"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, sort_keys=True), encoding='utf-8')
+    tmp_path.replace(path)
+
+
+def read_json(path, default=None):
+    try:
+        return json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return default
+
+
+class BlobStore:
+    """
+    内容寻址的对象存储
+
+    对象以SHA-256命名，写入后设为只读（硬链接出去的文件与对象共用inode，只读可防止误改）。
+    stat缓存记录每个源文件的 (大小, 修改时间, inode) -> 哈希，未变化的文件不再读取。
+    """
+
+    def __init__(self):
+        OBJECTS_DIR.mkdir(parents=True, exist_ok=True)
+        self.stat_cache = read_json(STAT_CACHE_FILE, {})
+        self.hashed_bytes = 0
+        self.stored_bytes = 0
+
+    def save(self):
+        write_json(STAT_CACHE_FILE, self.stat_cache)
+
+    def put_bytes(self, data):
+        """存入一段内容，返回哈希"""
+        digest = hashlib.sha256(data).hexdigest()
+        target = object_path(digest)
+        if not target.exists():
+            self._write_object(target, lambda f: f.write(data))
+            self.stored_bytes += len(data)
+        return digest
+
+    def put_file(self, path):
+        """
+        存入一个文件，返回 (哈希, 大小)
+
+        stat未变化时直接使用缓存的哈希（对象已在存储中）
+        """
+        st = path.stat()
+        key = str(path)
+        signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+        cached = self.stat_cache.get(key)
+        if cached and cached['stat'] == signature and object_path(cached['hash']).exists():
+            return cached['hash'], st.st_size
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+        self.hashed_bytes += st.st_size
+
+        target = object_path(digest)
+        if not target.exists():
+            def copy(f):
+                with open(path, 'rb') as src:
+                    shutil.copyfileobj(src, f, HASH_CHUNK_SIZE)
+            self._write_object(target, copy)
+            self.stored_bytes += st.st_size
+        self.stat_cache[key] = {'stat': signature, 'hash': digest}
+        return digest, st.st_size
+
+    def _write_object(self, target, write):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent)
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.chmod(tmp_name, 0o444)
+        os.replace(tmp_name, target)
+
+
+def _file_mode(st):
+    return 0o755 if st.st_mode & stat.S_IXUSR else 0o644
+
+
+def scan_zip(store, path):
+    """
+    读取zip包的成员并存入存储，返回成员列表 [[名称, 哈希, 大小, 权限], ...]
+
+    zip本身的stat未变化时使用缓存的成员列表
+    """
+    st = path.stat()
+    key = f'zip:{path}'
+    signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+    cached = store.stat_cache.get(key)
+    if cached and cached['stat'] == signature and all(object_path(m[1]).exists() for m in cached['members']):
+        return cached['members']
+
+    members = []
+    with zipfile.ZipFile(path) as zipf:
+        for info in zipf.infolist():
+            if info.is_dir():
+                continue
+            data = zipf.read(info)
+            store.hashed_bytes += len(data)
+            mode = (info.external_attr >> 16) & 0o777
+            members.append([info.filename, store.put_bytes(data), len(data), 0o755 if mode & 0o100 else 0o644])
+    store.stat_cache[key] = {'stat': signature, 'members': members}
+    return members
+
+
+def build_manifest(store, tree):
+    """
+    扫描目录树，把所有文件存入存储，返回清单
+
+    Returns:
+        dict: {'version', 'tree', 'files': {相对路径: [哈希, 大小, 权限]}, 'zips': {相对路径: 成员列表}}
+    """
+    root = Path(tree).resolve()
+    files = {}
+    zips = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_NAMES)
+        for filename in sorted(filenames):
+            if filename in SKIP_NAMES:
+                continue
+            path = Path(dirpath) / filename
+            if path.is_symlink() or not path.is_file():
+                continue
+            relative = path.relative_to(root).as_posix()
+            if path.suffix.lower() == '.zip':
+                try:
+                    zips[relative] = scan_zip(store, path)
+                    continue
+                except zipfile.BadZipFile:
+                    pass
+            digest, size = store.put_file(path)
+            files[relative] = [digest, size, _file_mode(path.stat())]
+    return {'version': MANIFEST_VERSION, 'tree': tree_key(tree), 'files': files, 'zips': zips}
+
+
+def load_manifest(spec):
+    """按清单文件路径或目录树名加载清单"""
+    path = Path(spec)
+    if path.suffix == '.json' and path.is_file():
+        manifest = read_json(path)
+    elif path.is_dir() and (path / DEST_MANIFEST).exists():
+        manifest = read_json(path / DEST_MANIFEST)
+    else:
+        manifest = read_json(manifest_path(spec))
+    if manifest is None:
+        raise FileNotFoundError(f'no manifest for {spec}; run "skill_store.py ingest {spec}" first')
+    return manifest
+
+
+def diff_manifests(old, new):
+    """
+    比较两份清单
+
+    Returns:
+        dict: {'added', 'changed', 'removed'} 路径列表（zip包按成员整体比较），以及 'transfer_bytes'
+    """
+    old = old or {'files': {}, 'zips': {}}
+    result = {'added': [], 'changed': [], 'removed': [], 'transfer_bytes': 0}
+    for kind in ('files', 'zips'):
+        old_entries, new_entries = old.get(kind, {}), new.get(kind, {})
+        for path, entry in new_entries.items():
+            if path not in old_entries:
+                result['added'].append(path)
+            elif old_entries[path] != entry:
+                result['changed'].append(path)
+            else:
+                continue
+            result['transfer_bytes'] += entry[1] if kind == 'files' else sum(m[2] for m in entry)
+        result['removed'].extend(path for path in old_entries if path not in new_entries)
+    for key in ('added', 'changed', 'removed'):
+        result[key].sort()
+    return result
+
+
+def _reflink(source, target):
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, '当前平台不支持reflink', str(target))
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def link_object(digest, target, mode, link_mode):
+    """
+    从存储对象生成目标文件
+
+    Returns:
+        str: 实际使用的方式（reflink / hardlink / copy）
+    """
+    source = object_path(digest)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    if link_mode in ('auto', 'reflink'):
+        try:
+            _reflink(source, target)
+            os.chmod(target, mode)
+            return 'reflink'
+        except OSError as e:
+            target.unlink(missing_ok=True)
+            if link_mode == 'reflink' or e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY):
+                raise
+    # 硬链接与对象共用权限位（只读），可执行文件需要单独的副本
+    if link_mode in ('auto', 'hardlink') and mode == 0o644:
+        try:
+            os.link(source, target)
+            return 'hardlink'
+        except OSError as e:
+            if link_mode == 'hardlink' or e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                raise
+    shutil.copyfile(source, target)
+    os.chmod(target, mode)
+    return 'copy'
+
+
+def write_zip(members, target):
+    """按成员列表从存储对象生成zip包（条目顺序不变，时间戳固定）"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(target.name + '.tmp')
+    with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for name, digest, _, mode in members:
+            info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = mode << 16
+            zipf.writestr(info, object_path(digest).read_bytes())
+    if target.exists():
+        target.unlink()
+    tmp_path.replace(target)
+
+
+def materialize(manifest, dest, link_mode='auto'):
+    """
+    把清单还原到目标目录
+
+    目标目录中已有上次还原的清单时，只处理新增、变化和删除的文件（按清单差异部署）。
+
+    Returns:
+        dict: 差异和各还原方式的文件数
+    """
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    previous = read_json(dest / DEST_MANIFEST)
+    diff = diff_manifests(previous, manifest)
+    counts = {'reflink': 0, 'hardlink': 0, 'copy': 0, 'zip': 0, 'removed': 0}
+
+    for path in diff['removed']:
+        target = dest / path
+        if target.exists():
+            target.unlink()
+            counts['removed'] += 1
+    for path in diff['added'] + diff['changed']:
+        target = dest / path
+        if path in manifest['files']:
+            digest, _, mode = manifest['files'][path]
+            counts[link_object(digest, target, mode, link_mode)] += 1
+        else:
+            write_zip(manifest['zips'][path], target)
+            counts['zip'] += 1
+
+    write_json(dest / DEST_MANIFEST, manifest)
+    return {'diff': diff, 'counts': counts}
+
+
+def referenced_objects():
+    """所有已保存清单引用的对象哈希"""
+    digests = set()
+    for path in MANIFESTS_DIR.glob('*.json'):
+        manifest = read_json(path, {})
+        digests.update(entry[0] for entry in manifest.get('files', {}).values())
+        digests.update(member[1] for members in manifest.get('zips', {}).values() for member in members)
+    return digests
+
+
+def store_stats():
+    """各目录树的逻辑大小与去重后存储大小"""
+    trees = {}
+    logical = 0
+    for path in sorted(MANIFESTS_DIR.glob('*.json')):
+        manifest = read_json(path, {})
+        size = sum(entry[1] for entry in manifest.get('files', {}).values())
+        size += sum(m[2] for members in manifest.get('zips', {}).values() for m in members)
+        trees[manifest.get('tree', path.stem)] = {
+            'files': len(manifest.get('files', {})),
+            'zips': len(manifest.get('zips', {})),
+            'bytes': size
+        }
+        logical += size
+    objects = [p for p in OBJECTS_DIR.glob('*/*') if p.is_file()]
+    stored = sum(p.stat().st_size for p in objects)
+    return {'trees': trees, 'logical_bytes': logical, 'objects': len(objects), 'stored_bytes': stored}
+
+
+def cmd_ingest(args):
+    trees = args or list(DEFAULT_TREES)
+    store = BlobStore()
+    start = time.perf_counter()
+    for tree in trees:
+        tree_start = time.perf_counter()
+        manifest = build_manifest(store, REPO_ROOT / tree if not Path(tree).is_absolute() else tree)
+        previous = read_json(manifest_path(manifest['tree']))
+        diff = diff_manifests(previous, manifest)
+        write_json(manifest_path(manifest['tree']), manifest)
+        print(f"📥 {manifest['tree']}: {len(manifest['files'])} files, {len(manifest['zips'])} zips "
+              f"(+{len(diff['added'])} ~{len(diff['changed'])} -{len(diff['removed'])}) "
+              f"in {time.perf_counter() - tree_start:.2f}s")
+    store.save()
+    print(f"   hashed {store.hashed_bytes / 1024:.0f} KB, stored {store.stored_bytes / 1024:.0f} KB new "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+def cmd_diff(args):
+    as_json = '--json' in args
+    specs = [a for a in args if a != '--json']
+    if len(specs) != 2:
+        print("Usage: python skill_store.py diff <清单或目录树> <清单或目录树> [--json]")
+        sys.exit(1)
+    diff = diff_manifests(load_manifest(specs[0]), load_manifest(specs[1]))
+    if as_json:
+        print(json.dumps(diff, ensure_ascii=False, indent=2))
+        return
+    for key, marker in (('added', '+'), ('changed', '~'), ('removed', '-')):
+        for path in diff[key]:
+            print(f"{marker} {path}")
+    print(f"\n{len(diff['added'])} added, {len(diff['changed'])} changed, {len(diff['removed'])} removed, "
+          f"{diff['transfer_bytes'] / 1024:.0f} KB to transfer")
+
+
+def cmd_materialize(args):
+    link_mode = 'auto'
+    positional = []
+    i = 0
+    while i < len(args):
+        if args[i] == '--link' and i + 1 < len(args):
+            link_mode = args[i + 1]
+            i += 2
+            continue
+        positional.append(args[i])
+        i += 1
+    if len(positional) != 2 or link_mode not in LINK_MODES:
+        print(f"Usage: python skill_store.py materialize <目录树> <目标目录> [--link {'|'.join(LINK_MODES)}]")
+        sys.exit(1)
+    start = time.perf_counter()
+    result = materialize(load_manifest(positional[0]), positional[1], link_mode)
+    diff, counts = result['diff'], result['counts']
+    print(f"📦 {positional[1]}: +{len(diff['added'])} ~{len(diff['changed'])} -{len(diff['removed'])} "
+          f"({counts['reflink']} reflink, {counts['hardlink']} hardlink, {counts['copy']} copy, "
+          f"{counts['zip']} zip) in {time.perf_counter() - start:.2f}s")
+
+
+def cmd_stats(args):
+    stats = store_stats()
+    for tree, info in stats['trees'].items():
+        print(f"  {tree}: {info['files']} files, {info['zips']} zips, {info['bytes'] / 1024:.0f} KB")
+    saved = stats['logical_bytes'] - stats['stored_bytes']
+    print(f"📊 {stats['logical_bytes'] / 1024:.0f} KB across trees, {stats['objects']} objects "
+          f"{stats['stored_bytes'] / 1024:.0f} KB stored ({saved / 1024:.0f} KB deduplicated)")
+
+
+def cmd_gc(args):
+    keep = referenced_objects()
+    removed = 0
+    freed = 0
+    for path in OBJECTS_DIR.glob('*/*'):
+        if path.parent.name + path.name not in keep:
+            freed += path.stat().st_size
+            path.unlink()
+            removed += 1
+    print(f"🧹 removed {removed} unreferenced objects ({freed / 1024:.0f} KB)")
+
+
+COMMANDS = {
+    'ingest': cmd_ingest,
+    'diff': cmd_diff,
+    'materialize': cmd_materialize,
+    'stats': cmd_stats,
+    'gc': cmd_gc
+}
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        print(__doc__)
+        sys.exit(1)
+    COMMANDS[sys.argv[1]](sys.argv[2:])
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,13 @@
 """Lightweight connection handling for MCP servers."""
 
+import asyncio
+import json
+import shelve
+import time
 from abc import ABC, abstractmethod
-from contextlib import AsyncExitStack
-from typing import Any
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Iterable
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
@@ -66,9 +71,13 @@ class MCPConnection(ABC):
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call a tool on the MCP server with provided arguments."""
-        result = await self.session.call_tool(tool_name, arguments=arguments)
+        result = await self.call_tool_result(tool_name, arguments)
         return result.content
 
+    async def call_tool_result(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool and return the full CallToolResult, including `isError`."""
+        return await self.session.call_tool(tool_name, arguments=arguments)
+
 
 class MCPConnectionStdio(MCPConnection):
     """MCP connection using standard input/output."""
@@ -79,6 +88,10 @@ class MCPConnectionStdio(MCPConnection):
         self.args = args or []
         self.env = env
 
+    @property
+    def server_identity(self) -> dict[str, Any]:
+        return {"transport": "stdio", "command": self.command, "args": self.args}
+
     def _create_context(self):
         return stdio_client(
             StdioServerParameters(command=self.command, args=self.args, env=self.env)
@@ -93,6 +106,10 @@ class MCPConnectionSSE(MCPConnection):
         self.url = url
         self.headers = headers or {}
 
+    @property
+    def server_identity(self) -> dict[str, Any]:
+        return {"transport": "sse", "url": self.url}
+
     def _create_context(self):
         return sse_client(url=self.url, headers=self.headers)
 
@@ -105,6 +122,10 @@ class MCPConnectionHTTP(MCPConnection):
         self.url = url
         self.headers = headers or {}
 
+    @property
+    def server_identity(self) -> dict[str, Any]:
+        return {"transport": "http", "url": self.url}
+
     def _create_context(self):
         return streamablehttp_client(url=self.url, headers=self.headers)
 
@@ -149,3 +170,277 @@ def create_connection(
 
     else:
         raise ValueError(f"Unsupported transport type: {transport}. Use 'stdio', 'sse', or 'http'")
+
+
+class _PooledConnection:
+    """An MCPConnection owned by a dedicated task.
+
+    The transports enter anyio task groups, which must be exited from the task that
+    entered them. Holding each connection open in its own task lets the pool open,
+    recycle and close connections from whichever task notices they are needed.
+    """
+
+    def __init__(self, connection: MCPConnection):
+        self.connection = connection
+        self.last_used = time.monotonic()
+        self._closing = asyncio.Event()
+        self._task = None
+
+    async def open(self) -> None:
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._hold(ready))
+        await ready
+
+    async def _hold(self, ready: asyncio.Future) -> None:
+        try:
+            async with self.connection:
+                ready.set_result(None)
+                await self._closing.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not isinstance(e, Exception):
+                raise
+
+    @property
+    def closed(self) -> bool:
+        return self._closing.is_set()
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task:
+            with suppress(Exception):
+                await self._task
+
+
+class MCPConnectionPool:
+    """Pool of initialized MCP connections to a single server configuration.
+
+    Keeps `size` sessions open and hands them out with `acquire()`. A session that
+    raised during use, or that has been idle longer than `health_check_interval`,
+    is pinged before reuse and replaced if the ping fails. `list_tools()` is
+    cached for the lifetime of the pool, and `list_tools()`/`call_tool()` mirror
+    MCPConnection so a pool can be passed wherever a connection is expected.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+        **connection_kwargs: Any,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.connection_kwargs = connection_kwargs
+        self._slots: list[_PooledConnection] = []
+        self._idle = None
+        self._tools = None
+        self._tools_lock = asyncio.Lock()
+
+        # Fail fast on an invalid configuration, before any server is spawned
+        self.server_identity = create_connection(**connection_kwargs).server_identity
+
+    async def _open_slot(self) -> _PooledConnection:
+        slot = _PooledConnection(create_connection(**self.connection_kwargs))
+        await slot.open()
+        return slot
+
+    async def __aenter__(self):
+        """Open all pooled connections concurrently."""
+        self._idle = asyncio.Queue()
+        results = await asyncio.gather(
+            *(self._open_slot() for _ in range(self.size)), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        self._slots = [r for r in results if not isinstance(r, BaseException)]
+        if errors:
+            await self.__aexit__(None, None, None)
+            raise errors[0]
+        for slot in self._slots:
+            self._idle.put_nowait(slot)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close every pooled connection."""
+        await asyncio.gather(*(slot.close() for slot in self._slots))
+        self._slots = []
+        self._idle = None
+        self._tools = None
+
+    async def _is_healthy(self, slot: _PooledConnection) -> bool:
+        session = slot.connection.session
+        if session is None:
+            return False
+        try:
+            await asyncio.wait_for(session.send_ping(), self.health_check_timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _recycle(self, slot: _PooledConnection) -> _PooledConnection:
+        # If reopening fails the closed slot goes back to the queue; acquire() sees
+        # it is closed and reopens it instead of handing out a dead connection.
+        await slot.close()
+        fresh = await self._open_slot()
+        self._slots[self._slots.index(slot)] = fresh
+        return fresh
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[MCPConnection]:
+        """Borrow a healthy connection from the pool for the duration of the block."""
+        if self._idle is None:
+            raise RuntimeError("Connection pool is not open; use 'async with pool:'")
+        slot = await self._idle.get()
+        suspect = False
+        try:
+            if slot.closed:
+                slot = await self._recycle(slot)
+            elif time.monotonic() - slot.last_used > self.health_check_interval:
+                if not await self._is_healthy(slot):
+                    slot = await self._recycle(slot)
+            yield slot.connection
+        except Exception:
+            suspect = True
+            raise
+        finally:
+            slot.last_used = time.monotonic()
+            if suspect and not await self._is_healthy(slot):
+                with suppress(Exception):
+                    slot = await self._recycle(slot)
+            self._idle.put_nowait(slot)
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        """Retrieve available tools, querying the server only once per pool."""
+        async with self._tools_lock:
+            if self._tools is None:
+                async with self.acquire() as connection:
+                    self._tools = await connection.list_tools()
+        return self._tools
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool on any available pooled connection."""
+        async with self.acquire() as connection:
+            return await connection.call_tool(tool_name, arguments)
+
+    async def call_tool_result(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool on any available pooled connection and return the full CallToolResult."""
+        async with self.acquire() as connection:
+            return await connection.call_tool_result(tool_name, arguments)
+
+
+class ToolResultCache:
+    """LRU cache of tool results with a TTL and an optional on-disk backend.
+
+    Keys are the canonical JSON of the server identity (transport plus command/args
+    or URL), the tool name and the arguments, so servers sharing one cache file never
+    see each other's results for same-named tools. When `path` is given, entries are
+    also persisted with `shelve`, so repeated evaluation runs against the same server
+    can reuse results from earlier runs.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = 3600.0, path: str | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._disk = shelve.open(path) if path else None
+
+    @staticmethod
+    def make_key(tool_name: str, arguments: dict[str, Any], server: dict[str, Any] | None = None) -> str:
+        return json.dumps([server, tool_name, arguments], sort_keys=True, separators=(",", ":"), default=str)
+
+    def _fresh(self, stored_at: float) -> bool:
+        return self.ttl is None or time.time() - stored_at < self.ttl
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (found, value), counting the lookup as a hit or a miss."""
+        entry = self._entries.get(key)
+        if entry is None and self._disk is not None and key in self._disk:
+            entry = self._disk[key]
+            self._remember(key, entry)
+        if entry is not None and self._fresh(entry[0]):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+        if entry is not None:
+            self._forget(key)
+        self.misses += 1
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        entry = (time.time(), value)
+        self._remember(key, entry)
+        if self._disk is not None:
+            with suppress(Exception):  # Unpicklable results are only cached in memory
+                self._disk[key] = entry
+
+    def _remember(self, key: str, entry: tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._disk is not None:
+            with suppress(KeyError):
+                del self._disk[key]
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+
+class CachingConnection:
+    """Wrap a connection or pool so calls to allowlisted tools are memoized.
+
+    Only tools named in `cacheable_tools` are cached; they must be read-only and
+    idempotent. Results the server flags with `isError` (rate limits, timeouts and
+    other transient failures) are returned but never cached. All other calls, and
+    `list_tools()`, go straight to the wrapped connection.
+    """
+
+    def __init__(self, connection: Any, cacheable_tools: Iterable[str], cache: ToolResultCache | None = None):
+        self.connection = connection
+        self.cacheable_tools = set(cacheable_tools)
+        self.cache = cache or ToolResultCache()
+        # Env vars and headers are left out of the key: they may hold secrets and
+        # would be written to the on-disk cache in plain text.
+        self.server = getattr(connection, "server_identity", None)
+
+    async def __aenter__(self):
+        await self.connection.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.connection.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.cache.close()
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return await self.connection.list_tools()
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool, serving allowlisted tools from the cache when possible."""
+        if tool_name not in self.cacheable_tools:
+            return await self.connection.call_tool(tool_name, arguments)
+
+        key = ToolResultCache.make_key(tool_name, arguments, self.server)
+        found, value = self.cache.get(key)
+        if found:
+            return value
+        result = await self.connection.call_tool_result(tool_name, arguments)
+        if not result.isError:
+            self.cache.put(key, result.content)
+        return result.content
@@ -3,26 +3,151 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--jobs N] [--force] [--verbose]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --jobs 8 --force
+
+Archives are deterministic: entries are sorted, timestamps are fixed and
+already-compressed formats are stored as-is. The content manifest hash is
+recorded in the zip comment, so an unchanged skill is not rebuilt.
 """
 
+import hashlib
+import os
 import sys
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from quick_validate import validate_skill
 
+# Bump when the archive layout changes so existing packages are rebuilt
+PACKAGER_VERSION = 1
+
+# Fixed entry timestamp (the earliest date a zip file can represent)
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+MANIFEST_PREFIX = b"skill-manifest-sha256:"
+
+# Formats that are already compressed; deflating them again only costs time
+STORED_SUFFIXES = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.ico',
+    '.zip', '.skill', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.rar',
+    '.woff', '.woff2', '.mp3', '.mp4', '.m4a', '.ogg', '.webm', '.mov',
+    '.docx', '.xlsx', '.pptx', '.jar',
+}
+
+COMPRESS_LEVEL = 6
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def collect_files(skill_path, exclude=()):
+    """Return the files to package as sorted (arcname, path) pairs."""
+    exclude = {Path(p).resolve() for p in exclude}
+    files = []
+    for file_path in skill_path.rglob('*'):
+        if file_path.is_file() and file_path.resolve() not in exclude:
+            arcname = file_path.relative_to(skill_path.parent).as_posix()
+            files.append((arcname, file_path))
+    files.sort()
+    return files
+
+
+def _file_digest(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_executable(file_path):
+    return os.access(file_path, os.X_OK)
 
-def package_skill(skill_path, output_dir=None):
+
+def manifest_hash(files, executor):
+    """
+    Hash the archive contents: every entry name, executable bit and file digest.
+
+    Args:
+        files: Sorted (arcname, path) pairs
+        executor: Thread pool used to hash files in parallel
+
+    Returns:
+        Hex digest identifying the package contents
+    """
+    digests = executor.map(_file_digest, [path for _, path in files])
+    manifest = hashlib.sha256(f"package_skill v{PACKAGER_VERSION}\n".encode())
+    for (arcname, path), digest in zip(files, digests):
+        manifest.update(f"{arcname}\0{int(_is_executable(path))}\0{digest}\n".encode())
+    return manifest.hexdigest()
+
+
+def read_manifest_hash(skill_filename):
+    """Return the manifest hash recorded in an existing .skill file, or None."""
+    try:
+        with zipfile.ZipFile(skill_filename) as zipf:
+            comment = zipf.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if comment.startswith(MANIFEST_PREFIX):
+        return comment[len(MANIFEST_PREFIX):].decode('ascii', 'replace')
+    return None
+
+
+def _prepare_entry(item):
+    """
+    Read one file and build its zip entry (runs in a worker thread).
+
+    Returns:
+        (ZipInfo, data) with a fixed timestamp, the file mode and the compression
+        to use: already-compressed formats and empty files are stored as-is
+    """
+    arcname, file_path = item
+    data = file_path.read_bytes()
+
+    zinfo = zipfile.ZipInfo(arcname, date_time=FIXED_DATE_TIME)
+    zinfo.create_system = 3
+    zinfo.external_attr = (0o755 if _is_executable(file_path) else 0o644) << 16
+    if file_path.suffix.lower() in STORED_SUFFIXES or not data:
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+    return zinfo, data
+
+
+def prepared_entries(files, executor, window):
+    """
+    Yield prepared entries in file order, keeping at most `window` files in memory.
+
+    Args:
+        files: Sorted (arcname, path) pairs
+        executor: Thread pool used to read files in parallel
+        window: Maximum number of files read ahead of the writer
+    """
+    pending = deque()
+    for item in files:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(_prepare_entry, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def package_skill(skill_path, output_dir=None, jobs=None, force=False, verbose=False):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        jobs: Number of threads hashing and reading files (defaults to the CPU count)
+        force: Rebuild even if the existing .skill has the same content manifest
+        verbose: Print one line per packaged file
 
     Returns:
         Path to the created .skill file, or None if error
@@ -62,43 +187,82 @@ def package_skill(skill_path, output_dir=None):
         output_path = Path.cwd()
 
     skill_filename = output_path / f"{skill_name}.skill"
+    tmp_filename = skill_filename.with_name(skill_filename.name + '.tmp')
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+        start = time.perf_counter()
+        files = collect_files(skill_path, exclude=(skill_filename, tmp_filename))
+
+        workers = jobs or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            manifest = manifest_hash(files, executor)
+            if not force and skill_filename.exists() and read_manifest_hash(skill_filename) == manifest:
+                print(f"⏭️  Skill unchanged, keeping existing package: {skill_filename}")
+                return skill_filename
 
+            stored = 0
+            total_size = 0
+            with zipfile.ZipFile(tmp_filename, 'w') as zipf:
+                for zinfo, data in prepared_entries(files, executor, window=workers * 2):
+                    zipf.writestr(zinfo, data, compresslevel=COMPRESS_LEVEL)
+                    stored += zinfo.compress_type == zipfile.ZIP_STORED
+                    total_size += zinfo.file_size
+                    if verbose:
+                        print(f"  Added: {zinfo.filename}")
+                zipf.comment = MANIFEST_PREFIX + manifest.encode('ascii')
+
+        tmp_filename.replace(skill_filename)
+        elapsed = time.perf_counter() - start
+        print(f"  {len(files)} files ({stored} stored without recompression), "
+              f"{total_size / 1024:.0f} KB -> {skill_filename.stat().st_size / 1024:.0f} KB in {elapsed:.2f}s")
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
         return skill_filename
 
     except Exception as e:
+        tmp_filename.unlink(missing_ok=True)
         print(f"❌ Error creating .skill file: {e}")
         return None
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
+    args = sys.argv[1:]
+    jobs = None
+    force = False
+    verbose = False
+    positional = []
+    i = 0
+    while i < len(args):
+        if args[i] == '--jobs' and i + 1 < len(args):
+            jobs = int(args[i + 1])
+            i += 2
+            continue
+        if args[i] == '--force':
+            force = True
+        elif args[i] == '--verbose':
+            verbose = True
+        else:
+            positional.append(args[i])
+        i += 1
+
+    if not positional:
+        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory] "
+              "[--jobs N] [--force] [--verbose]")
         print("\nExample:")
         print("  python utils/package_skill.py skills/public/my-skill")
         print("  python utils/package_skill.py skills/public/my-skill ./dist")
+        print("  python utils/package_skill.py skills/public/my-skill ./dist --jobs 8 --force")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    skill_path = positional[0]
+    output_dir = positional[1] if len(positional) > 1 else None
 
     print(f"📦 Packaging skill: {skill_path}")
     if output_dir:
         print(f"   Output directory: {output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(skill_path, output_dir, jobs=jobs, force=force, verbose=verbose)
 
     if result:
         sys.exit(0)
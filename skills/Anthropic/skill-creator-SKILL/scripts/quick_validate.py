@@ -1,95 +1,330 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py --all <root> [<root> ...] [--jobs N] [--cache PATH] [--no-cache]
+
+The --all mode discovers every skill (a directory containing SKILL.md) under
+the given roots, validates them in parallel, collects every violation per
+skill and prints a JSON report. Results are cached by SKILL.md mtime and
+frontmatter hash, so re-runs only re-validate skills that changed.
 """
 
 import sys
 import os
 import re
+import json
+import hashlib
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
-    skill_path = Path(skill_path)
+# Bump when the checks change so cached results are discarded
+VALIDATOR_VERSION = 1
 
-    # Check SKILL.md exists
-    skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
-        return False, "SKILL.md not found"
+ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
+
+DEFAULT_CACHE = '.quick_validate_cache.json'
+# Below this many uncached skills, validating in-process beats starting workers
+PARALLEL_MIN_SKILLS = 32
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv'}
+READ_BLOCK_SIZE = 4096
 
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
 
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
+def read_frontmatter_bytes(skill_md):
+    """
+    Read SKILL.md only up to the end of its YAML frontmatter.
 
-    frontmatter_text = match.group(1)
+    Returns:
+        (frontmatter_bytes, error): the text between the '---' fences, or None and an error message
+    """
+    with open(skill_md, 'rb') as f:
+        data = f.read(READ_BLOCK_SIZE)
+        if not data.startswith(b'---'):
+            return None, "No YAML frontmatter found"
+        # Accept CRLF line endings like read_text() does (SKILL.md files edited on Windows)
+        if data.startswith(b'---\n'):
+            start = 4
+        elif data.startswith(b'---\r\n'):
+            start = 5
+        else:
+            return None, "Invalid frontmatter format"
+        # Same boundary as the regex ^---\n(.*?)\n--- : the first "\n---" after the opening line
+        end = data.find(b'\n---', start)
+        while end < 0:
+            block = f.read(READ_BLOCK_SIZE)
+            if not block:
+                return None, "Invalid frontmatter format"
+            search_from = max(len(data) - 3, start)
+            data += block
+            end = data.find(b'\n---', search_from)
+    frontmatter = data[start:end].replace(b'\r\n', b'\n')
+    if frontmatter.endswith(b'\r'):
+        frontmatter = frontmatter[:-1]
+    return frontmatter, None
 
-    # Parse YAML frontmatter
+
+def parse_frontmatter(frontmatter_bytes):
+    """
+    Parse frontmatter bytes into a dictionary.
+
+    Returns:
+        (frontmatter, error): the parsed dictionary, or None and an error message
+    """
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
+        frontmatter = yaml.safe_load(frontmatter_bytes.decode('utf-8'))
+    except UnicodeDecodeError as e:
+        return None, f"Frontmatter is not valid UTF-8: {e}"
     except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        return None, f"Invalid YAML in frontmatter: {e}"
+    if not isinstance(frontmatter, dict):
+        return None, "Frontmatter must be a YAML dictionary"
+    return frontmatter, None
+
+
+def load_frontmatter(skill_path):
+    """
+    Read and parse the frontmatter of a skill directory.
+
+    Returns:
+        (frontmatter, error): the parsed dictionary, or None and an error message
+    """
+    skill_md = Path(skill_path) / 'SKILL.md'
+    if not skill_md.exists():
+        return None, "SKILL.md not found"
+    frontmatter_bytes, error = read_frontmatter_bytes(skill_md)
+    if error:
+        return None, error
+    return parse_frontmatter(frontmatter_bytes)
+
 
-    # Define allowed properties
-    ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
+def check_frontmatter(frontmatter):
+    """Return every violation in a parsed frontmatter dictionary (empty list if valid)"""
+    violations = []
 
     # Check for unexpected properties (excluding nested keys under metadata)
     unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
     if unexpected_keys:
-        return False, (
-            f"Unexpected key(s) in SKILL.md frontmatter: {', '.join(sorted(unexpected_keys))}. "
+        violations.append(
+            f"Unexpected key(s) in SKILL.md frontmatter: {', '.join(sorted(map(str, unexpected_keys)))}. "
             f"Allowed properties are: {', '.join(sorted(ALLOWED_PROPERTIES))}"
         )
 
     # Check required fields
     if 'name' not in frontmatter:
-        return False, "Missing 'name' in frontmatter"
+        violations.append("Missing 'name' in frontmatter")
     if 'description' not in frontmatter:
-        return False, "Missing 'description' in frontmatter"
+        violations.append("Missing 'description' in frontmatter")
 
     # Extract name for validation
     name = frontmatter.get('name', '')
     if not isinstance(name, str):
-        return False, f"Name must be a string, got {type(name).__name__}"
+        violations.append(f"Name must be a string, got {type(name).__name__}")
+        name = ''
     name = name.strip()
     if name:
         # Check naming convention (hyphen-case: lowercase with hyphens)
         if not re.match(r'^[a-z0-9-]+$', name):
-            return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+            violations.append(f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)")
         if name.startswith('-') or name.endswith('-') or '--' in name:
-            return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
+            violations.append(f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens")
         # Check name length (max 64 characters per spec)
         if len(name) > 64:
-            return False, f"Name is too long ({len(name)} characters). Maximum is 64 characters."
+            violations.append(f"Name is too long ({len(name)} characters). Maximum is 64 characters.")
 
     # Extract and validate description
     description = frontmatter.get('description', '')
     if not isinstance(description, str):
-        return False, f"Description must be a string, got {type(description).__name__}"
+        violations.append(f"Description must be a string, got {type(description).__name__}")
+        description = ''
     description = description.strip()
     if description:
         # Check for angle brackets
         if '<' in description or '>' in description:
-            return False, "Description cannot contain angle brackets (< or >)"
+            violations.append("Description cannot contain angle brackets (< or >)")
         # Check description length (max 1024 characters per spec)
         if len(description) > 1024:
-            return False, f"Description is too long ({len(description)} characters). Maximum is 1024 characters."
+            violations.append(f"Description is too long ({len(description)} characters). Maximum is 1024 characters.")
+
+    return violations
 
+
+def validate_skill(skill_path):
+    """Basic validation of a skill"""
+    frontmatter, error = load_frontmatter(skill_path)
+    if error:
+        return False, error
+    violations = check_frontmatter(frontmatter)
+    if violations:
+        return False, violations[0]
     return True, "Skill is valid!"
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
+
+def discover_skills(roots):
+    """Find skill directories (containing SKILL.md) under the given roots, without descending into skills"""
+    skills = []
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            if 'SKILL.md' in filenames:
+                skills.append(Path(dirpath))
+                dirnames[:] = []
+                continue
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+    return sorted(set(skills))
+
+
+def _validate_entry(item):
+    """
+    Validate one SKILL.md; returns (frontmatter hash, name, violations).
+
+    If the frontmatter hash equals known_hash, parsing is skipped and
+    (hash, None, None) is returned so the cached result can be reused.
+    """
+    skill_md, known_hash = item
+    try:
+        frontmatter_bytes, error = read_frontmatter_bytes(skill_md)
+    except OSError as e:
+        return None, None, [f"Cannot read SKILL.md: {e}"]
+    if error:
+        return None, None, [error]
+    digest = hashlib.sha256(frontmatter_bytes).hexdigest()
+    if digest == known_hash:
+        return digest, None, None
+    frontmatter, error = parse_frontmatter(frontmatter_bytes)
+    if error:
+        return digest, None, [error]
+    name = frontmatter.get('name')
+    return digest, name if isinstance(name, str) else None, check_frontmatter(frontmatter)
+
+
+def _load_cache(cache_path):
+    if not cache_path or not cache_path.exists():
+        return {}
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+    except ValueError:
+        return {}
+    if data.get('version') != VALIDATOR_VERSION:
+        return {}
+    return data.get('entries', {})
+
+
+def _save_cache(cache_path, entries):
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    tmp_path.write_text(json.dumps({'version': VALIDATOR_VERSION, 'entries': entries}), encoding='utf-8')
+    tmp_path.replace(cache_path)
+
+
+def validate_tree(roots, jobs=None, cache_path=DEFAULT_CACHE):
+    """
+    Validate every skill under the given roots.
+
+    Args:
+        roots: Directories to search for skills
+        jobs: Worker processes for uncached skills (defaults to the CPU count)
+        cache_path: JSON cache file, or None to disable caching
+
+    Returns:
+        dict report with per-skill results and all violations
+    """
+    cache_path = Path(cache_path) if cache_path else None
+    cache = _load_cache(cache_path)
+    skills = discover_skills(roots)
+
+    results = {}
+    stale = []
+    for skill in skills:
+        skill_md = skill / 'SKILL.md'
+        key = str(skill_md.resolve())
+        stat = skill_md.stat()
+        entry = cache.get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            results[key] = entry
+        else:
+            stale.append((key, skill_md, stat))
+
+    jobs = jobs or os.cpu_count() or 1
+    items = [(skill_md, (cache.get(key) or {}).get('hash')) for key, skill_md, _ in stale]
+    if jobs > 1 and len(items) >= PARALLEL_MIN_SKILLS:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            outcomes = list(executor.map(_validate_entry, items, chunksize=16))
+    else:
+        outcomes = [_validate_entry(item) for item in items]
+
+    revalidated = 0
+    for (key, _, stat), (digest, name, violations) in zip(stale, outcomes):
+        if violations is None:
+            # Touched but the frontmatter is unchanged: reuse the cached result
+            name, violations = cache[key]['name'], cache[key]['violations']
+        else:
+            revalidated += 1
+        results[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'hash': digest,
+                        'name': name, 'violations': violations}
+
+    if cache_path:
+        cache.update(results)
+        _save_cache(cache_path, cache)
+
+    report_skills = []
+    for skill in skills:
+        entry = results[str((skill / 'SKILL.md').resolve())]
+        report_skills.append({
+            'path': str(skill),
+            'name': entry['name'],
+            'valid': not entry['violations'],
+            'violations': entry['violations']
+        })
+    invalid = sum(not item['valid'] for item in report_skills)
+    return {
+        'roots': [str(root) for root in roots],
+        'skills': len(report_skills),
+        'valid': len(report_skills) - invalid,
+        'invalid': invalid,
+        'revalidated': revalidated,
+        'cached': len(report_skills) - revalidated,
+        'results': report_skills
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] == '--all':
+        roots = []
+        jobs = None
+        cache_path = DEFAULT_CACHE
+        i = 1
+        while i < len(args):
+            if args[i] == '--jobs' and i + 1 < len(args):
+                jobs = int(args[i + 1])
+                i += 2
+                continue
+            if args[i] == '--cache' and i + 1 < len(args):
+                cache_path = args[i + 1]
+                i += 2
+                continue
+            if args[i] == '--no-cache':
+                cache_path = None
+            else:
+                roots.append(args[i])
+            i += 1
+        if not roots:
+            print("Usage: python quick_validate.py --all <root> [<root> ...] [--jobs N] [--cache PATH] [--no-cache]")
+            sys.exit(1)
+        report = validate_tree(roots, jobs=jobs, cache_path=cache_path)
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        sys.exit(0 if report['invalid'] == 0 else 1)
+
+    if len(args) != 1:
         print("Usage: python quick_validate.py <skill_directory>")
+        print("       python quick_validate.py --all <root> [<root> ...] [--jobs N] [--cache PATH] [--no-cache]")
         sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
+
+    valid, message = validate_skill(args[0])
     print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+    sys.exit(0 if valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+# Example: Profile the cart-add flow of the food-delivery app
+#
+#   python scripts/with_server.py --server "npm start" --port 3000 -- \
+#       python scripts/perf_profile.py examples/perf_cart_flow.py --base-url http://localhost:3000 \
+#           --runs 3 --json perf.json --baseline perf-baseline.json
+#
+# Each step's latency is reported as "step <name>_ms"; page loads, long tasks,
+# heap and the network waterfall are captured around the whole flow.
+
+
+async def test_cart_add(t):
+    async with t.step('open products'):
+        await t.goto('/products')
+        await t.page.locator('.product-card').first.wait_for(state='visible')
+
+    async with t.step('add to cart'):
+        await t.page.locator('.product-card').first.locator('button:has-text("加入购物车")').click()
+        await t.wait_for_text('.cart-count', r'[1-9]')
+
+    async with t.step('open cart'):
+        await t.page.locator('a[href="/cart"]').click()
+        await t.page.locator('.cart-item').first.wait_for(state='visible')
+
+    async with t.step('reload products'):
+        await t.goto('/products')
+        await t.wait_for_text('.cart-count', r'[1-9]')
@@ -0,0 +1,45 @@
+# Example: Small UI checks run concurrently in one warm browser
+#
+#   python scripts/with_server.py --server "npm run dev" --port 5173 -- \
+#       python scripts/browser_pool.py examples/pooled_tests.py --base-url http://localhost:5173
+#
+# Each test gets a fresh isolated context (empty localStorage/cookies), so tests
+# can run in parallel without seeing each other's state.
+
+
+async def test_buttons_render(t):
+    async with t.step('load page'):
+        await t.goto('/', wait_until='networkidle')
+
+    async with t.step('discover buttons'):
+        buttons = t.page.locator('button')
+        await buttons.first.wait_for(state='visible')
+        count = await buttons.count()
+        assert count > 0, 'no buttons rendered'
+
+
+async def test_click_updates_state(t):
+    # Targets the counter button of the Vite starter app ("count is 0");
+    # point the selector and expected text at your own app's state
+    async with t.step('load page'):
+        await t.goto('/', wait_until='networkidle')
+        await t.wait_for_text('button', r'count is 0')
+
+    async with t.step('click counter'):
+        await t.page.locator('button').first.click()
+
+    async with t.step('wait for state change'):
+        # Wait for the click's visible effect instead of sleeping a fixed time
+        await t.wait_for_text('button', r'count is 1')
+
+
+async def test_local_storage_persists(t):
+    async with t.step('load page'):
+        await t.goto('/')
+
+    async with t.step('write and reload'):
+        await t.page.evaluate("localStorage.setItem('pooled-example', 'ok')")
+        await t.page.reload()
+
+    async with t.step('read back'):
+        assert await t.wait_for_storage('pooled-example') == 'ok'
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Run many small Playwright UI checks against one warm browser.
+
+A single browser process is launched once; every test gets its own fresh,
+isolated BrowserContext (separate cookies, localStorage and cache), and tests
+run concurrently across contexts. Each test records per-step timings, and the
+wait helpers replace fixed time.sleep() calls with selector/event-based waits.
+
+A test module defines async functions named test_* that take one argument:
+
+    from browser_pool import expect
+
+    async def test_add_to_cart(t):
+        async with t.step('open products'):
+            await t.goto('/products')
+            await t.page.locator('.product-card').first.wait_for()
+        async with t.step('add first product'):
+            await t.page.locator('.product-card button').first.click()
+            await t.wait_for_text('.cart-count', r'[1-9]')  # instead of time.sleep(1)
+
+Usage:
+    python scripts/browser_pool.py tests/test_cart.py tests/test_nav.py \
+        [--base-url http://localhost:5173] [--concurrency 4] [--headed] [--json report.json]
+
+    # Together with with_server.py
+    python scripts/with_server.py --server "npm run dev" --port 5173 -- \
+        python scripts/browser_pool.py tests/test_cart.py --base-url http://localhost:5173
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import inspect
+import json
+import re
+import sys
+import time
+import traceback
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from playwright.async_api import async_playwright, expect
+
+__all__ = ['BrowserPool', 'TestContext', 'expect', 'run_tests', 'load_tests']
+
+DEFAULT_TIMEOUT_MS = 10000
+
+
+class TestContext:
+    """One test's isolated browser context and page, with step timings and wait helpers."""
+
+    def __init__(self, name, context, page, base_url=None):
+        self.name = name
+        self.context = context
+        self.page = page
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.steps = []
+
+    @asynccontextmanager
+    async def step(self, name):
+        """Time a named step; failed steps are recorded too."""
+        start = time.perf_counter()
+        entry = {'name': name, 'ok': True}
+        try:
+            yield
+        except BaseException:
+            entry['ok'] = False
+            raise
+        finally:
+            entry['ms'] = round((time.perf_counter() - start) * 1000, 1)
+            self.steps.append(entry)
+
+    async def goto(self, url, wait_until='load'):
+        """Navigate, resolving paths against --base-url."""
+        if self.base_url and url.startswith('/'):
+            url = self.base_url + url
+        return await self.page.goto(url, wait_until=wait_until)
+
+    async def wait_for_text(self, selector, pattern, timeout=DEFAULT_TIMEOUT_MS):
+        """Wait until the element's text matches a regex (re-checked on every DOM change, no fixed sleep)."""
+        await expect(self.page.locator(selector).first).to_have_text(re.compile(pattern), timeout=timeout)
+
+    async def wait_for_count(self, selector, count, timeout=DEFAULT_TIMEOUT_MS):
+        """Wait until exactly `count` elements match the selector."""
+        await expect(self.page.locator(selector)).to_have_count(count, timeout=timeout)
+
+    async def wait_for_response(self, url_pattern, action, timeout=DEFAULT_TIMEOUT_MS):
+        """Run an action (async callable) and wait for the network response it triggers."""
+        async with self.page.expect_response(re.compile(url_pattern), timeout=timeout) as response_info:
+            await action()
+        return await response_info.value
+
+    async def wait_for_storage(self, key, timeout=DEFAULT_TIMEOUT_MS):
+        """Wait until localStorage holds a value for `key` and return it."""
+        handle = await self.page.wait_for_function(
+            'key => window.localStorage.getItem(key)', arg=key, timeout=timeout)
+        return await handle.json_value()
+
+
+class BrowserPool:
+    """
+    A persistent browser that hands out fresh isolated contexts.
+
+    Use as an async context manager; contexts are limited to `max_contexts`
+    at a time so many concurrent tests don't overload the machine.
+    """
+
+    def __init__(self, browser='chromium', headless=True, max_contexts=4, base_url=None,
+                 timeout_ms=DEFAULT_TIMEOUT_MS, launch_options=None, context_options=None):
+        self.browser_name = browser
+        self.headless = headless
+        self.base_url = base_url
+        self.timeout_ms = timeout_ms
+        self.launch_options = launch_options or {}
+        self.context_options = context_options or {}
+        self.semaphore = asyncio.Semaphore(max_contexts)
+        self.launch_seconds = None
+        self._playwright = None
+        self.browser = None
+
+    async def __aenter__(self):
+        start = time.perf_counter()
+        self._playwright = await async_playwright().start()
+        browser_type = getattr(self._playwright, self.browser_name)
+        self.browser = await browser_type.launch(headless=self.headless, **self.launch_options)
+        self.launch_seconds = time.perf_counter() - start
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self.browser:
+            await self.browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+    @asynccontextmanager
+    async def context(self, name='test'):
+        """Yield a TestContext backed by a new BrowserContext; closed afterwards."""
+        async with self.semaphore:
+            context = await self.browser.new_context(base_url=self.base_url, **self.context_options)
+            context.set_default_timeout(self.timeout_ms)
+            try:
+                page = await context.new_page()
+                yield TestContext(name, context, page, self.base_url)
+            finally:
+                await context.close()
+
+
+async def _run_one(pool, name, func):
+    start = time.perf_counter()
+    result = {'name': name, 'passed': True}
+    async with pool.context(name) as t:
+        try:
+            await func(t)
+        except Exception as e:
+            result['passed'] = False
+            result['error'] = f"{type(e).__name__}: {e}"
+            result['traceback'] = traceback.format_exc()
+        result['steps'] = t.steps
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+async def run_tests(tests, concurrency=4, headless=True, base_url=None, browser='chromium',
+                    timeout_ms=DEFAULT_TIMEOUT_MS):
+    """
+    Run (name, async function) pairs concurrently against one browser.
+
+    Returns:
+        dict with launch time, wall time and one result per test
+    """
+    start = time.perf_counter()
+    async with BrowserPool(browser, headless, concurrency, base_url, timeout_ms) as pool:
+        results = await asyncio.gather(*(_run_one(pool, name, func) for name, func in tests))
+    return {
+        'browser': browser,
+        'concurrency': concurrency,
+        'launch_seconds': round(pool.launch_seconds, 3),
+        'wall_seconds': round(time.perf_counter() - start, 3),
+        'passed': sum(r['passed'] for r in results),
+        'failed': sum(not r['passed'] for r in results),
+        'tests': results
+    }
+
+
+def load_tests(paths, pattern=None):
+    """Collect async test_* functions from the given files, optionally filtered by a name regex."""
+    tests = []
+    name_filter = re.compile(pattern) if pattern else None
+    for path in paths:
+        path = Path(path).resolve()
+        sys.path.insert(0, str(path.parent))
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for attr, func in vars(module).items():
+            if attr.startswith('test_') and inspect.iscoroutinefunction(func):
+                name = f"{path.stem}::{attr}"
+                if name_filter is None or name_filter.search(name):
+                    tests.append((name, func))
+    return tests
+
+
+def print_report(report):
+    for result in report['tests']:
+        mark = '✓' if result['passed'] else '✗'
+        print(f"{mark} {result['name']} ({result['seconds']:.2f}s)")
+        for step in result['steps']:
+            print(f"    {'·' if step['ok'] else '✗'} {step['name']}: {step['ms']:.0f}ms")
+        if not result['passed']:
+            print(f"    {result['error']}")
+    print(f"\n{report['passed']} passed, {report['failed']} failed in {report['wall_seconds']:.2f}s "
+          f"(browser launch {report['launch_seconds']:.2f}s, concurrency {report['concurrency']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run Playwright tests concurrently in one warm browser')
+    parser.add_argument('files', nargs='+', help='Test files containing async test_* functions')
+    parser.add_argument('--base-url', help='Base URL for relative goto() paths')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent browser contexts (default: 4)')
+    parser.add_argument('--browser', default='chromium', choices=['chromium', 'firefox', 'webkit'])
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT_MS, help='Default wait timeout in ms')
+    parser.add_argument('-k', dest='pattern', help='Only run tests whose name matches this regex')
+    parser.add_argument('--json', dest='json_path', help='Write the report (with step timings) to this file')
+    args = parser.parse_args()
+
+    tests = load_tests(args.files, args.pattern)
+    if not tests:
+        print("Error: No async test_* functions found")
+        sys.exit(1)
+
+    report = asyncio.run(run_tests(tests, args.concurrency, not args.headed, args.base_url,
+                                   args.browser, args.timeout))
+    print_report(report)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"Report saved to {args.json_path}")
+    sys.exit(0 if report['failed'] == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
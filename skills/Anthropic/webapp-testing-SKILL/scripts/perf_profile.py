@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Profile page-load and interaction performance of a scripted Playwright flow.
+
+Flows use the same format as browser_pool.py: async test_*(t) functions whose
+actions are wrapped in `async with t.step('name'):`. Each flow is run --runs
+times in a fresh context (Chromium), and the report records:
+
+- navigation timing per page load (TTFB, DOMContentLoaded, load, FCP, LCP)
+- long tasks (>50ms main-thread blocks) from a PerformanceObserver
+- JS heap and main-thread time from CDP Performance.getMetrics
+- the network waterfall (start/end/duration, status, transfer size per request)
+- per-step (action) latency
+- optionally a Playwright trace per flow (--trace DIR, open with `playwright show-trace`)
+
+Numbers are medians across runs. With --baseline, every summary metric is compared
+to the stored one and the script exits 1 when a metric regressed by more than
+--tolerance (relative) and its absolute floor.
+
+Usage:
+    python scripts/perf_profile.py examples/perf_cart_flow.py --base-url http://localhost:3000 \
+        [--runs 3] [--json perf.json] [--trace traces/] \
+        [--baseline perf-baseline.json [--tolerance 0.2]] [--save-baseline perf-baseline.json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from browser_pool import DEFAULT_TIMEOUT_MS, TestContext, load_tests
+from playwright.async_api import async_playwright
+
+# Collected in the page and kept in sessionStorage so entries survive full navigations
+PERF_INIT_SCRIPT = """
+(() => {
+  const KEY = '__perfProfile';
+  const read = () => JSON.parse(sessionStorage.getItem(KEY) || '{"navigations":[],"longTasks":[]}');
+  const write = data => sessionStorage.setItem(KEY, JSON.stringify(data));
+  let lcp = null;
+  try {
+    new PerformanceObserver(list => {
+      const data = read();
+      for (const entry of list.getEntries()) {
+        data.longTasks.push({path: location.pathname, start: entry.startTime, duration: entry.duration});
+      }
+      write(data);
+    }).observe({type: 'longtask', buffered: true});
+    new PerformanceObserver(list => {
+      const entries = list.getEntries();
+      lcp = entries[entries.length - 1].startTime;
+    }).observe({type: 'largest-contentful-paint', buffered: true});
+  } catch (e) {}
+  window.addEventListener('load', () => setTimeout(() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) return;
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    const data = read();
+    data.navigations.push({
+      path: location.pathname,
+      ttfb_ms: nav.responseStart - nav.requestStart,
+      dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+      load_ms: nav.loadEventEnd,
+      fcp_ms: fcp ? fcp.startTime : null,
+      lcp_ms: lcp,
+      transfer_kb: nav.transferSize / 1024
+    });
+    write(data);
+  }, 0));
+})();
+"""
+
+# CDP Performance.getMetrics values reported (durations are in seconds, converted to ms)
+CDP_DURATIONS = ('ScriptDuration', 'TaskDuration', 'LayoutDuration', 'RecalcStyleDuration')
+
+# Absolute change below which a relative regression is ignored (noise floor)
+ABSOLUTE_FLOORS = {'_ms': 20.0, '_mb': 1.0, '_kb': 10.0, 'count': 1.0, 'requests': 1.0}
+
+
+class NetworkRecorder:
+    """Builds a network waterfall from Playwright request events."""
+
+    def __init__(self, page):
+        self.origin = time.perf_counter()
+        self.entries = []
+        self.pending = []
+        page.on('requestfinished', lambda request: self.pending.append(asyncio.ensure_future(self._record(request))))
+        page.on('requestfailed', lambda request: self.entries.append({
+            'url': request.url, 'type': request.resource_type, 'failed': request.failure
+        }))
+
+    async def _record(self, request):
+        timing = request.timing
+        response = await request.response()
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            sizes = {}
+        # timing.startTime is epoch ms; other fields are ms relative to it (-1 when not applicable)
+        end = timing['responseEnd'] if timing['responseEnd'] >= 0 else 0
+        self.entries.append({
+            'url': request.url,
+            'method': request.method,
+            'type': request.resource_type,
+            'status': response.status if response else None,
+            'start_epoch_ms': timing['startTime'],
+            'dns_ms': max(timing['domainLookupEnd'] - timing['domainLookupStart'], 0),
+            'connect_ms': max(timing['connectEnd'] - timing['connectStart'], 0),
+            'ttfb_ms': max(timing['responseStart'] - timing['requestStart'], 0),
+            'duration_ms': end,
+            'transfer_bytes': sizes.get('responseBodySize', 0) + sizes.get('responseHeadersSize', 0)
+        })
+
+    async def waterfall(self):
+        await asyncio.gather(*self.pending, return_exceptions=True)
+        finished = [e for e in self.entries if 'start_epoch_ms' in e]
+        first = min((e['start_epoch_ms'] for e in finished), default=0)
+        for entry in finished:
+            entry['start_ms'] = round(entry.pop('start_epoch_ms') - first, 1)
+        return sorted(self.entries, key=lambda e: e.get('start_ms', float('inf')))
+
+
+async def profile_once(browser, name, func, base_url, timeout_ms, trace_path=None):
+    """Run a flow once in a fresh context and collect its raw measurements."""
+    context = await browser.new_context(base_url=base_url)
+    context.set_default_timeout(timeout_ms)
+    await context.add_init_script(PERF_INIT_SCRIPT)
+    if trace_path:
+        await context.tracing.start(screenshots=True, snapshots=True, sources=False)
+    try:
+        page = await context.new_page()
+        cdp = await context.new_cdp_session(page)
+        await cdp.send('Performance.enable')
+        network = NetworkRecorder(page)
+        t = TestContext(name, context, page, base_url)
+
+        error = None
+        start = time.perf_counter()
+        try:
+            await func(t)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        wall = time.perf_counter() - start
+
+        # Let the last load handler and observers flush
+        await page.wait_for_timeout(100)
+        collected = await page.evaluate("JSON.parse(sessionStorage.getItem('__perfProfile') || 'null')") or {}
+        metrics = {m['name']: m['value'] for m in (await cdp.send('Performance.getMetrics'))['metrics']}
+        waterfall = await network.waterfall()
+    finally:
+        if trace_path:
+            await context.tracing.stop(path=str(trace_path))
+        await context.close()
+
+    return {
+        'error': error,
+        'wall_ms': wall * 1000,
+        'steps': t.steps,
+        'navigations': collected.get('navigations', []),
+        'long_tasks': collected.get('longTasks', []),
+        'heap': {'used_mb': metrics.get('JSHeapUsedSize', 0) / 2**20,
+                 'total_mb': metrics.get('JSHeapTotalSize', 0) / 2**20},
+        'cdp': {f'{key}_ms': metrics.get(key, 0) * 1000 for key in CDP_DURATIONS},
+        'dom_nodes': metrics.get('Nodes'),
+        'network': waterfall
+    }
+
+
+def summarize_run(run):
+    """Flatten one run into {metric: value}; every metric is lower-is-better."""
+    summary = {'wall_ms': run['wall_ms']}
+    seen = {}
+    for nav in run['navigations']:
+        # Repeated visits to the same path get a #2, #3 suffix
+        seen[nav['path']] = seen.get(nav['path'], 0) + 1
+        label = nav['path'] if seen[nav['path']] == 1 else f"{nav['path']}#{seen[nav['path']]}"
+        for key, value in nav.items():
+            if key != 'path' and value is not None:
+                summary[f'nav {label} {key}'] = value
+    for step in run['steps']:
+        summary[f"step {step['name']}_ms"] = step['ms']
+    durations = [task['duration'] for task in run['long_tasks']]
+    summary['long_tasks count'] = len(durations)
+    summary['long_tasks total_ms'] = sum(durations)
+    summary['heap used_mb'] = run['heap']['used_mb']
+    for key, value in run['cdp'].items():
+        summary[f'cdp {key}'] = value
+    finished = [e for e in run['network'] if 'duration_ms' in e]
+    summary['network requests'] = len(finished)
+    summary['network transfer_kb'] = sum(e['transfer_bytes'] for e in finished) / 1024
+    return summary
+
+
+def median_summary(summaries):
+    keys = sorted(set().union(*summaries))
+    return {key: round(statistics.median(s[key] for s in summaries if key in s), 2) for key in keys}
+
+
+async def profile_flows(tests, runs=3, base_url=None, headless=True, timeout_ms=DEFAULT_TIMEOUT_MS, trace_dir=None):
+    """
+    Profile each flow `runs` times (sequentially, so runs don't compete for CPU).
+
+    Returns:
+        dict report: per flow the median summary, all raw runs and any errors
+    """
+    flows = {}
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            for name, func in tests:
+                raw = []
+                for i in range(runs):
+                    trace_path = None
+                    if trace_dir and i == runs - 1:
+                        trace_path = Path(trace_dir) / f"{name.replace('::', '-')}.zip"
+                        trace_path.parent.mkdir(parents=True, exist_ok=True)
+                    raw.append(await profile_once(browser, name, func, base_url, timeout_ms, trace_path))
+                errors = [r['error'] for r in raw if r['error']]
+                flows[name] = {
+                    'summary': median_summary([summarize_run(r) for r in raw if not r['error']] or [{}]),
+                    'errors': errors,
+                    'trace': str(trace_path) if trace_dir else None,
+                    'runs': raw
+                }
+        finally:
+            await browser.close()
+    return {'runs': runs, 'base_url': base_url, 'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'flows': flows}
+
+
+def absolute_floor(metric):
+    for suffix, floor in ABSOLUTE_FLOORS.items():
+        if metric.endswith(suffix):
+            return floor
+    return 0.0
+
+
+def compare_to_baseline(report, baseline, tolerance=0.2):
+    """
+    Compare median summaries with a baseline report.
+
+    Returns:
+        list of {'flow', 'metric', 'baseline', 'current', 'change', 'regressed'} for metrics in both
+    """
+    rows = []
+    for name, flow in report['flows'].items():
+        base_flow = baseline.get('flows', {}).get(name)
+        if not base_flow:
+            continue
+        for metric, current in flow['summary'].items():
+            base = base_flow['summary'].get(metric)
+            if base is None:
+                continue
+            change = (current - base) / base if base else (float('inf') if current > 0 else 0.0)
+            regressed = change > tolerance and current - base > absolute_floor(metric)
+            rows.append({'flow': name, 'metric': metric, 'baseline': base, 'current': current,
+                         'change': round(change, 3) if change != float('inf') else None, 'regressed': regressed})
+    return rows
+
+
+def print_report(report, comparison=None):
+    compared = {(row['flow'], row['metric']): row for row in comparison or []}
+    for name, flow in report['flows'].items():
+        print(f"\n⏱  {name} (median of {report['runs']} runs)")
+        for error in flow['errors']:
+            print(f"   ✗ {error}")
+        for metric, value in flow['summary'].items():
+            row = compared.get((name, metric))
+            note = ''
+            if row and row['change'] is not None:
+                note = f"  ({row['change']:+.0%} vs {row['baseline']})" + ('  ⚠️ REGRESSION' if row['regressed'] else '')
+            print(f"   {metric:<45} {value:>10}{note}")
+        if flow['trace']:
+            print(f"   trace: {flow['trace']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile page-load and interaction performance of Playwright flows')
+    parser.add_argument('files', nargs='+', help='Flow files containing async test_* functions (browser_pool.py format)')
+    parser.add_argument('--base-url', help='Base URL for relative goto() paths')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per flow; medians are reported (default: 3)')
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT_MS, help='Default wait timeout in ms')
+    parser.add_argument('-k', dest='pattern', help='Only profile flows whose name matches this regex')
+    parser.add_argument('--trace', dest='trace_dir', help='Save a Playwright trace of the last run of each flow here')
+    parser.add_argument('--json', dest='json_path', help='Write the full report to this file')
+    parser.add_argument('--baseline', help='Baseline report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative slowdown (default: 0.2 = 20%%)')
+    parser.add_argument('--save-baseline', help='Save this report (summaries only) as a new baseline')
+    args = parser.parse_args()
+
+    tests = load_tests(args.files, args.pattern)
+    if not tests:
+        print("Error: No async test_* functions found")
+        sys.exit(1)
+
+    report = asyncio.run(profile_flows(tests, args.runs, args.base_url, not args.headed, args.timeout, args.trace_dir))
+
+    comparison = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        comparison = compare_to_baseline(report, baseline, args.tolerance)
+        report['comparison'] = {'baseline': args.baseline, 'tolerance': args.tolerance, 'metrics': comparison}
+
+    print_report(report, comparison)
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\nReport saved to {args.json_path}")
+    if args.save_baseline:
+        slim = {key: value for key, value in report.items() if key not in ('flows', 'comparison')}
+        slim['flows'] = {name: {'summary': flow['summary']} for name, flow in report['flows'].items()}
+        Path(args.save_baseline).write_text(json.dumps(slim, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"Baseline saved to {args.save_baseline}")
+
+    failed = any(flow['errors'] for flow in report['flows'].values())
+    regressions = [row for row in comparison or [] if row['regressed']]
+    if regressions:
+        print(f"\n❌ {len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}")
+    sys.exit(1 if failed or regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
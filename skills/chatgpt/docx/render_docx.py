@@ -1,17 +1,21 @@
 import argparse
+import hashlib
+import json
 import os
 import re
 import subprocess
 import tempfile
 import xml.etree.ElementTree as ET
-from os import makedirs, replace
+from os import makedirs, remove, replace
 from os.path import abspath, basename, exists, expanduser, join, splitext
-from typing import Sequence, cast
+from typing import Any, Optional, Sequence, cast
 from zipfile import ZipFile
 
 from pdf2image import convert_from_path, pdfinfo_from_path
 
 TWIPS_PER_INCH: int = 1440
+STATE_DIR_NAME: str = ".render_state"
+MANIFEST_NAME: str = "manifest.json"
 
 
 def calc_dpi_via_ooxml_docx(input_path: str, max_w_px: int, max_h_px: int) -> int:
@@ -155,6 +159,42 @@ def convert_to_pdf(
     return ""
 
 
+def rasterize_pdf_pages(
+    pdf_path: str,
+    out_dir: str,
+    dpi: int,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+) -> list[tuple[int, str]]:
+    """Rasterise a PDF page range into out_dir as page-<N>.png and return (page, path) pairs."""
+    paths_raw = cast(
+        list[str],
+        convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            fmt="png",
+            thread_count=8,
+            output_folder=out_dir,
+            paths_only=True,
+            output_file="page",
+            first_page=first_page,
+            last_page=last_page,
+        ),
+    )
+
+    # Rename convert_from_path's output format f'page{thread_id:04d}-{page_num:02d}.<ext>' to 'page-<num>.<ext>'
+    pages: list[tuple[int, str]] = []
+    for src_path in paths_raw:
+        base = splitext(basename(src_path))[0]
+        page_num_str = base.split("-")[-1]
+        page_num = int(page_num_str)
+        dst_path = join(out_dir, f"page-{page_num}.png")
+        replace(src_path, dst_path)
+        pages.append((page_num, dst_path))
+    pages.sort(key=lambda t: t[0])
+    return pages
+
+
 def rasterize(
     doc_path: str,
     out_dir: str,
@@ -183,33 +223,157 @@ def rasterize(
                 raise RuntimeError(
                     "Failed to produce PDF for rasterization (direct and ODT fallback)."
                 )
-            paths_raw = cast(
-                list[str],
-                convert_from_path(
-                    pdf_path,
-                    dpi=dpi,
-                    fmt="png",
-                    thread_count=8,
-                    output_folder=out_dir,
-                    paths_only=True,
-                    output_file="page",
-                ),
-            )
+            pages = rasterize_pdf_pages(pdf_path, out_dir, dpi)
 
-    # Rename convert_from_path's output format f'page{thread_id:04d}-{page_num:02d}.<ext>' to 'page-<num>.<ext>'
-    pages: list[tuple[int, str]] = []
-    for src_path in paths_raw:
-        base = splitext(basename(src_path))[0]
-        page_num_str = base.split("-")[-1]
-        page_num = int(page_num_str)
-        dst_path = join(out_dir, f"page-{page_num}.png")
-        replace(src_path, dst_path)
-        pages.append((page_num, dst_path))
-    pages.sort(key=lambda t: t[0])
     final_paths = [path for _, path in pages]
     return final_paths
 
 
+def _pdf_object_digest(obj: Any, cache: dict[int, str]) -> str:
+    """Hash a pypdf object graph, including stream bytes, memoising indirect objects.
+
+    Shared resources (fonts, images) are referenced by many pages; the cache keyed by
+    object number means each one is hashed once per document. Back-references to the
+    parent page tree are skipped so a page's digest only depends on what it draws.
+    """
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+    if isinstance(obj, IndirectObject):
+        key = obj.idnum
+        if key not in cache:
+            cache[key] = ""  # Guard against reference cycles (e.g. annotation /P)
+            cache[key] = _pdf_object_digest(obj.get_object(), cache)
+        return cache[key]
+
+    h = hashlib.sha256()
+    if isinstance(obj, DictionaryObject):
+        for k in sorted(obj.keys()):
+            if k in ("/Parent", "/P"):
+                continue
+            h.update(str(k).encode("utf-8"))
+            h.update(_pdf_object_digest(obj.raw_get(k), cache).encode())
+        if isinstance(obj, StreamObject):
+            h.update(obj.get_data())
+    elif isinstance(obj, ArrayObject):
+        for item in obj:
+            h.update(_pdf_object_digest(item, cache).encode())
+    else:
+        h.update(repr(obj).encode("utf-8"))
+    return h.hexdigest()
+
+
+def pdf_page_fingerprints(pdf_path: str) -> list[str]:
+    """Return one digest per page covering its content stream and referenced resources."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(pdf_path)
+    cache: dict[int, str] = {}
+    return [_pdf_object_digest(page, cache) for page in reader.pages]
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _contiguous_runs(page_nums: Sequence[int]) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    for n in sorted(page_nums):
+        if runs and runs[-1][1] == n - 1:
+            runs[-1] = (runs[-1][0], n)
+        else:
+            runs.append((n, n))
+    return runs
+
+
+def rasterize_incremental(
+    doc_path: str,
+    out_dir: str,
+    dpi: int,
+) -> dict[str, Any]:
+    """Rasterise only the pages whose PDF content changed since the previous run.
+
+    A manifest of per-page content/image hashes is kept in out_dir/.render_state.
+    Pages whose fingerprint is unchanged (and whose PNG is still present) are left on
+    disk untouched. Returns a report with the page count, the pages
+    that were re-rasterised and the pages whose rendered image actually differs.
+    """
+    makedirs(out_dir, exist_ok=True)
+    doc_path = abspath(doc_path)
+    stem = splitext(basename(doc_path))[0]
+    state_dir = join(out_dir, STATE_DIR_NAME)
+    manifest_path = join(state_dir, MANIFEST_NAME)
+
+    previous: dict[str, Any] = {}
+    if exists(manifest_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
+    if previous.get("dpi") != dpi:
+        # A different resolution invalidates every cached image.
+        previous = {}
+    previous_pages: dict[str, dict[str, str]] = previous.get("pages", {})
+
+    with tempfile.TemporaryDirectory(prefix="soffice_profile_") as user_profile:
+        with tempfile.TemporaryDirectory(prefix="soffice_convert_") as convert_tmp_dir:
+            pdf_path = convert_to_pdf(
+                doc_path,
+                user_profile,
+                convert_tmp_dir,
+                stem,
+            )
+
+            if not pdf_path or not exists(pdf_path):
+                raise RuntimeError(
+                    "Failed to produce PDF for rasterization (direct and ODT fallback)."
+                )
+
+            fingerprints = pdf_page_fingerprints(pdf_path)
+            stale = [
+                n
+                for n, digest in enumerate(fingerprints, start=1)
+                if previous_pages.get(str(n), {}).get("content") != digest
+                or not exists(join(out_dir, f"page-{n}.png"))
+            ]
+            for first, last in _contiguous_runs(stale):
+                rasterize_pdf_pages(pdf_path, out_dir, dpi, first_page=first, last_page=last)
+
+    pages: dict[str, dict[str, str]] = {}
+    differing: list[int] = []
+    for n, digest in enumerate(fingerprints, start=1):
+        key = str(n)
+        if n in stale:
+            image_hash = file_sha256(join(out_dir, f"page-{n}.png"))
+            if previous_pages.get(key, {}).get("image") != image_hash:
+                differing.append(n)
+        else:
+            image_hash = previous_pages[key]["image"]
+        pages[key] = {"content": digest, "image": image_hash}
+
+    # Drop images for pages that no longer exist (document got shorter)
+    removed = sorted(int(k) for k in previous_pages if int(k) > len(fingerprints))
+    for n in removed:
+        old_png = join(out_dir, f"page-{n}.png")
+        if exists(old_png):
+            remove(old_png)
+
+    makedirs(state_dir, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"dpi": dpi, "pages": pages}, f, indent=2)
+
+    return {
+        "page_count": len(fingerprints),
+        "rerendered_pages": stale,
+        "changed_pages": differing,
+        "removed_pages": removed,
+    }
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Render DOCX-like file to PNG images.")
     parser.add_argument(
@@ -250,6 +414,14 @@ def main() -> None:
         default=None,
         help=("Override computed DPI. If provided, skips DOCX/PDF-based DPI calculation."),
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Only re-rasterize pages whose PDF content changed since the previous run into "
+            "the same output directory, and report which pages differ. Requires pypdf."
+        ),
+    )
     args = parser.parse_args()
 
     input_path = abspath(expanduser(args.input_path))
@@ -266,6 +438,18 @@ def main() -> None:
         except Exception:
             dpi = calc_dpi_via_pdf(input_path, args.width, args.height)
 
+    if args.incremental:
+        report = rasterize_incremental(input_path, out_dir, dpi)
+        print(
+            f"Re-rendered {len(report['rerendered_pages'])} of {report['page_count']} pages "
+            f"to {out_dir}"
+        )
+        changed = report["changed_pages"]
+        print("Changed pages: " + (", ".join(str(n) for n in changed) if changed else "none"))
+        if report["removed_pages"]:
+            print("Removed pages: " + ", ".join(str(n) for n in report["removed_pages"]))
+        return
+
     rasterize(input_path, out_dir, dpi)
     print("Pages rendered to " + out_dir)
 
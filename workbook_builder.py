@@ -0,0 +1,252 @@
+"""流式工作簿生成工具
+
+create_project_tracker.py 逐个单元格创建完整的 Cell 对象，并为每个单元格新建
+Font/PatternFill/Border，数据量到十万行时生成很慢、占用内存也大。本模块提供一层
+可复用的生成接口:
+
+- 基于 openpyxl 只写模式（write_only），行数据写入后即落盘，内存占用与行数无关
+- 样式注册为命名样式（NamedStyle），每种样式只创建一次，单元格按名称引用
+- 以整行为单位从可迭代对象追加数据，按列指定样式
+- 条件格式按区域整体添加，而不是逐个单元格设置颜色
+
+用法:
+    book = StreamingWorkbook()
+    book.add_style('header', font=Font(bold=True), fill=solid_fill('4472C4'))
+    ws = book.add_sheet('任务列表', widths={'A': 8, 'B': 25}, freeze_panes='A2')
+    book.append_row(ws, ['ID', '任务名称'], style='header')
+    book.append_rows(ws, rows, column_styles=['cell', 'cell_left'])
+    book.highlight_values(ws, 'H2:H100001', {'已完成': ('C6EFCE', '006100')})
+    book.save('tracker.xlsx')
+
+普通（非只写）工作簿可以单独使用 StyleRegistry：样式用声明式的字典描述，相同描述
+只创建一次 NamedStyle，再按名称应用到整块区域:
+    styles = StyleRegistry(wb)
+    styles.register('header', {'font': {'bold': True, 'color': 'FFFFFF'}, 'fill': '4472C4', 'border': 'thin'})
+    styles.apply(ws, 'A2:I2', 'header')
+    print(style_report(wb))
+
+注意: 只写模式下列宽、合并单元格和行高需要在写入对应行之前设置。安装 lxml 后
+openpyxl 会用它序列化XML，大表的写出时间主要花在这一步。
+"""
+
+import json
+from copy import copy
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import range_boundaries
+
+BORDER_SIDES = ('left', 'right', 'top', 'bottom')
+
+
+def solid_fill(color):
+    """创建纯色填充"""
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+def build_named_style(name, spec):
+    """
+    把声明式样式描述转换为 NamedStyle
+
+    spec 的键（均可省略）:
+        font: Font 参数字典，如 {'name': '微软雅黑', 'size': 10, 'bold': True}
+        fill: 颜色字符串（纯色填充）或 PatternFill 参数字典
+        alignment: Alignment 参数字典
+        border: 线型字符串（四边相同、黑色），或 {'style': 'thin', 'color': '000000'}
+        number_format: 数字格式字符串
+    """
+    style = NamedStyle(name=name)
+    if 'font' in spec:
+        style.font = Font(**spec['font'])
+    if 'fill' in spec:
+        fill = spec['fill']
+        style.fill = solid_fill(fill) if isinstance(fill, str) else PatternFill(**fill)
+    if 'alignment' in spec:
+        style.alignment = Alignment(**spec['alignment'])
+    if 'border' in spec:
+        border = spec['border']
+        if isinstance(border, str):
+            border = {'style': border}
+        side = Side(border_style=border['style'], color=border.get('color', '000000'))
+        style.border = Border(**{name: side for name in BORDER_SIDES})
+    if 'number_format' in spec:
+        style.number_format = spec['number_format']
+    return style
+
+
+def style_report(wb):
+    """统计工作簿样式表中不重复的样式数量"""
+    return {
+        'named_styles': len(wb._named_styles),
+        'cell_styles': len(wb._cell_styles),
+        'fonts': len(wb._fonts),
+        'fills': len(wb._fills),
+        'borders': len(wb._borders),
+        'alignments': len(wb._alignments),
+        'number_formats': len(wb._number_formats),
+    }
+
+
+class StyleRegistry:
+    """
+    样式注册表：每种样式只创建一次 NamedStyle，单元格按名称共用
+
+    描述完全相同的样式即使注册成不同名称，也只在工作簿中创建一份。
+    """
+
+    def __init__(self, wb):
+        self.wb = wb
+        # 样式名 -> 已绑定到工作簿的样式数组
+        self._arrays = {}
+        # 样式描述（规范化JSON）-> 样式名
+        self._by_spec = {}
+
+    def __contains__(self, name):
+        return name in self._arrays
+
+    def add(self, style):
+        """注册已构造好的 NamedStyle；同名样式只注册一次"""
+        if style.name not in self._arrays:
+            self.wb.add_named_style(style)
+            self._arrays[style.name] = style.as_tuple()
+        return style.name
+
+    def register(self, name, spec):
+        """按声明式描述注册样式，描述相同的样式复用已有的 NamedStyle"""
+        if name in self._arrays:
+            return name
+        key = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+        existing = self._by_spec.get(key)
+        if existing is not None:
+            self._arrays[name] = self._arrays[existing]
+            return existing
+        self._by_spec[key] = name
+        return self.add(build_named_style(name, spec))
+
+    def register_all(self, specs):
+        """批量注册 {样式名: 描述}"""
+        for name, spec in specs.items():
+            self.register(name, spec)
+
+    def array(self, name):
+        """样式的共享样式数组（只写单元格可直接引用）"""
+        return self._arrays[name]
+
+    def apply_cell(self, cell, name):
+        """给单个单元格应用已注册的样式"""
+        # 普通单元格之后还可能单独修改字体等属性，需要各自持有一份样式数组
+        cell._style = copy(self._arrays[name])
+
+    def apply(self, ws, cell_range, name):
+        """给整块区域应用已注册的样式"""
+        array = self._arrays[name]
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        for row in ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
+            for cell in row:
+                cell._style = copy(array)
+
+
+class StreamingWorkbook:
+    """只写模式的工作簿，样式按名称注册一次后复用"""
+
+    def __init__(self):
+        self.wb = Workbook(write_only=True)
+        self.styles = StyleRegistry(self.wb)
+        self.rows_written = 0
+
+    def add_style(self, name, font=None, fill=None, alignment=None, border=None, number_format=None):
+        """注册命名样式；同名样式只注册一次（也可用 self.styles.register 按声明式描述注册）"""
+        if name in self.styles:
+            return name
+        style = NamedStyle(name=name)
+        if font is not None:
+            style.font = font
+        if fill is not None:
+            style.fill = fill
+        if alignment is not None:
+            style.alignment = alignment
+        if border is not None:
+            style.border = border
+        if number_format is not None:
+            style.number_format = number_format
+        return self.styles.add(style)
+
+    def add_sheet(self, title, widths=None, freeze_panes=None, merges=(), heights=None):
+        """创建工作表，并设置列宽、冻结窗格、合并区域和行高（必须在写入数据之前）"""
+        ws = self.wb.create_sheet(title)
+        for column, width in (widths or {}).items():
+            ws.column_dimensions[column].width = width
+        if freeze_panes:
+            ws.freeze_panes = freeze_panes
+        for cell_range in merges:
+            ws.merged_cells.add(cell_range)
+        for row, height in (heights or {}).items():
+            ws.row_dimensions[row].height = height
+        return ws
+
+    def cell(self, ws, value, style=None):
+        """创建单个只写单元格，样式按名称引用"""
+        cell = WriteOnlyCell(ws, value)
+        if style is not None:
+            # 只写单元格写出后即丢弃，共用同一个样式数组是安全的
+            cell._style = self.styles.array(style)
+        return cell
+
+    def append_row(self, ws, values, style=None):
+        """追加一行，所有单元格使用同一样式"""
+        if style is None:
+            ws.append(list(values))
+        else:
+            ws.append([self.cell(ws, value, style) for value in values])
+        self.rows_written += 1
+
+    def append_rows(self, ws, rows, column_styles=None):
+        """
+        从可迭代对象逐行追加数据
+
+        column_styles 为每列的样式名列表（None 表示不设样式）；数据按行流式写出，
+        不会在内存中保留整张表。
+        """
+        if not column_styles:
+            for row in rows:
+                ws.append(list(row))
+                self.rows_written += 1
+            return
+
+        arrays = [self.styles.array(name) if name else None for name in column_styles]
+        count = len(arrays)
+        for row in rows:
+            cells = []
+            for idx, value in enumerate(row):
+                # 超出样式列表的列不设样式
+                array = arrays[idx] if idx < count else None
+                if array is None:
+                    cells.append(value)
+                else:
+                    cell = WriteOnlyCell(ws, value)
+                    cell._style = array
+                    cells.append(cell)
+            ws.append(cells)
+            self.rows_written += 1
+
+    def add_conditional_format(self, ws, cell_range, rule):
+        """为整个区域添加一条条件格式规则"""
+        ws.conditional_formatting.add(cell_range, rule)
+
+    def highlight_values(self, ws, cell_range, colors, bold=True):
+        """
+        按单元格的值给整个区域着色
+
+        colors: {值: (填充色, 字体色)}，每个值生成一条“等于”规则；填充色为 None 时只改字体
+        """
+        for value, (fill_color, font_color) in colors.items():
+            rule = CellIsRule(operator='equal', formula=[f'"{value}"'],
+                              fill=solid_fill(fill_color) if fill_color else None,
+                              font=Font(bold=bold, color=font_color))
+            self.add_conditional_format(ws, cell_range, rule)
+
+    def save(self, filename):
+        """保存工作簿（只写模式下只能保存一次）"""
+        self.wb.save(filename)